@@ -13,16 +13,67 @@ and generates static HTML pages at build time.
 - Static HTML only (no JS)
 - Network-free
 - Deterministic rendering
+
+The Phase-E index is rendered from the pristine template
+lab/templates/phase-e-index.html (see lab/page_template.py), parsed once
+per run and shared by all languages; phase-e/index.html is output only.
+
+Claim pages:
+  <claim>-<date>.html   one page per dated publication
+  <claim>.html          claim landing page: the latest publication plus
+                        links to every dated page
+Each page is rendered once per language and written to every directory of
+that language (phase-e/ and en/phase-e/ for English).
+
+Incremental rendering:
+  A render ledger (.build/phase-e-render-ledger.json) records, per output
+  page, the generator version, template sha256 (index template and
+  generator source), language, the sha256 of the manifest.json and
+  provenance.json of every publication the page shows, and the sha256 of
+  the page written. A page whose inputs are unchanged and whose file still
+  has the recorded hash (checked via .build/digests.json, so usually a
+  stat only) is neither re-rendered nor re-written. Pages the ledger
+  records that no longer have a source publication (removed, or renamed)
+  are deleted, and dropped from the ledger; --full re-renders every page
+  but still prunes them.
+
+Publication data:
+  manifest.json and provenance.json are read during discovery; the data
+  files a claim page shows (statistics, visual evidence, tables,
+  sha256sum.txt) are read on first use and memoized per publication, so
+  they are parsed once however many languages and pages show them.
+
+Parallel rendering:
+  With --jobs N, stale pages are rendered in N worker processes. Each worker
+  receives the discovered publications, with the data of those that stale
+  pages show, once (pool initializer); tasks name publications by index.
+  Pages are written by the main process in the same order as a serial run,
+  so output and ledger are identical for any N.
+
+Usage:
+  python3 lab/generate_phase_e_pages.py            # incremental, serial
+  python3 lab/generate_phase_e_pages.py --full     # ignore the render ledger
+  python3 lab/generate_phase_e_pages.py --jobs 4   # render in 4 processes
 """
 
 import os
 import sys
 import json
 import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# Shared atomic, write-if-changed writer (scripts/artifact_writer.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from artifact_writer import ArtifactWriter
+from digest_cache import DigestCache, file_sha256, sha256_chunks
+from page_template import PageTemplate
+
+RENDER_LEDGER_VERSION = 1
+
 
 class PhaseEPageGenerator:
     """
@@ -33,11 +84,30 @@ class PhaseEPageGenerator:
     
     VERSION = "v001"
     
-    def __init__(self, repo_root: Path):
-        """Initialize the page generator."""
+    def __init__(self, repo_root: Path, full: bool = False, jobs: int = 1):
+        """
+        Initialize the page generator.
+        
+        Args:
+            repo_root: Repository root
+            full: Ignore the render ledger and render every page
+            jobs: Rendering worker processes (1 = render in this process)
+        """
         self.repo_root = repo_root
         self.publication_base = repo_root / "lab" / "publication"
         self.phase_e_dir = repo_root / "phase-e"
+        self.template_dir = repo_root / "lab" / "templates"
+        self.render_ledger_path = repo_root / ".build" / "phase-e-render-ledger.json"
+        self.full = full
+        self.jobs = jobs
+        self._index_template = None
+    
+    @property
+    def index_template(self) -> PageTemplate:
+        """The Phase-E index template, parsed on first use."""
+        if self._index_template is None:
+            self._index_template = PageTemplate.load(self.template_dir / "phase-e-index.html")
+        return self._index_template
         
     def discover_publications(self) -> List[Dict[str, Any]]:
         """
@@ -85,12 +155,14 @@ class PhaseEPageGenerator:
                     print(f"WARNING: Missing provenance.json: {date_dir}")
                     continue
                 
-                # Read metadata
+                # Read metadata (digested in the same read, for the render ledger)
                 try:
-                    with open(manifest_path, 'r') as f:
-                        manifest = json.load(f)
-                    with open(provenance_path, 'r') as f:
-                        provenance = json.load(f)
+                    with open(manifest_path, 'rb') as f:
+                        manifest_bytes = f.read()
+                    with open(provenance_path, 'rb') as f:
+                        provenance_bytes = f.read()
+                    manifest = json.loads(manifest_bytes)
+                    provenance = json.loads(provenance_bytes)
                     
                     # Extract key information
                     pub = {
@@ -99,7 +171,9 @@ class PhaseEPageGenerator:
                         "version": manifest.get("publication", {}).get("version", "unknown"),
                         "path": date_dir.relative_to(self.repo_root),
                         "manifest": manifest,
-                        "provenance": provenance
+                        "provenance": provenance,
+                        "manifest_sha256": sha256_chunks([manifest_bytes]),
+                        "provenance_sha256": sha256_chunks([provenance_bytes])
                     }
                     
                     publications.append(pub)
@@ -111,6 +185,129 @@ class PhaseEPageGenerator:
         
         return publications
     
+    def publication_data(self, pub: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Data files shown on a publication's claim page, read on first use.
+        
+        The result is memoized on pub["data"], so every language, the claim
+        landing page and (with --jobs) every worker share one parsed copy.
+        Missing files yield empty defaults.
+        
+        Returns:
+            Dict with statistics, visual_evidence, platforms_registry,
+            sbdb_attempts and sha256sum (text, or None if absent)
+        """
+        if "data" not in pub:
+            pub_dir = self.repo_root / pub["path"]
+            
+            def read_json(rel_path, default):
+                file_path = pub_dir / rel_path
+                if not file_path.exists():
+                    return default
+                with open(file_path, 'r') as f:
+                    return json.load(f)
+            
+            sha256sum_path = pub_dir / "sha256sum.txt"
+            if sha256sum_path.exists():
+                with open(sha256sum_path, 'r') as f:
+                    sha256sum = f.read().strip()
+            else:
+                sha256sum = None
+            
+            pub["data"] = {
+                "statistics": read_json("derived/statistics.json", {}),
+                "visual_evidence": read_json("derived/visual_evidence.json",
+                                             {"plots": [], "reference_images": []}),
+                "platforms_registry": read_json("tables/platforms_registry.json", []),
+                "sbdb_attempts": read_json("tables/sbdb_attempts.json", []),
+                "sha256sum": sha256sum,
+            }
+        return pub["data"]
+    
+    def page_specs(self, publications: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        List every page to generate per language.
+        
+        Returns:
+            (filename, kind, publications shown) tuples: the index, one
+            "dated" page per publication and one "landing" page per claim
+            (whose publications are its history, newest first)
+        """
+        specs = [("index.html", "index", publications)]
+        claims = {}
+        for pub in publications:
+            specs.append((self.claim_page_filename(pub["claim_id"], pub["date"]), "dated", [pub]))
+            claims.setdefault(pub["claim_id"], []).append(pub)
+        for claim_id, claim_pubs in claims.items():
+            history = sorted(claim_pubs, key=lambda p: p["date"], reverse=True)
+            specs.append((self.claim_page_filename(claim_id), "landing", history))
+        return specs
+    
+    def render_page(self, kind: str, pubs: List[Dict[str, Any]], lang: str) -> str:
+        """Render one page_specs() entry in one language."""
+        if kind == "index":
+            return self.generate_index_html(pubs, lang)
+        if kind == "landing":
+            return self.generate_claim_page_html(pubs[0], lang, history=pubs)
+        return self.generate_claim_page_html(pubs[0], lang)
+    
+    # ── Render Ledger ──────────────────────────────────────────
+    
+    def template_sha256(self, kind: str) -> str:
+        """
+        Digest of everything a page kind is rendered from besides its data.
+        
+        Claim pages are built by this module's code; the index also uses
+        the index template.
+        """
+        code_sha256 = file_sha256(Path(__file__))
+        if kind == "index":
+            return sha256_chunks([code_sha256.encode(), self.index_template.sha256.encode()])
+        return code_sha256
+    
+    def render_inputs(self, kind: str, pubs: List[Dict[str, Any]], lang: str,
+                      template_sha256: str) -> Dict[str, Any]:
+        """Ledger entry (without output hash) describing what a page is rendered from."""
+        publications = "\n".join(
+            f"{pub['path'].as_posix()} {pub['manifest_sha256']} {pub['provenance_sha256']}"
+            for pub in pubs
+        )
+        return {
+            "generator_version": self.VERSION,
+            "template_sha256": template_sha256,
+            "lang": lang,
+            "kind": kind,
+            "publications_sha256": sha256_chunks([publications.encode("utf-8")]),
+        }
+    
+    def load_render_ledger(self) -> Dict[str, Any]:
+        """
+        Load the render ledger's page entries; empty when the ledger is
+        missing, unreadable or of another ledger version.
+        """
+        if not self.render_ledger_path.exists():
+            return {}
+        try:
+            with open(self.render_ledger_path, 'r', encoding="utf-8") as f:
+                ledger = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if ledger.get("ledger_version") != RENDER_LEDGER_VERSION or not isinstance(ledger.get("pages"), dict):
+            return {}
+        return ledger["pages"]
+    
+    def save_render_ledger(self, pages: Dict[str, Any]) -> None:
+        """Persist the render ledger (write-if-changed)."""
+        # Separate writer: the ledger is build state, not a generated page
+        ArtifactWriter().write_json(self.render_ledger_path,
+                                    {"ledger_version": RENDER_LEDGER_VERSION, "pages": pages},
+                                    trailing_newline=True, indent=1, sort_keys=True)
+    
+    @staticmethod
+    def claim_page_filename(claim_id: str, date: Optional[str] = None) -> str:
+        """<claim>-<date>.html for a dated publication, <claim>.html for the landing page."""
+        return f"{claim_id}-{date}.html" if date else f"{claim_id}.html"
+    
     def generate_index_html(self, publications: List[Dict[str, Any]], lang: str = "en") -> str:
         """
         Generate the Phase-E index.html with dynamic table rows.
@@ -122,20 +319,10 @@ class PhaseEPageGenerator:
         Returns:
             Generated HTML content
         """
-        # Read the template (current index.html)
-        template_path = self.phase_e_dir / "index.html"
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-        
-        with open(template_path, 'r') as f:
-            template = f.read()
-        
-        # Update lang attribute for non-English languages
-        if lang != "en":
-            template = template.replace('<html lang="en">', f'<html lang="{lang}">')
-            # Add dir="rtl" for Arabic
-            if lang == "ar":
-                template = template.replace(f'<html lang="{lang}">', f'<html lang="{lang}" dir="rtl">')
+        # Language attributes for the <html> element
+        html_attrs = f'lang="{lang}"'
+        if lang == "ar":
+            html_attrs += ' dir="rtl"'
         
         # Generate table rows for compiler outputs
         if publications:
@@ -156,7 +343,7 @@ class PhaseEPageGenerator:
                 <span class="status-badge status-network-free">Network-Free</span>
               </td>
               <td>
-                <a href="{claim_id}.html">View Data</a> | 
+                <a href="{self.claim_page_filename(claim_id, date)}">View Data</a> | 
                 <a href="../{path}/">Raw Files</a> | 
                 <a href="../{path}/provenance.json">Provenance</a>
               </td>
@@ -173,30 +360,10 @@ class PhaseEPageGenerator:
               </td>
             </tr>"""
         
-        # Replace the hardcoded claim-001 row with dynamic rows
-        # Find the tbody section in the compiler outputs table
-        start_marker = '<tbody>'
-        end_marker = '</tbody>'
-        
-        # Find the first tbody (for compiler outputs section)
-        start_idx = template.find(start_marker, template.find('Available Compiler Outputs'))
-        if start_idx == -1:
-            raise ValueError("Could not find compiler outputs tbody in template")
-        
-        end_idx = template.find(end_marker, start_idx)
-        if end_idx == -1:
-            raise ValueError("Could not find closing tbody tag")
-        
-        # Replace the tbody content
-        new_html = (
-            template[:start_idx + len(start_marker)] + 
-            "\n" + table_rows + "\n          " +
-            template[end_idx:]
-        )
-        
-        return new_html
+        return self.index_template.render(html_attrs=html_attrs, compiler_output_rows=table_rows)
     
-    def generate_claim_page_html(self, pub: Dict[str, Any], lang: str = "en") -> str:
+    def generate_claim_page_html(self, pub: Dict[str, Any], lang: str = "en",
+                                 history: Optional[List[Dict[str, Any]]] = None) -> str:
         """
         Generate HTML page for a specific claim/date publication.
         
@@ -208,6 +375,8 @@ class PhaseEPageGenerator:
         Args:
             pub: Publication dictionary
             lang: Language code (en, fr, de, ar, ru, zh)
+            history: All publications of the claim, newest first; given for
+                     the claim landing page (pub is then the latest one)
             
         Returns:
             Generated HTML content
@@ -219,37 +388,12 @@ class PhaseEPageGenerator:
         provenance = pub["provenance"]
         manifest = pub["manifest"]
         
-        # Read statistics if available
-        stats_path = self.repo_root / path / "derived" / "statistics.json"
-        if stats_path.exists():
-            with open(stats_path, 'r') as f:
-                statistics = json.load(f)
-        else:
-            statistics = {}
-        
-        # Read visual evidence metadata if available
-        visual_evidence_path = self.repo_root / path / "derived" / "visual_evidence.json"
-        if visual_evidence_path.exists():
-            with open(visual_evidence_path, 'r') as f:
-                visual_evidence = json.load(f)
-        else:
-            visual_evidence = {"plots": [], "reference_images": []}
-        
-        # Read table data if available
-        platforms_path = self.repo_root / path / "tables" / "platforms_registry.json"
-        sbdb_path = self.repo_root / path / "tables" / "sbdb_attempts.json"
-        
-        if platforms_path.exists():
-            with open(platforms_path, 'r') as f:
-                platforms_data = json.load(f)
-        else:
-            platforms_data = []
-        
-        if sbdb_path.exists():
-            with open(sbdb_path, 'r') as f:
-                sbdb_data = json.load(f)
-        else:
-            sbdb_data = []
+        # Statistics, visual evidence and tables (loaded once per publication)
+        data = self.publication_data(pub)
+        statistics = data["statistics"]
+        visual_evidence = data["visual_evidence"]
+        platforms_data = data["platforms_registry"]
+        sbdb_data = data["sbdb_attempts"]
         
         # Generate statistics HTML
         total_platforms = statistics.get("total_platforms", 0)
@@ -346,7 +490,10 @@ class PhaseEPageGenerator:
       </div>
     </section>"""
         
-        # Plots Metadata Section
+        # Get file checksums from manifest
+        files = manifest.get("files", {})
+        
+        # Plots Section: figures rendered by the compiler (figures/*.svg)
         plots_html = ""
         plots = visual_evidence.get("plots", [])
         if plots:
@@ -358,18 +505,27 @@ class PhaseEPageGenerator:
                 data_source = plot.get("data_source", "")
                 alt_text = plot.get("accessibility", {}).get("alt_text", "")
                 filename = plot.get("filename", "")
+                figure_info = files.get(f"figures/{filename}")
+                
+                # Publications compiled before SVG rendering have no figure
+                if figure_info:
+                    figure_html = f"""
+            <figure class="plot-figure">
+              <img src="../{path}/figures/{filename}" alt="{alt_text}" width="{plot.get('dimensions', {}).get('width', 800)}" height="{plot.get('dimensions', {}).get('height', 400)}">
+            </figure>"""
+                    figure_file_html = f"""<p><strong>Figure:</strong> <a href="../{path}/figures/{filename}"><code>figures/{filename}</code></a> ({figure_info.get('size_bytes', 0):,} bytes, SHA256: {figure_info.get('sha256', '')})</p>"""
+                else:
+                    figure_html = ""
+                    figure_file_html = """<p class="plot-note"><em>Note: No figure was rendered for this publication date.</em></p>"""
                 
-                # Note: Actual plot generation would happen in publication_engine.py
-                # For now, we show the metadata and indicate where the plot would be
                 plot_items_html.append(f"""
           <div class="plot-item">
             <h4>{title}</h4>
-            <p class="plot-description">{description}</p>
+            <p class="plot-description">{description}</p>{figure_html}
             <div class="plot-metadata">
               <p><strong>Data Source:</strong> <code>{data_source}</code></p>
               <p><strong>Plot ID:</strong> <code>{plot_id}</code></p>
-              <p><strong>Expected Filename:</strong> <code>{filename}</code></p>
-              <p class="plot-note"><em>Note: Plot generation requires data visualization libraries. Metadata prepared for future implementation.</em></p>
+              {figure_file_html}
             </div>
             <p class="accessibility-note"><strong>Accessibility:</strong> {alt_text}</p>
           </div>""")
@@ -377,24 +533,19 @@ class PhaseEPageGenerator:
             plots_html = f"""
     <!-- Data Visualizations -->
     <section class="publication-section visual-evidence" aria-labelledby="plots-heading">
-      <h3 id="plots-heading">Data Visualizations (Metadata)</h3>
-      <p class="section-description">Planned data visualizations with full accessibility metadata. All plots will be deterministic and network-free.</p>
+      <h3 id="plots-heading">Data Visualizations</h3>
+      <p class="section-description">Static SVG figures rendered deterministically by the publication compiler, with full accessibility metadata. No JavaScript, no network access.</p>
       
       <div class="plots-container">
         {"".join(plot_items_html)}
       </div>
     </section>"""
         
-        # Get file checksums from manifest
-        files = manifest.get("files", {})
-        
         # Generate checksums list
         checksums_lines = []
-        # Read sha256sum.txt if available
-        sha256sum_path = self.repo_root / path / "sha256sum.txt"
-        if sha256sum_path.exists():
-            with open(sha256sum_path, 'r') as f:
-                checksums_content = f.read().strip()
+        # Use sha256sum.txt if available
+        if data["sha256sum"] is not None:
+            checksums_content = data["sha256sum"]
         else:
             # Generate from manifest
             for filepath, file_info in sorted(files.items()):
@@ -441,6 +592,31 @@ class PhaseEPageGenerator:
         # Generate the HTML
         claim_display = claim_id.replace("claim", "Claim")  # claim-001 -> Claim-001
         
+        # Landing page: list every dated page; dated page: link the landing page
+        history_html = ""
+        if history is not None:
+            history_items = "\n".join(
+                f"""        <li><a href="{self.claim_page_filename(claim_id, h['date'])}">{h['date']}</a> ({h['version']}){' — shown on this page' if h['date'] == date else ''}</li>"""
+                for h in history
+            )
+            history_html = f"""
+    <!-- Publication History -->
+    <section class="publication-section" aria-labelledby="history-heading">
+      <h3 id="history-heading">Publication History</h3>
+      <p class="section-description">This page shows the latest publication ({date}). Every dated publication of {claim_display} has its own page. {len(history)} publication(s) total.</p>
+      <ul class="reference-list">
+{history_items}
+      </ul>
+    </section>
+"""
+            claim_pages_ref = ""
+        else:
+            claim_pages_ref = f"""
+        <li>
+          <strong>All {claim_display} Publications:</strong> 
+          <a href="{self.claim_page_filename(claim_id)}">{claim_display} Publication History</a>
+        </li>"""
+        
         # Determine HTML attributes for language and text direction
         lang_attr = f'lang="{lang}"'
         if lang == "ar":
@@ -513,7 +689,7 @@ class PhaseEPageGenerator:
         All data is presented exactly as generated by the verified publication compiler.
       </p>
     </section>
-{reference_images_html}
+{history_html}{reference_images_html}
 {plots_html}
 
     <!-- Derived Statistics -->
@@ -708,7 +884,7 @@ class PhaseEPageGenerator:
         <li>
           <strong>Phase-E Index:</strong> 
           <a href="index.html">Phase-E Publications Index</a>
-        </li>
+        </li>{claim_pages_ref}
         <li>
           <strong>Scientific Presentation Contract:</strong> 
           <a href="../docs/SCIENTIFIC_PRESENTATION_CONTRACT.md">View Contract</a>
@@ -768,7 +944,22 @@ class PhaseEPageGenerator:
         # Step 2: Generate pages for all languages
         print("Step 2: Generating Phase-E pages for all languages...")
         generated_files = []
+        digests = DigestCache(self.repo_root / ".build" / "digests.json", self.repo_root)
+        writer = ArtifactWriter(digests=digests)
+        # --full ignores the recorded inputs, but not the recorded pages
+        # (needed to prune those of removed publications)
+        recorded = self.load_render_ledger()
+        old_ledger = {} if self.full else recorded
+        ledger = {}
+        rendered = reused = 0
         
+        specs = self.page_specs(publications)
+        templates = {kind: self.template_sha256(kind) for kind in ("index", "dated", "landing")}
+        
+        # Pass 1: find stale pages. Each page is rendered once per language
+        # (shared by its directories), unless the render ledger shows every
+        # copy is already up to date
+        stale = []
         for lang in languages:
             # Determine phase-e directory for this language
             if lang == "en":
@@ -777,27 +968,66 @@ class PhaseEPageGenerator:
             else:
                 lang_dirs = [self.repo_root / lang / "phase-e"]
             
-            for lang_phase_e_dir in lang_dirs:
-                # Ensure directory exists
-                lang_phase_e_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Generate index.html for this language
-                index_html = self.generate_index_html(publications, lang)
-                index_path = lang_phase_e_dir / "index.html"
-                with open(index_path, 'w') as f:
-                    f.write(index_html)
-                generated_files.append(str(index_path.relative_to(self.repo_root)))
+            for filename, kind, pubs in specs:
+                inputs = self.render_inputs(kind, pubs, lang, templates[kind])
+                page_paths = [lang_phase_e_dir / filename for lang_phase_e_dir in lang_dirs]
+                keys = [page_path.relative_to(self.repo_root).as_posix() for page_path in page_paths]
+                generated_files.extend(keys)
                 
-                # Generate per-claim pages for this language
-                for pub in publications:
-                    claim_id = pub["claim_id"]
-                    page_html = self.generate_claim_page_html(pub, lang)
-                    page_path = lang_phase_e_dir / f"{claim_id}.html"
-                    with open(page_path, 'w') as f:
-                        f.write(page_html)
-                    generated_files.append(str(page_path.relative_to(self.repo_root)))
+                if all(old_ledger.get(key, {}).get("inputs") == inputs
+                       and digests.digest(page_path) == old_ledger[key].get("output_sha256")
+                       for key, page_path in zip(keys, page_paths)):
+                    reused += 1
+                    for key in keys:
+                        ledger[key] = old_ledger[key]
+                    continue
+                stale.append((kind, pubs, lang, page_paths, keys, inputs))
+        
+        # Pass 2: render stale pages (in workers with --jobs) and write them
+        # in pass-1 order
+        pool = None
+        if self.jobs > 1 and len(stale) > 1:
+            print(f"  Rendering {len(stale)} page(s) in {self.jobs} worker processes")
+            pub_index = {id(pub): i for i, pub in enumerate(publications)}
+            # Load the data of every publication a stale claim page shows
+            # here, so workers receive it parsed instead of each reading it
+            for kind, pubs, *_ in stale:
+                if kind != "index":
+                    self.publication_data(pubs[0])
+            pool = ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_render_worker,
+                                       initargs=(self.repo_root, publications))
+            tasks = [(kind, [pub_index[id(pub)] for pub in pubs], lang)
+                     for kind, pubs, lang, *_ in stale]
+            pages = pool.map(_render_page_in_worker, *zip(*tasks),
+                             chunksize=max(1, len(tasks) // (self.jobs * 4)))
+        else:
+            pages = (self.render_page(kind, pubs, lang) for kind, pubs, lang, *_ in stale)
+        
+        try:
+            for html, (kind, pubs, lang, page_paths, keys, inputs) in zip(pages, stale):
+                rendered += 1
+                output_sha256 = sha256_chunks([html.encode("utf-8")])
+                for key, page_path in zip(keys, page_paths):
+                    # Ensure directory exists
+                    page_path.parent.mkdir(parents=True, exist_ok=True)
+                    writer.write_text(page_path, html)
+                    ledger[key] = {"inputs": inputs, "output_sha256": output_sha256}
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        # Pages of removed publications: only the ledger's own pages are
+        # candidates, so hand-written files in phase-e/ are never touched
+        for key in sorted(set(recorded) - set(generated_files)):
+            if writer.delete(self.repo_root / key):
+                print(f"  Deleted page of removed publication: {key}")
+        
+        self.save_render_ledger(ledger)
+        digests.save()
         
         print(f"  ✓ Generated {len(generated_files)} files across {len(languages)} languages")
+        print(f"  ✓ Pages: {rendered} rendered, {reused} reused from render ledger")
+        print(f"  ✓ Files: {writer.report()}")
         print()
         
         # Summary
@@ -819,18 +1049,47 @@ class PhaseEPageGenerator:
             "publications_count": len(publications),
             "publications": publications,
             "languages": languages,
-            "files_generated": len(generated_files)
+            "files_generated": len(generated_files),
+            "pages_rendered": rendered,
+            "pages_reused": reused,
+            "files_written": len(writer.written),
+            "files_unchanged": len(writer.unchanged)
         }
 
 
+# Page generator for --jobs workers (built once per worker process)
+_worker_generator = None
+_worker_publications = None
+
+
+def _init_render_worker(repo_root: Path, publications: List[Dict[str, Any]]) -> None:
+    global _worker_generator, _worker_publications
+    _worker_generator = PhaseEPageGenerator(repo_root)
+    _worker_publications = publications
+
+
+def _render_page_in_worker(kind: str, pub_indices: List[int], lang: str) -> str:
+    pubs = [_worker_publications[i] for i in pub_indices]
+    return _worker_generator.render_page(kind, pubs, lang)
+
+
 def main():
     """Main entry point for the page generator."""
+    parser = argparse.ArgumentParser(description="TRIZEL Phase-E Static Page Generator")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the render ledger and render every page")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Render stale pages in N worker processes (default: 1, serial; "
+                             "0 = one per CPU)")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     try:
         # Determine repository root
         repo_root = Path(__file__).parent.parent.resolve()
         
         # Create and run generator
-        generator = PhaseEPageGenerator(repo_root)
+        generator = PhaseEPageGenerator(repo_root, full=args.full, jobs=jobs)
         result = generator.run()
         
         # Exit with success
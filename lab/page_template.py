@@ -0,0 +1,75 @@
+"""
+TRIZEL Page Template — Parse-Once Static Page Templates
+
+A template is a pristine HTML file under lab/templates/ with named slots
+written as {{ name }}. It is parsed once into alternating static segments
+and slot names; render() only concatenates segments and slot values, so a
+page costs O(output size) and every language renders from the same parsed
+template. Templates are never generator output: the generator reads
+lab/templates/ and writes phase-e/, so a run cannot feed its own output
+back in as the next run's template.
+
+Usage:
+  template = PageTemplate.load(Path("lab/templates/phase-e-index.html"))
+  html = template.render(html_attrs='lang="en"', compiler_output_rows=rows)
+"""
+
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from digest_cache import sha256_chunks
+
+_SLOT = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+
+class PageTemplate:
+    """
+    Static text split at {{ slot }} markers.
+
+    Attributes:
+        name: Template name (file name when loaded from disk)
+        segments: Static text; one more entry than slots
+        slots: Slot names in document order
+        sha256: Digest of the template source
+    """
+
+    def __init__(self, text: str, name: str = "<string>"):
+        self.name = name
+        self.segments = []
+        self.slots = []
+        pos = 0
+        for match in _SLOT.finditer(text):
+            self.segments.append(text[pos:match.start()])
+            self.slots.append(match.group(1))
+            pos = match.end()
+        self.segments.append(text[pos:])
+        self.sha256 = sha256_chunks([text.encode("utf-8")])
+
+    @classmethod
+    def load(cls, path: Path) -> "PageTemplate":
+        """
+        Parse a template file.
+
+        Raises:
+            FileNotFoundError: If the template does not exist
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read(), Path(path).name)
+
+    def render(self, **values: str) -> str:
+        """
+        Fill every slot and return the page.
+
+        Raises:
+            KeyError: If a slot has no value
+        """
+        missing = sorted(set(self.slots) - values.keys())
+        if missing:
+            raise KeyError(f"Template {self.name}: no value for slot(s) {missing}")
+        parts = [self.segments[0]]
+        for slot, segment in zip(self.slots, self.segments[1:]):
+            parts.append(values[slot])
+            parts.append(segment)
+        return "".join(parts)
@@ -9,17 +9,570 @@ It operates as a deterministic, network-free publication compiler that:
 - Enforces NO interpretation, NO claims, NO governance authority
 
 Gate-6 remains CLOSED. This engine performs deterministic transformation only.
+
+Batch mode:
+  Several --claim-id values (or --all, every lab/publication/claim-* tree)
+  are compiled in one process group: the verified inputs are read, hashed
+  and parsed once, then each claim is compiled in a worker process
+  (--jobs N) into lab/publication/<claim>/<date>/. All claims share one
+  execution timestamp. Each claim's log and result (or failure) is reported
+  separately; one failing claim does not stop the others.
+
+Table formats:
+  Every table is written as tables/<name>.json (pretty-printed row objects)
+  and tables/<name>.csv. --table-format adds, next to them:
+    columnar  tables/<name>.columns.json — compact JSON with one typed value
+              array per column ({"format", "row_count", "columns": [{"name",
+              "type", "nullable", "values"}]}), so a reader can load single
+              columns without materialising row objects
+    ndjson    tables/<name>.ndjson — one compact JSON row per line, for
+              streaming readers
+  Both are registered in manifest.json and sha256sum.txt like every output.
+
+Streaming input scan:
+  source-snapshot.json is parsed incrementally (scripts/json_stream.py) in
+  the same read that digests it. Each sbdb_attempts element is handed to a
+  SnapshotScan as soon as it is decoded, so memory stays bounded however
+  many attempts the snapshot holds. Table files are then streamed from
+  their spools into place.
+
+Single-pass derivation:
+  The scan is the only traversal of the inputs. It feeds every record to a
+  list of accumulators (default_accumulators()): table spools, attempt and
+  platform counters, the per-designation and per-error-type histograms in
+  derived/statistics.json, and the plot definitions. extract_tables,
+  compute_derived and generate_visual_evidence only collect their results.
+  A new aggregation is one more Accumulator in that list, not another pass.
+
+Figures:
+  Every bar_chart plot in derived/visual_evidence.json is rendered to
+  figures/<filename> as a byte-stable SVG (scripts/svg_chart.py, no
+  plotting dependency) and listed in manifest.json and sha256sum.txt.
+  Rendered SVG is cached in .build/figures/ under the sha256 of the plot
+  definition, so unchanged statistics are not re-rendered.
+
+Blob store (--blob-store):
+  Every file listed in manifest.json is interned into the content-addressed
+  store lab/publication/blobs/ (scripts/blob_store.py): the manifest's
+  sha256 is the blob key, and the dated file becomes a hardlink to the
+  blob, so days with identical outputs share storage. manifest.json records
+  the store under "blob_store". For hosts that do not keep hardlinks,
+  `python3 scripts/blob_store.py materialize <publication dir>` recreates
+  the files from the store.
+
+Skip-if-unchanged (--skip-unchanged):
+  lab/publication/<claim>/input-index.json maps the key of each compiled
+  input set — sha256 over the checksums of manifest.json, daily-status.json
+  and source-snapshot.json and the output fingerprint — to the most recent
+  publication date compiled from it. The output fingerprint (also recorded
+  in provenance.json) covers the engine and renderer versions, the engine,
+  SVG and blob store sources, the table formats and --blob-store. When
+  today's inputs hash to a key whose publication still exists, nothing is
+  recompiled: the index records a "no_change" entry (date -> unchanged-since
+  date) instead. A rerun on the same day with the same inputs is likewise a
+  no-op. A missing index is rebuilt from the publications' provenance.json.
+
+Usage:
+  python3 lab/publication_engine.py [--claim-id ID ...] [--all] [--jobs N]
+                                    [--table-format columnar|ndjson ...]
+
+Exit Codes:
+  0: All claims compiled
+  1: Required inputs missing (NO_DATA_YET, fail-closed)
+  2: Any other failure (in batch mode: at least one claim failed)
 """
 
+import abc
+import io
 import os
 import sys
 import json
-import hashlib
 import csv
+import shutil
+import tempfile
+import contextlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# Shared atomic, write-if-changed writer (scripts/artifact_writer.py) and
+# persistent sha256 cache (scripts/digest_cache.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from artifact_writer import ArtifactWriter
+from blob_store import BlobStore
+from digest_cache import CHUNK_SIZE, DigestCache, sha256_chunks
+from json_stream import stream_object
+from svg_chart import RENDERER_VERSION, render_bar_chart
+
+
+COLUMNAR_FORMAT = "trizel-columnar-v1"
+SPOOL_BATCH_ROWS = 1024
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+
+
+def _json_type(value: Any) -> str:
+    """Name the JSON type of a table value."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "string"
+    return "json"
+
+
+def _column_type(types: set) -> str:
+    """Name the type shared by a column's non-null values."""
+    types = types - {"null"}
+    if types == {"int", "float"}:
+        return "float"
+    if len(types) == 1:
+        return next(iter(types))
+    return "null" if not types else "mixed"
+
+
+class _Spool:
+    """Append-only text buffer: a file in spool_dir, or in memory without one."""
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._f = open(path, "w", encoding="utf-8", newline="") if path else io.StringIO(newline="")
+    
+    def write(self, text: str) -> None:
+        self._f.write(text)
+    
+    def finish(self) -> None:
+        """Close a file-backed spool so it can be read (also from other processes)."""
+        if self.path is not None and self._f is not None:
+            self._f.close()
+            self._f = None
+    
+    def __getstate__(self):
+        # A finished file-backed spool is just its path; an open file handle
+        # cannot be shipped to another process
+        if self.path is not None and self._f is not None:
+            raise TypeError(f"cannot pickle spool {self.path} before finish()")
+        return self.__dict__.copy()
+    
+    def chunks(self):
+        if self.path is None:
+            yield self._f.getvalue()
+            return
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            yield from iter(lambda: f.read(CHUNK_SIZE), "")
+
+
+class TableSpool:
+    """
+    A table serialized incrementally into one spool per output format.
+    
+    Rows are serialized in batches of SPOOL_BATCH_ROWS — JSON array
+    elements (indent=2), CSV, NDJSON and, for the columnar format, one value
+    array per column — so at most one batch is held as dicts. chunks(fmt)
+    yields exactly the text the list based writers produce:
+    json.dumps(rows, indent=2), csv.DictWriter with the first row's keys,
+    compact NDJSON lines and the compact columnar document.
+    
+    A finished spool pickles without its CSV writer (spool files are
+    reopened by path), so batch workers under any multiprocessing start
+    method can stream it.
+    """
+    
+    def __init__(self, name: str, formats=(), spool_dir: Optional[str] = None):
+        """
+        Args:
+            name: Table name (tables/<name>.*)
+            formats: Extra formats to spool besides json and csv
+            spool_dir: Directory for file-backed spools (None = in memory)
+        """
+        self.name = name
+        self.formats = tuple(formats)
+        self.spool_dir = spool_dir
+        self.row_count = 0
+        self.fieldnames = None
+        self._json = self._spool("json")
+        self._csv = self._spool("csv")
+        self._csv_writer = None
+        self._ndjson = self._spool("ndjson") if "ndjson" in self.formats else None
+        self._columns = None
+        self._column_types = None
+        self._pending = []
+        self.finished = False
+    
+    @classmethod
+    def from_rows(cls, name: str, rows: List[Dict[str, Any]], formats=()) -> "TableSpool":
+        """In-memory spool for a table that is already a list of rows."""
+        table = cls(name, formats)
+        for row in rows:
+            table.append(row)
+        table.finish()
+        return table
+    
+    def _spool(self, suffix: str) -> _Spool:
+        if self.spool_dir is None:
+            return _Spool()
+        return _Spool(Path(self.spool_dir) / f"{self.name}.{suffix}")
+    
+    def __len__(self) -> int:
+        return self.row_count
+    
+    def append(self, row: Dict[str, Any]) -> None:
+        """Add one row; it is serialized with the rest of its batch."""
+        if self.fieldnames is None:
+            self.fieldnames = list(row.keys())
+            self._csv_writer = csv.DictWriter(self._csv, fieldnames=self.fieldnames)
+            self._csv_writer.writeheader()
+            if "columnar" in self.formats:
+                self._columns = [self._spool(f"column{i}") for i in range(len(self.fieldnames))]
+                self._column_types = [set() for _ in self.fieldnames]
+        
+        self._pending.append(row)
+        self.row_count += 1
+        if len(self._pending) >= SPOOL_BATCH_ROWS:
+            self._flush()
+    
+    def _flush(self) -> None:
+        """Serialize the pending batch into every spool."""
+        rows, self._pending = self._pending, []
+        if not rows:
+            return
+        first = self.row_count == len(rows)
+        # json.dumps of the batch, minus its "[\n" and "\n]", is exactly the
+        # indent=2 array elements joined by ",\n"
+        self._json.write(("\n" if first else ",\n") + json.dumps(rows, indent=2)[2:-2])
+        self._csv_writer.writerows(rows)
+        if self._ndjson is not None:
+            self._ndjson.write("".join(_COMPACT_JSON.encode(row) + "\n" for row in rows))
+        if self._columns is not None:
+            for column, types, name in zip(self._columns, self._column_types, self.fieldnames):
+                values = [row.get(name) for row in rows]
+                types.update(_json_type(value) for value in {type(v): v for v in values}.values())
+                column.write(("" if first else ",") + _COMPACT_JSON.encode(values)[1:-1])
+    
+    def finish(self) -> None:
+        """Flush and close the spools; no rows may be appended afterwards."""
+        self._flush()
+        for spool in [self._json, self._csv, self._ndjson] + list(self._columns or []):
+            if spool is not None:
+                spool.finish()
+        self._csv_writer = None
+        self.finished = True
+    
+    def __getstate__(self):
+        if not self.finished:
+            raise TypeError(f"cannot pickle table spool {self.name} before finish()")
+        return self.__dict__.copy()
+    
+    def chunks(self, fmt: str):
+        """Yield the serialized table in fmt: json, csv, ndjson or columnar."""
+        if fmt == "json":
+            if not self.row_count:
+                yield "[]"
+                return
+            yield "["
+            yield from self._json.chunks()
+            yield "\n]"
+        elif fmt == "csv":
+            yield from self._csv.chunks()
+        elif fmt == "ndjson" and self._ndjson is not None:
+            yield from self._ndjson.chunks()
+        elif fmt == "columnar" and "columnar" in self.formats:
+            yield f'{{"format":{json.dumps(COLUMNAR_FORMAT)},"row_count":{self.row_count},"columns":['
+            for i, name in enumerate(self.fieldnames or []):
+                nullable = "null" in self._column_types[i]
+                yield (("," if i else "") + f'{{"name":{json.dumps(name)},'
+                       f'"type":{json.dumps(_column_type(self._column_types[i]))},'
+                       f'"nullable":{json.dumps(nullable)},"values":[')
+                yield from self._columns[i].chunks()
+                yield "]}"
+            yield "]}"
+        else:
+            raise ValueError(f"Table {self.name} was not spooled in format {fmt!r}")
+
+
+def sbdb_attempt_row(attempt: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one source-snapshot sbdb_attempts element into its table row."""
+    return {
+        "designation": attempt.get("designation", ""),
+        "ok": attempt.get("ok", False),
+        "url": attempt.get("url", ""),
+        "error_type": attempt.get("error", {}).get("type", ""),
+        "http_status": attempt.get("error", {}).get("http_status", ""),
+        "message": attempt.get("error", {}).get("message", "")
+    }
+
+
+def platform_rows(category_record) -> List[Dict[str, Any]]:
+    """Flatten one (category, items) platforms_registry record into table rows."""
+    category, items = category_record
+    return [{
+        "category": category,
+        "name": item.get("name", ""),
+        "role": item.get("role", ""),
+        "type": item.get("type", "")
+    } for item in items]
+
+
+def attempt_designation(attempt: Dict[str, Any]) -> str:
+    return str(attempt.get("designation", ""))
+
+
+def attempt_error_type(attempt: Dict[str, Any]) -> Optional[str]:
+    """Error type of a failed attempt (None for successful attempts)."""
+    if attempt.get("ok", False):
+        return None
+    return str(attempt.get("error", {}).get("type", "") or "unspecified")
+
+
+# ── Single-Pass Accumulators ───────────────────────────────────
+
+class Accumulator(abc.ABC):
+    """
+    One aggregation fed by SnapshotScan's single traversal of the inputs.
+    
+    source names the record stream consumed:
+      "sbdb_attempts"  each sbdb_attempts element, in file order
+      "platforms"      one (category, items) pair per platforms_registry
+                       category (only when the registry has categories;
+                       begin() is called first)
+    
+    After the traversal, contribute() adds the accumulator's tables,
+    derived values and plot definitions. A new aggregation subclasses this
+    and is listed in default_accumulators(); it costs no extra pass.
+    """
+    
+    source = "sbdb_attempts"
+    present = False
+    
+    def begin(self) -> None:
+        """The source exists in the inputs (called before its first record)."""
+        self.present = True
+    
+    @abc.abstractmethod
+    def add(self, record) -> None:
+        """Consume one record of source."""
+    
+    def finish(self) -> None:
+        pass
+    
+    def contribute(self, tables: Dict[str, Any], derived: Dict[str, Any],
+                   plots: List[Dict[str, Any]]) -> None:
+        pass
+
+
+class TableAccumulator(Accumulator):
+    """Spools the rows of each record (via row or rows) as a table."""
+    
+    def __init__(self, source: str, name: str, formats=(), spool_dir: Optional[str] = None,
+                 row=None, rows=None, keep_empty: bool = False):
+        """
+        Args:
+            row / rows: Record -> one table row / list of table rows
+            keep_empty: Emit the table whenever the source is present, even
+                        without rows (otherwise only when it has rows)
+        """
+        self.source = source
+        self.table = TableSpool(name, formats, spool_dir)
+        self.row = row
+        self.rows = rows
+        self.keep_empty = keep_empty
+    
+    def add(self, record) -> None:
+        if self.row is not None:
+            self.table.append(self.row(record))
+        else:
+            for row in self.rows(record):
+                self.table.append(row)
+    
+    def finish(self) -> None:
+        self.table.finish()
+    
+    def contribute(self, tables, derived, plots) -> None:
+        if len(self.table) or (self.keep_empty and self.present):
+            tables[self.table.name] = self.table
+
+
+class AttemptCounter(Accumulator):
+    """sbdb_total/successful/failed_attempts and the attempts status plot."""
+    
+    def __init__(self):
+        self.total = 0
+        self.successful = 0
+    
+    def add(self, attempt) -> None:
+        self.total += 1
+        if attempt.get("ok", False):
+            self.successful += 1
+    
+    def contribute(self, tables, derived, plots) -> None:
+        failed = self.total - self.successful
+        derived["sbdb_total_attempts"] = self.total
+        derived["sbdb_successful_attempts"] = self.successful
+        derived["sbdb_failed_attempts"] = failed
+        if self.total > 0:
+            plots.append({
+                "id": "sbdb-attempts-status",
+                "title": "SBDB Query Attempts Status",
+                "type": "bar_chart",
+                "description": "Distribution of successful vs failed SBDB query attempts",
+                "data_source": "derived/statistics.json",
+                "format": "svg",
+                "filename": "sbdb_attempts_status.svg",
+                "dimensions": {"width": 800, "height": 400},
+                "series": [
+                    {"label": "Successful", "value": self.successful},
+                    {"label": "Failed", "value": failed}
+                ],
+                "accessibility": {
+                    "alt_text": f"Bar chart showing {self.successful} successful and {failed} failed SBDB query attempts",
+                    "wcag_compliant": True
+                }
+            })
+
+
+class PlatformCounter(Accumulator):
+    """platform_counts_by_category, total_platforms and the distribution plot."""
+    
+    source = "platforms"
+    
+    def __init__(self):
+        self.counts = {}
+    
+    def add(self, category_record) -> None:
+        category, items = category_record
+        self.counts[category] = len(items)
+    
+    def contribute(self, tables, derived, plots) -> None:
+        if not self.present:
+            return
+        total = sum(self.counts.values())
+        derived["platform_counts_by_category"] = self.counts
+        derived["total_platforms"] = total
+        if total > 0:
+            plots.append({
+                "id": "platform-distribution",
+                "title": "Platform Distribution by Category",
+                "type": "bar_chart",
+                "description": "Number of platforms in each category",
+                "data_source": "derived/statistics.json",
+                "format": "svg",
+                "filename": "platform_distribution.svg",
+                "dimensions": {"width": 800, "height": 400},
+                "series": [
+                    {"label": category.replace("_", " "), "value": count}
+                    for category, count in self.counts.items()
+                ],
+                "accessibility": {
+                    "alt_text": f"Bar chart showing distribution of {total} platforms across {len(self.counts)} categories",
+                    "wcag_compliant": True
+                }
+            })
+
+
+class Histogram(Accumulator):
+    """derived[name] = {key: count}, sorted by key; records keyed None are skipped."""
+    
+    def __init__(self, source: str, name: str, key):
+        """
+        Args:
+            key: Module-level function record -> str or None (picklable, so
+                 the scan can be shipped to batch workers)
+        """
+        self.source = source
+        self.name = name
+        self.key = key
+        self.counts = {}
+    
+    def add(self, record) -> None:
+        key = self.key(record)
+        if key is not None:
+            self.counts[key] = self.counts.get(key, 0) + 1
+    
+    def contribute(self, tables, derived, plots) -> None:
+        derived[self.name] = dict(sorted(self.counts.items()))
+
+
+def default_accumulators(table_formats=(), spool_dir: Optional[str] = None) -> List[Accumulator]:
+    """
+    The engine's aggregations, in output order (tables, then plots, follow
+    the order they are contributed in).
+    """
+    return [
+        TableAccumulator("platforms", "platforms_registry", table_formats, spool_dir,
+                         rows=platform_rows, keep_empty=True),
+        TableAccumulator("sbdb_attempts", "sbdb_attempts", table_formats, spool_dir,
+                         row=sbdb_attempt_row),
+        AttemptCounter(),
+        PlatformCounter(),
+        Histogram("sbdb_attempts", "sbdb_attempts_by_designation", attempt_designation),
+        Histogram("sbdb_attempts", "sbdb_attempts_by_error_type", attempt_error_type),
+    ]
+
+
+class SnapshotScan:
+    """
+    Single traversal of source-snapshot.json feeding every accumulator.
+    
+    verify_inputs streams each sbdb_attempts element into add_attempt() as
+    it is decoded, then walks platforms_registry once (add_platforms()).
+    finish() collects the tables, derived values and plot definitions of
+    all accumulators into tables / derived / plots; no later stage goes
+    back over the inputs. Table spools live in a temp directory until
+    cleanup() (in memory with in_memory=True); they are plain files, so
+    batch workers can stream them too.
+    """
+    
+    def __init__(self, table_formats=(), in_memory: bool = False):
+        self.spool_dir = None if in_memory else tempfile.mkdtemp(prefix="trizel-snapshot-")
+        self.accumulators = default_accumulators(table_formats, self.spool_dir)
+        self.tables = {}
+        self.derived = {}
+        self.plots = []
+        self._attempt_accumulators = self._for_source("sbdb_attempts")
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any], table_formats=()) -> "SnapshotScan":
+        """Scan an already-decoded snapshot (in-memory spools)."""
+        scan = cls(table_formats, in_memory=True)
+        for attempt in snapshot.get("sbdb_attempts", []):
+            scan.add_attempt(attempt)
+        scan.add_platforms(snapshot.get("platforms_registry", {}))
+        scan.finish()
+        return scan
+    
+    def _for_source(self, source: str) -> tuple:
+        return tuple(acc for acc in self.accumulators if acc.source == source)
+    
+    def add_attempt(self, attempt: Dict[str, Any]) -> None:
+        for acc in self._attempt_accumulators:
+            acc.add(attempt)
+    
+    def add_platforms(self, platforms_registry: Dict[str, Any]) -> None:
+        if "categories" not in platforms_registry:
+            return
+        accumulators = self._for_source("platforms")
+        for acc in accumulators:
+            acc.begin()
+        for category_record in platforms_registry["categories"].items():
+            for acc in accumulators:
+                acc.add(category_record)
+    
+    def finish(self) -> None:
+        for acc in self.accumulators:
+            acc.finish()
+            acc.contribute(self.tables, self.derived, self.plots)
+    
+    def cleanup(self) -> None:
+        """Remove the spool directory."""
+        if self.spool_dir is not None:
+            shutil.rmtree(self.spool_dir, ignore_errors=True)
+
 
 class PublicationEngine:
     """
@@ -33,19 +586,39 @@ class PublicationEngine:
     """
     
     VERSION = "v001"
+    REQUIRED_INPUTS = ("manifest.json", "daily-status.json", "source-snapshot.json")
+    # Optional table formats written in addition to JSON and CSV
+    EXTRA_TABLE_FORMATS = ("columnar", "ndjson")
+    COLUMNAR_FORMAT = COLUMNAR_FORMAT
     # IMMUTABLE INPUT ROOT - GOVERNANCE ENFORCED
     # This is the ONLY allowed input directory. No alternate paths permitted.
     VERIFIED_INPUT_ROOT = "data/publish/3i-atlas"
+    # Subdirectories of a publication written only by the engine; files in
+    # them that a run did not write are stale and removed
+    ENGINE_OUTPUT_DIRS = ("tables", "figures", "derived")
+    # Code that shapes the outputs (repo-relative), part of output_fingerprint()
+    OUTPUT_SOURCES = ("lab/publication_engine.py", "scripts/svg_chart.py", "scripts/blob_store.py")
     
-    def __init__(self, repo_root: Path, claim_id: str):
+    def __init__(self, repo_root: Path, claim_id: str, execution_timestamp: Optional[datetime] = None,
+                 table_formats: Optional[List[str]] = None, blob_store: bool = False,
+                 skip_unchanged: bool = False):
         """Initialize the publication engine.
         
         Args:
             repo_root: Root directory of the repository
             claim_id: Claim identifier (e.g., "claim-001")
+            execution_timestamp: Shared timestamp for batch runs (default: now)
+            table_formats: Extra table formats from EXTRA_TABLE_FORMATS
+            blob_store: Intern outputs into lab/publication/blobs/ (hardlinked)
+            skip_unchanged: Record a no-change entry instead of recompiling
+                            inputs that are already published
         """
         self.repo_root = repo_root
         self.claim_id = claim_id
+        self.table_formats = list(dict.fromkeys(table_formats or []))
+        unknown = set(self.table_formats) - set(self.EXTRA_TABLE_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown table format(s): {sorted(unknown)}")
         
         # STRICT INPUT SOURCE ENFORCEMENT
         # Construct the data directory using the immutable constant
@@ -55,7 +628,20 @@ class PublicationEngine:
         self._verify_input_path_security()
         
         self.output_base = repo_root / "lab" / "publication" / self.claim_id
-        self.execution_timestamp = datetime.now(timezone.utc)
+        self.execution_timestamp = execution_timestamp or datetime.now(timezone.utc)
+        # Inputs are hashed in the same pass that reads them, and not at
+        # all when unchanged; outputs are hashed by the writer as serialized
+        # and compared with the cached digest of the existing file
+        self.digests = DigestCache(repo_root / ".build" / "digests.json", repo_root)
+        self.writer = ArtifactWriter(digests=self.digests)
+        # Rendered figures, keyed by the sha256 of their plot definition
+        self.figure_cache_dir = repo_root / ".build" / "figures"
+        self.figures_rendered = 0
+        self.figures_reused = 0
+        self.blob_store = BlobStore(repo_root / "lab" / "publication" / "blobs") if blob_store else None
+        self.skip_unchanged = skip_unchanged
+        self.input_index_path = self.output_base / "input-index.json"
+        self._output_fingerprint = None
         
         # Ensure deterministic execution
         self.deterministic_date = self.execution_timestamp.strftime("%Y-%m-%d")
@@ -101,43 +687,54 @@ class PublicationEngine:
         Verify that required input files exist and are valid.
         
         Returns:
-            Dict containing verification status and input data
+            Dict containing verification status and input data; "scan" holds
+            the SnapshotScan of source-snapshot.json's sbdb_attempts (its
+            spool directory is removed by SnapshotScan.cleanup())
             
         Raises:
             FileNotFoundError: If required inputs are missing (NO_DATA_YET)
         """
-        required_files = [
-            "manifest.json",
-            "daily-status.json",
-            "source-snapshot.json"
-        ]
-        
         verification = {
             "verified": True,
             "inputs": {},
             "checksums": {},
-            "missing_files": []
+            "missing_files": [],
+            "scan": None
         }
         
         # Check all required files exist
-        for filename in required_files:
+        for filename in self.REQUIRED_INPUTS:
             filepath = self.data_dir / filename
             if not filepath.exists():
                 verification["verified"] = False
                 verification["missing_files"].append(filename)
+            elif filename == "source-snapshot.json":
+                # Stream the snapshot: sbdb_attempts go straight into the
+                # scan's accumulators (tables, counters, plots), the digest
+                # comes from the same read
+                scan = SnapshotScan(self.table_formats)
+                try:
+                    with self.digests.open_hashed(filepath) as reader:
+                        snapshot = stream_object(reader, {"sbdb_attempts": scan.add_attempt})
+                    scan.add_platforms(snapshot.get("platforms_registry", {}))
+                    scan.finish()
+                except BaseException:
+                    scan.cleanup()
+                    raise
+                verification["inputs"][filename] = snapshot
+                verification["checksums"][filename] = reader.sha256
+                verification["scan"] = scan
             else:
-                # Read and verify file
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                verification["inputs"][filename] = data
-                
-                # Compute checksum
-                with open(filepath, 'rb') as f:
-                    file_hash = hashlib.sha256(f.read()).hexdigest()
+                # Read the file once; its checksum comes from the same read
+                # (or from the digest cache if the file is unchanged)
+                raw_bytes, file_hash = self.digests.read_bytes(filepath)
+                verification["inputs"][filename] = json.loads(raw_bytes)
                 verification["checksums"][filename] = file_hash
         
         # Fail-closed handling: NO_DATA_YET
         if not verification["verified"]:
+            if verification["scan"] is not None:
+                verification["scan"].cleanup()
             raise FileNotFoundError(
                 f"NO_DATA_YET: Missing required input files: {verification['missing_files']}"
             )
@@ -171,7 +768,8 @@ class PublicationEngine:
             "engine": {
                 "name": "TRIZEL Phase-E Publication Compiler",
                 "version": self.VERSION,
-                "claim_id": self.claim_id
+                "claim_id": self.claim_id,
+                "output_fingerprint": self.output_fingerprint()
             },
             "execution": {
                 "timestamp_utc": self.execution_timestamp.isoformat() + "Z",
@@ -199,6 +797,13 @@ class PublicationEngine:
         
         return provenance
     
+    def _scan(self, verification: Dict[str, Any]) -> SnapshotScan:
+        """The single-pass scan of the snapshot (built in memory if missing)."""
+        if verification.get("scan") is None:
+            source_snapshot = verification["inputs"].get("source-snapshot.json", {})
+            verification["scan"] = SnapshotScan.from_snapshot(source_snapshot, self.table_formats)
+        return verification["scan"]
+    
     def extract_tables(self, verification: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract tabular data from verified inputs.
@@ -207,76 +812,26 @@ class PublicationEngine:
             verification: Input verification results
             
         Returns:
-            Dictionary of tables
+            Dictionary of tables (TableSpool per table, from the input scan)
         """
-        tables = {}
-        
-        # Extract platform registry as a table
-        source_snapshot = verification["inputs"].get("source-snapshot.json", {})
-        platforms_registry = source_snapshot.get("platforms_registry", {})
-        
-        if "categories" in platforms_registry:
-            # Flatten platforms into a single table
-            platforms_data = []
-            for category, items in platforms_registry["categories"].items():
-                for item in items:
-                    platforms_data.append({
-                        "category": category,
-                        "name": item.get("name", ""),
-                        "role": item.get("role", ""),
-                        "type": item.get("type", "")
-                    })
-            
-            tables["platforms_registry"] = platforms_data
-        
-        # Extract SBDB attempts as a table
-        sbdb_attempts = source_snapshot.get("sbdb_attempts", [])
-        if sbdb_attempts:
-            attempts_data = []
-            for attempt in sbdb_attempts:
-                attempts_data.append({
-                    "designation": attempt.get("designation", ""),
-                    "ok": attempt.get("ok", False),
-                    "url": attempt.get("url", ""),
-                    "error_type": attempt.get("error", {}).get("type", ""),
-                    "http_status": attempt.get("error", {}).get("http_status", ""),
-                    "message": attempt.get("error", {}).get("message", "")
-                })
-            
-            tables["sbdb_attempts"] = attempts_data
-        
-        return tables
+        return dict(self._scan(verification).tables)
     
     def compute_derived(self, verification: Dict[str, Any]) -> Dict[str, Any]:
         """
         Compute derived statistics (NO INTERPRETATION, only counting/aggregation).
         
+        Counts and histograms come from the accumulators of the input scan.
+        
         Args:
             verification: Input verification results
             
         Returns:
             Dictionary of derived data
         """
-        derived = {}
+        derived = dict(self._scan(verification).derived)
         
         source_snapshot = verification["inputs"].get("source-snapshot.json", {})
         
-        # Count platforms by category
-        platforms_registry = source_snapshot.get("platforms_registry", {})
-        if "categories" in platforms_registry:
-            platform_counts = {}
-            for category, items in platforms_registry["categories"].items():
-                platform_counts[category] = len(items)
-            
-            derived["platform_counts_by_category"] = platform_counts
-            derived["total_platforms"] = sum(platform_counts.values())
-        
-        # Count SBDB attempts
-        sbdb_attempts = source_snapshot.get("sbdb_attempts", [])
-        derived["sbdb_total_attempts"] = len(sbdb_attempts)
-        derived["sbdb_successful_attempts"] = sum(1 for a in sbdb_attempts if a.get("ok", False))
-        derived["sbdb_failed_attempts"] = sum(1 for a in sbdb_attempts if not a.get("ok", False))
-        
         # Extract metadata stats
         metadata = source_snapshot.get("metadata", {})
         derived["metadata"] = {
@@ -319,40 +874,9 @@ class PublicationEngine:
             }
         }
         
-        # Plot 1: SBDB Attempts Status Chart
-        # Generate metadata for SBDB attempts visualization
-        if derived.get("sbdb_total_attempts", 0) > 0:
-            visual_evidence["plots"].append({
-                "id": "sbdb-attempts-status",
-                "title": "SBDB Query Attempts Status",
-                "type": "bar_chart",
-                "description": "Distribution of successful vs failed SBDB query attempts",
-                "data_source": "derived/statistics.json",
-                "format": "svg",
-                "filename": "sbdb_attempts_status.svg",
-                "dimensions": {"width": 800, "height": 400},
-                "accessibility": {
-                    "alt_text": f"Bar chart showing {derived.get('sbdb_successful_attempts', 0)} successful and {derived.get('sbdb_failed_attempts', 0)} failed SBDB query attempts",
-                    "wcag_compliant": True
-                }
-            })
-        
-        # Plot 2: Platform Distribution by Category
-        if derived.get("total_platforms", 0) > 0:
-            visual_evidence["plots"].append({
-                "id": "platform-distribution",
-                "title": "Platform Distribution by Category",
-                "type": "bar_chart",
-                "description": "Number of platforms in each category",
-                "data_source": "derived/statistics.json",
-                "format": "svg",
-                "filename": "platform_distribution.svg",
-                "dimensions": {"width": 800, "height": 400},
-                "accessibility": {
-                    "alt_text": f"Bar chart showing distribution of {derived.get('total_platforms', 0)} platforms across {len(derived.get('platform_counts_by_category', {}))} categories",
-                    "wcag_compliant": True
-                }
-            })
+        # Plot definitions (SBDB attempts status, platform distribution)
+        # are contributed by the input scan's accumulators
+        visual_evidence["plots"] = list(self._scan(verification).plots)
         
         # Reference images metadata (for external reference data)
         # These would be added when verified external reference images are available
@@ -409,76 +933,149 @@ class PublicationEngine:
         reference_images_dir = output_dir / "reference-images"
         reference_images_dir.mkdir(exist_ok=True)
         
+        # All files go through the shared writer: serialized in memory,
+        # compared by sha256 with the existing file, replaced atomically
+        # only when the content changed
+        writer = self.writer
+        
         # Write provenance.json
         provenance_path = output_dir / "provenance.json"
-        with open(provenance_path, 'w') as f:
-            json.dump(provenance, f, indent=2, sort_keys=True)
+        writer.write_json(provenance_path, provenance, indent=2, sort_keys=True)
         
-        # Write tables (both CSV and JSON)
+        # Write tables (both CSV and JSON, plus optional columnar / NDJSON
+        # variants), streamed from their spools
         for table_name, table_data in tables.items():
-            # Write JSON
-            json_path = tables_dir / f"{table_name}.json"
-            with open(json_path, 'w') as f:
-                json.dump(table_data, f, indent=2)
+            if not isinstance(table_data, TableSpool):
+                table_data = TableSpool.from_rows(table_name, table_data, self.table_formats)
             
-            # Write CSV
-            if table_data:
-                csv_path = tables_dir / f"{table_name}.csv"
-                with open(csv_path, 'w', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=table_data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(table_data)
+            writer.write_chunks(tables_dir / f"{table_name}.json", table_data.chunks("json"))
+            if len(table_data):
+                writer.write_chunks(tables_dir / f"{table_name}.csv", table_data.chunks("csv"))
+            if "columnar" in self.table_formats:
+                writer.write_chunks(tables_dir / f"{table_name}.columns.json",
+                                    table_data.chunks("columnar"))
+            if "ndjson" in self.table_formats:
+                writer.write_chunks(tables_dir / f"{table_name}.ndjson", table_data.chunks("ndjson"))
         
         # Write derived data
         derived_path = derived_dir / "statistics.json"
-        with open(derived_path, 'w') as f:
-            json.dump(derived, f, indent=2, sort_keys=True)
+        writer.write_json(derived_path, derived, indent=2, sort_keys=True)
         
         # Write visual evidence metadata (Phase-E scientific publication enhancement)
         if visual_evidence:
             visual_evidence_path = derived_dir / "visual_evidence.json"
-            with open(visual_evidence_path, 'w') as f:
-                json.dump(visual_evidence, f, indent=2, sort_keys=True)
-        
-        # Generate manifest.json
-        manifest = self._generate_manifest(output_dir)
+            writer.write_json(visual_evidence_path, visual_evidence, indent=2, sort_keys=True)
+            self.render_figures(visual_evidence, figures_dir)
+        
+        # Generate manifest.json and sha256sum.txt from the writer's output
+        # registry: every file was hashed while it was serialized, so
+        # nothing is read back from disk. Files left over from an earlier
+        # run in the engine's own directories (another --table-format, a
+        # dropped figure) are removed first; anything else, such as files
+        # placed in reference-images/, is kept and registered, so the
+        # manifest lists exactly what the directory holds
+        self._reconcile_outputs(output_dir)
+        manifest = self._generate_manifest(self._registered_outputs(output_dir))
         manifest_path = output_dir / "manifest.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2, sort_keys=True)
+        writer.write_json(manifest_path, manifest, indent=2, sort_keys=True)
+        
+        # Deduplicate against earlier publications: the manifest's sha256
+        # of each file is its blob key
+        if self.blob_store is not None:
+            self.blob_store.intern_publication(output_dir, manifest["files"])
         
         # Generate sha256sum.txt
         sha256sum_path = output_dir / "sha256sum.txt"
-        self._generate_checksums(output_dir, sha256sum_path)
+        self._generate_checksums(self._registered_outputs(output_dir), sha256sum_path)
         
         return output_dir
     
-    def _generate_manifest(self, output_dir: Path) -> Dict[str, Any]:
+    def render_figures(self, visual_evidence: Dict[str, Any], figures_dir: Path) -> None:
+        """
+        Render every declared SVG bar_chart into figures/ (scripts/svg_chart.py).
+        
+        The plot definition carries the input statistics (its series), so
+        the sha256 of the definition plus the renderer version keys a cache
+        of rendered SVG in .build/figures/: unchanged statistics reuse the
+        cached bytes instead of re-rendering.
+        """
+        cache_writer = ArtifactWriter()
+        for plot in visual_evidence.get("plots", []):
+            if plot.get("type") != "bar_chart" or plot.get("format") != "svg" or not plot.get("series"):
+                continue
+            key = sha256_chunks([json.dumps({"renderer": RENDERER_VERSION, "plot": plot},
+                                            sort_keys=True, separators=(",", ":")).encode("utf-8")])
+            cache_path = self.figure_cache_dir / f"{key}.svg"
+            try:
+                svg = cache_path.read_text(encoding="utf-8")
+                self.figures_reused += 1
+            except OSError:
+                svg = render_bar_chart(plot)
+                cache_writer.write_text(cache_path, svg)
+                self.figures_rendered += 1
+            self.writer.write_text(figures_dir / plot["filename"], svg)
+    
+    def _registered_outputs(self, output_dir: Path) -> Dict[Path, Dict[str, Any]]:
+        """
+        Files under output_dir in the writer's registry (written in this run,
+        or kept by _reconcile_outputs()).
+        
+        Returns:
+            {path relative to output_dir: {"sha256", "size_bytes"}}, sorted by path
+        """
+        outputs = {}
+        for path, info in self.writer.outputs.items():
+            try:
+                outputs[path.relative_to(output_dir)] = info
+            except ValueError:
+                continue
+        return dict(sorted(outputs.items()))
+    
+    def _reconcile_outputs(self, output_dir: Path) -> None:
+        """Match the writer's registry with the files under output_dir.
+        
+        Files this run did not write are deleted if they sit in a directory
+        the engine owns (ENGINE_OUTPUT_DIRS), and otherwise registered with
+        their digest (via the digest cache). manifest.json and sha256sum.txt
+        are skipped: they are rewritten next.
+        """
+        skip = {output_dir / "manifest.json", output_dir / "sha256sum.txt"}
+        for path in sorted(output_dir.rglob("*")):
+            if not path.is_file() or path in skip or path in self.writer.outputs:
+                continue
+            if path.relative_to(output_dir).parts[0] in self.ENGINE_OUTPUT_DIRS:
+                self.writer.delete(path)
+            else:
+                self.writer.outputs[path] = {
+                    "sha256": self.digests.digest(path),
+                    "size_bytes": path.stat().st_size
+                }
+    
+    def _generate_manifest(self, outputs: Dict[Path, Dict[str, Any]]) -> Dict[str, Any]:
         """Generate manifest.json for the publication.
         
         Excludes timestamp-containing files (provenance.json, sha256sum.txt) 
         to ensure deterministic manifest checksums.
+        
+        Args:
+            outputs: Registered outputs from _registered_outputs()
         """
         files = {}
         
         # Files to exclude from manifest for determinism
         excluded_files = {"manifest.json", "provenance.json", "sha256sum.txt"}
         
-        for filepath in output_dir.rglob("*"):
-            if filepath.is_file():
-                rel_path = filepath.relative_to(output_dir)
-                filename = str(rel_path)
-                
-                # Skip excluded files
-                if filepath.name in excluded_files or filename in excluded_files:
-                    continue
-                
-                with open(filepath, 'rb') as f:
-                    file_hash = hashlib.sha256(f.read()).hexdigest()
-                
-                files[filename] = {
-                    "sha256": file_hash,
-                    "size_bytes": filepath.stat().st_size
-                }
+        for rel_path, info in outputs.items():
+            filename = str(rel_path)
+            
+            # Skip excluded files
+            if rel_path.name in excluded_files or filename in excluded_files:
+                continue
+            
+            files[filename] = {
+                "sha256": info["sha256"],
+                "size_bytes": info["size_bytes"]
+            }
         
         manifest = {
             "publication": {
@@ -488,23 +1085,156 @@ class PublicationEngine:
             },
             "files": files
         }
+        if self.blob_store is not None:
+            manifest["blob_store"] = {
+                "path": self.blob_store.root.relative_to(self.repo_root).as_posix(),
+                "layout": "sha256/<sha256[:2]>/<sha256>"
+            }
         
         return manifest
     
-    def _generate_checksums(self, output_dir: Path, checksum_path: Path):
-        """Generate sha256sum.txt file."""
-        with open(checksum_path, 'w') as out:
-            for filepath in sorted(output_dir.rglob("*")):
-                if filepath.is_file() and filepath.name != "sha256sum.txt":
-                    rel_path = filepath.relative_to(output_dir)
-                    with open(filepath, 'rb') as f:
-                        file_hash = hashlib.sha256(f.read()).hexdigest()
-                    out.write(f"{file_hash}  {rel_path}\n")
-    
-    def run(self) -> Dict[str, Any]:
+    def _generate_checksums(self, outputs: Dict[Path, Dict[str, Any]], checksum_path: Path):
+        """Generate sha256sum.txt file from the registered outputs."""
+        lines = []
+        for rel_path, info in outputs.items():
+            if rel_path.name != "sha256sum.txt":
+                lines.append(f"{info['sha256']}  {rel_path}\n")
+        self.writer.write_text(checksum_path, "".join(lines))
+    
+    def input_checksums(self) -> Optional[Dict[str, str]]:
+        """sha256 of each required input (None if one is missing), via the digest cache."""
+        checksums = {}
+        for filename in self.REQUIRED_INPUTS:
+            checksums[filename] = self.digests.digest(self.data_dir / filename)
+            if checksums[filename] is None:
+                return None
+        return checksums
+    
+    def output_fingerprint(self) -> str:
+        """sha256 over everything besides the inputs that shapes the outputs.
+        
+        Covers the engine VERSION, the SVG renderer version, the sources in
+        OUTPUT_SOURCES and the table formats and blob store options, so a
+        code or option change never reuses a publication compiled without it.
+        """
+        if self._output_fingerprint is None:
+            fingerprint = {
+                "engine_version": self.VERSION,
+                "renderer_version": RENDERER_VERSION,
+                "sources": {rel: self.digests.digest(self.repo_root / rel) for rel in self.OUTPUT_SOURCES},
+                "table_formats": sorted(self.table_formats),
+                "blob_store": self.blob_store is not None
+            }
+            self._output_fingerprint = sha256_chunks(
+                [json.dumps(fingerprint, sort_keys=True, separators=(",", ":")).encode("utf-8")])
+        return self._output_fingerprint
+    
+    def input_key(self, checksums: Dict[str, str]) -> str:
+        """sha256 identifying the input checksums and the output fingerprint."""
+        key = {
+            "checksums": checksums,
+            "output_fingerprint": self.output_fingerprint()
+        }
+        return sha256_chunks([json.dumps(key, sort_keys=True, separators=(",", ":")).encode("utf-8")])
+    
+    def load_input_index(self) -> Dict[str, Any]:
+        """Read input-index.json, seeded from provenance if missing or unreadable."""
+        try:
+            with open(self.input_index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            index = {}
+        if index.get("index_version") != 2:
+            index = {"inputs": self.seed_input_index()}
+        index.setdefault("index_version", 2)
+        index.setdefault("claim_id", self.claim_id)
+        index.setdefault("inputs", {})
+        index.setdefault("no_change", {})
+        return index
+    
+    def seed_input_index(self) -> Dict[str, Any]:
+        """Index entries rebuilt from the provenance.json of existing publications.
+        
+        Only publications whose provenance records the current output
+        fingerprint are indexed; the latest date wins for each input key.
+        """
+        inputs = {}
+        if not self.output_base.is_dir():
+            return inputs
+        for output_dir in sorted(self.output_base.iterdir()):
+            try:
+                with open(output_dir / "provenance.json", "r", encoding="utf-8") as f:
+                    provenance = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            checksums = provenance.get("inputs", {}).get("checksums")
+            if provenance.get("engine", {}).get("output_fingerprint") != self.output_fingerprint():
+                continue
+            if not isinstance(checksums, dict) or set(checksums) != set(self.REQUIRED_INPUTS):
+                continue
+            inputs[self.input_key(checksums)] = {
+                "date": output_dir.name,
+                "checksums": checksums
+            }
+        return inputs
+    
+    def write_input_index(self, index: Dict[str, Any]) -> None:
+        self.writer.write_json(self.input_index_path, index, trailing_newline=True, indent=2, sort_keys=True)
+    
+    def find_unchanged_publication(self, index: Dict[str, Any], key: str) -> Optional[str]:
+        """Date of the latest publication compiled from key, if it still exists."""
+        entry = index["inputs"].get(key)
+        if entry is None:
+            return None
+        if not (self.output_base / entry["date"] / "manifest.json").exists():
+            return None
+        return entry["date"]
+    
+    def unchanged_since(self, checksums: Dict[str, str]) -> Optional[str]:
+        """Date these inputs were last published for this claim (None if not indexed)."""
+        return self.find_unchanged_publication(self.load_input_index(), self.input_key(checksums))
+    
+    def record_publication(self, index: Dict[str, Any], checksums: Dict[str, str]) -> None:
+        """Index today's publication as the latest one compiled from checksums."""
+        index["inputs"][self.input_key(checksums)] = {
+            "date": self.deterministic_date,
+            "checksums": checksums
+        }
+        index["no_change"].pop(self.deterministic_date, None)
+        self.write_input_index(index)
+    
+    def record_no_change(self, index: Dict[str, Any], unchanged_since: str) -> Dict[str, Any]:
+        """Record that today's inputs were already published on unchanged_since."""
+        if unchanged_since != self.deterministic_date:
+            index["no_change"][self.deterministic_date] = unchanged_since
+        self.write_input_index(index)
+        self.digests.save()
+        
+        output_dir = self.output_base / unchanged_since
+        print("Inputs unchanged since the last publication: nothing to compile")
+        print(f"  ✓ Unchanged since: {unchanged_since} ({output_dir.relative_to(self.repo_root)})")
+        print(f"  ✓ Input index: {self.input_index_path.relative_to(self.repo_root)}")
+        print(f"  ✓ Digests: {self.digests.report()}")
+        print()
+        print("="*60)
+        print("PUBLICATION UNCHANGED")
+        print("="*60)
+        
+        return {
+            "success": True,
+            "claim_id": self.claim_id,
+            "output_dir": str(output_dir.relative_to(self.repo_root)),
+            "unchanged_since": unchanged_since
+        }
+    
+    def run(self, verification: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Execute the deterministic publication compiler.
         
+        Args:
+            verification: Result of verify_inputs() already done for this
+                          input set (batch mode); verified here if None
+        
         Returns:
             Dictionary with execution results
             
@@ -517,44 +1247,73 @@ class PublicationEngine:
         print(f"Date: {self.deterministic_date}")
         print()
         
+        # Step 0: Skip inputs that are already published (digests only,
+        # served from the digest cache when the files are unchanged)
+        if self.skip_unchanged:
+            input_index = self.load_input_index()
+            checksums = verification["checksums"] if verification is not None else self.input_checksums()
+            if checksums is not None:
+                unchanged_since = self.find_unchanged_publication(input_index, self.input_key(checksums))
+                if unchanged_since is not None:
+                    return self.record_no_change(input_index, unchanged_since)
+        
         # Step 1: Verify inputs
         print("Step 1: Verifying inputs...")
-        verification = self.verify_inputs()
-        print(f"  ✓ Verified {len(verification['inputs'])} input files")
-        print()
-        
-        # Step 2: Generate provenance
-        print("Step 2: Generating provenance...")
-        provenance = self.generate_provenance(verification)
-        print(f"  ✓ Provenance generated (deterministic: {provenance['execution']['deterministic']})")
-        print()
-        
-        # Step 3: Extract tables
-        print("Step 3: Extracting tables...")
-        tables = self.extract_tables(verification)
-        print(f"  ✓ Extracted {len(tables)} tables")
-        for table_name, table_data in tables.items():
-            print(f"    - {table_name}: {len(table_data)} rows")
+        owns_verification = verification is None
+        if owns_verification:
+            verification = self.verify_inputs()
+            print(f"  ✓ Verified {len(verification['inputs'])} input files")
+        else:
+            print(f"  ✓ Reusing {len(verification['inputs'])} input files verified for this batch")
         print()
         
-        # Step 4: Compute derived data
-        print("Step 4: Computing derived data...")
-        derived = self.compute_derived(verification)
-        print(f"  ✓ Computed {len(derived)} derived metrics")
-        print()
-        
-        # Step 5: Generate visual evidence (Phase-E scientific publication enhancement)
-        print("Step 5: Generating visual evidence metadata...")
-        visual_evidence = self.generate_visual_evidence(verification, derived)
-        print(f"  ✓ Generated {len(visual_evidence.get('plots', []))} plot definitions")
-        print(f"  ✓ Generated {len(visual_evidence.get('reference_images', []))} reference image entries")
-        print()
-        
-        # Step 6: Write outputs
-        print("Step 6: Writing outputs...")
-        output_dir = self.write_outputs(provenance, tables, derived, visual_evidence)
-        print(f"  ✓ Outputs written to: {output_dir.relative_to(self.repo_root)}")
-        print()
+        # A scan verified here is ours to clean up; a batch's belongs to the batch
+        own_scan = verification["scan"] if owns_verification else None
+        try:
+            # Step 2: Generate provenance
+            print("Step 2: Generating provenance...")
+            provenance = self.generate_provenance(verification)
+            print(f"  ✓ Provenance generated (deterministic: {provenance['execution']['deterministic']})")
+            print()
+        
+            # Step 3: Extract tables
+            print("Step 3: Extracting tables...")
+            tables = self.extract_tables(verification)
+            print(f"  ✓ Extracted {len(tables)} tables")
+            for table_name, table_data in tables.items():
+                print(f"    - {table_name}: {len(table_data)} rows")
+            print()
+        
+            # Step 4: Compute derived data
+            print("Step 4: Computing derived data...")
+            derived = self.compute_derived(verification)
+            print(f"  ✓ Computed {len(derived)} derived metrics")
+            print()
+        
+            # Step 5: Generate visual evidence (Phase-E scientific publication enhancement)
+            print("Step 5: Generating visual evidence metadata...")
+            visual_evidence = self.generate_visual_evidence(verification, derived)
+            print(f"  ✓ Generated {len(visual_evidence.get('plots', []))} plot definitions")
+            print(f"  ✓ Generated {len(visual_evidence.get('reference_images', []))} reference image entries")
+            print()
+        
+            # Step 6: Write outputs
+            print("Step 6: Writing outputs...")
+            output_dir = self.write_outputs(provenance, tables, derived, visual_evidence)
+            print(f"  ✓ Outputs written to: {output_dir.relative_to(self.repo_root)}")
+            print(f"  ✓ Files: {self.writer.report()}")
+            print(f"  ✓ Figures: {self.figures_rendered} rendered, {self.figures_reused} reused from cache")
+            if self.blob_store is not None:
+                print(f"  ✓ Blobs: {self.blob_store.report()}")
+            if self.skip_unchanged:
+                self.record_publication(input_index, verification["checksums"])
+                print(f"  ✓ Input index: {self.input_index_path.relative_to(self.repo_root)}")
+            self.digests.save()
+            print(f"  ✓ Digests: {self.digests.report()}")
+            print()
+        finally:
+            if own_scan is not None:
+                own_scan.cleanup()
         
         # Summary
         print("="*60)
@@ -579,6 +1338,148 @@ class PublicationEngine:
         }
 
 
+# ── Batch Mode ─────────────────────────────────────────────────
+
+# Verified inputs, shared timestamp and table formats for batch workers
+# (set once per worker)
+_batch_context = None
+
+
+def _init_compile_worker(repo_root: Path, verification: Dict[str, Any],
+                         execution_timestamp: datetime, engine_options: Dict[str, Any]) -> None:
+    global _batch_context
+    _batch_context = (repo_root, verification, execution_timestamp, engine_options)
+
+
+def compile_claim(repo_root: Path, claim_id: str, verification: Optional[Dict[str, Any]],
+                  execution_timestamp: datetime,
+                  engine_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Compile one claim against already-verified inputs (None: the engine
+    verifies them itself), capturing its log.
+    
+    engine_options are PublicationEngine keyword arguments (table_formats,
+    blob_store, skip_unchanged).
+    
+    Returns:
+        Dict with keys: claim_id, success, output_dir, files, error, log
+    """
+    result = {"claim_id": claim_id, "success": False, "output_dir": None,
+              "files": None, "error": None, "log": ""}
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            engine = PublicationEngine(repo_root, claim_id, execution_timestamp, **(engine_options or {}))
+            outcome = engine.run(verification)
+        result.update(success=True, output_dir=outcome["output_dir"], files=engine.writer.report())
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        log.write(traceback.format_exc())
+    result["log"] = log.getvalue()
+    return result
+
+
+def _compile_claim_in_worker(claim_id: str) -> Dict[str, Any]:
+    repo_root, verification, execution_timestamp, engine_options = _batch_context
+    return compile_claim(repo_root, claim_id, verification, execution_timestamp, engine_options)
+
+
+def discover_claim_ids(repo_root: Path) -> List[str]:
+    """Return every claim with a lab/publication/claim-* tree, sorted."""
+    publication_dir = repo_root / "lab" / "publication"
+    if not publication_dir.exists():
+        return []
+    return sorted(d.name for d in publication_dir.glob("claim-*") if d.is_dir())
+
+
+def compile_claims(repo_root: Path, claim_ids: List[str], jobs: int,
+                   engine_options: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Compile many claims: verify inputs once, then compile claims in parallel.
+    
+    Args:
+        repo_root: Root directory of the repository
+        claim_ids: Claims to compile
+        jobs: Worker processes (1 = compile in this process)
+        engine_options: PublicationEngine keyword arguments for every claim
+    
+    Returns:
+        Per-claim results from compile_claim(), in claim_ids order
+    
+    Raises:
+        FileNotFoundError: If required inputs are missing (NO_DATA_YET)
+    """
+    execution_timestamp = datetime.now(timezone.utc)
+    
+    # Inputs are identical for every claim: read, hash and parse them once
+    engine_options = engine_options or {}
+    verifier = PublicationEngine(repo_root, claim_ids[0], execution_timestamp,
+                                 engine_options.get("table_formats"))
+    
+    # Quiet day: every claim already published these inputs, so nothing
+    # needs to be parsed; each claim just records its no-change entry
+    if engine_options.get("skip_unchanged"):
+        checksums = verifier.input_checksums()
+        if checksums is not None and all(
+            PublicationEngine(repo_root, claim_id, execution_timestamp,
+                              **engine_options).unchanged_since(checksums) is not None
+            for claim_id in claim_ids
+        ):
+            verifier.digests.save()
+            print(f"  ✓ Inputs unchanged for all {len(claim_ids)} claim(s): recording no-change entries")
+            return [compile_claim(repo_root, claim_id, None, execution_timestamp, engine_options)
+                    for claim_id in claim_ids]
+    
+    verification = verifier.verify_inputs()
+    verifier.digests.save()
+    print(f"  ✓ Verified {len(verification['inputs'])} input files once for {len(claim_ids)} claim(s)")
+    
+    try:
+        if jobs <= 1:
+            return [compile_claim(repo_root, claim_id, verification, execution_timestamp, engine_options)
+                    for claim_id in claim_ids]
+        # Workers stream the table spools from the shared spool directory
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_compile_worker,
+                                 initargs=(repo_root, verification, execution_timestamp,
+                                           engine_options)) as pool:
+            return list(pool.map(_compile_claim_in_worker, claim_ids))
+    finally:
+        verification["scan"].cleanup()
+
+
+def run_batch(repo_root: Path, claim_ids: List[str], jobs: int,
+              engine_options: Optional[Dict[str, Any]] = None) -> int:
+    """Compile claim_ids in batch mode and report each claim; returns an exit code."""
+    print(f"TRIZEL Phase-E Publication Compiler {PublicationEngine.VERSION} (batch)")
+    print(f"Claims: {', '.join(claim_ids)}")
+    print(f"Workers: {jobs}")
+    print()
+    
+    results = compile_claims(repo_root, claim_ids, jobs, engine_options)
+    print()
+    
+    for result in results:
+        print("-" * 60)
+        status = "OK" if result["success"] else "FAILED"
+        print(f"[{status}] {result['claim_id']}")
+        print("-" * 60)
+        print(result["log"], end="")
+        print()
+    
+    failed = [r for r in results if not r["success"]]
+    print("=" * 60)
+    print("BATCH PUBLICATION COMPLETE" if not failed else "BATCH PUBLICATION FINISHED WITH FAILURES")
+    print("=" * 60)
+    for result in results:
+        if result["success"]:
+            print(f"  ✓ {result['claim_id']}: {result['output_dir']} ({result['files']})")
+    for result in failed:
+        print(f"  ✗ {result['claim_id']}: {result['error']}")
+    print(f"Compiled: {len(results) - len(failed)}/{len(results)}")
+    print("=" * 60)
+    return 2 if failed else 0
+
+
 def main():
     """Main entry point for the publication engine."""
     try:
@@ -589,16 +1490,57 @@ def main():
         )
         parser.add_argument(
             "--claim-id",
-            default="claim-001",
-            help="Claim identifier (default: claim-001)"
+            action="append",
+            dest="claim_ids",
+            help="Claim identifier (default: claim-001); repeat to compile several claims"
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Compile every claim that has a lab/publication/claim-* tree"
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=0,
+            help="Worker processes for batch mode (default: one per claim, up to CPU count)"
+        )
+        parser.add_argument(
+            "--table-format",
+            action="append",
+            dest="table_formats",
+            choices=PublicationEngine.EXTRA_TABLE_FORMATS,
+            help="Also write tables in this format (repeatable): columnar, ndjson"
+        )
+        parser.add_argument(
+            "--blob-store",
+            action="store_true",
+            help="Deduplicate outputs into the content-addressed store lab/publication/blobs/"
+        )
+        parser.add_argument(
+            "--skip-unchanged",
+            action="store_true",
+            help="Record a no-change entry instead of recompiling already published inputs"
         )
         args = parser.parse_args()
         
         # Determine repository root
         repo_root = Path(__file__).parent.parent.resolve()
         
+        claim_ids = list(args.claim_ids or [])
+        if args.all:
+            claim_ids.extend(discover_claim_ids(repo_root))
+        claim_ids = list(dict.fromkeys(claim_ids)) or ["claim-001"]
+        
+        engine_options = {"table_formats": args.table_formats, "blob_store": args.blob_store,
+                          "skip_unchanged": args.skip_unchanged}
+        
+        if len(claim_ids) > 1:
+            jobs = args.jobs if args.jobs > 0 else min(len(claim_ids), os.cpu_count() or 1)
+            sys.exit(run_batch(repo_root, claim_ids, jobs, engine_options))
+        
         # Create and run engine
-        engine = PublicationEngine(repo_root, args.claim_id)
+        engine = PublicationEngine(repo_root, claim_ids[0], **engine_options)
         result = engine.run()
         
         # Exit with success
@@ -613,7 +1555,6 @@ def main():
         
     except Exception as e:
         print(f"FATAL ERROR: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         sys.exit(2)
 
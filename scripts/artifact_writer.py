@@ -0,0 +1,232 @@
+"""
+TRIZEL Artifact Writer — Atomic, Write-If-Changed Output
+
+Shared by every generator that writes published artifacts:
+  scripts/build_observations.py   (public/observations, summary, latest)
+  lab/publication_engine.py       (lab/publication/<claim>/<date>/)
+  lab/generate_phase_e_pages.py   (phase-e/ and <lang>/phase-e/ pages)
+
+Content is serialized in memory (or streamed through a hasher) and its
+sha256 is compared with the file already on disk. With a DigestCache
+(scripts/digest_cache.py) the existing file's digest is looked up by
+size/mtime_ns instead of re-reading it, and every file written is recorded
+in the cache, so an unchanged output costs a stat on the next run. Only
+when the digests differ is
+the new content written to a temp file in the target directory and moved
+into place with os.replace, so readers never see a partial file and
+unchanged files keep their mtime. Downstream caches, the static host upload
+and CDN invalidations then only see files whose bytes actually changed.
+
+Every write also lands in an in-memory output registry (writer.outputs:
+path -> sha256 and size of the content, whether or not the file changed),
+so callers can emit manifests and checksum lists without re-reading disk.
+
+Usage:
+  writer = ArtifactWriter(digests=DigestCache(BASE_DIR / ".build" / "digests.json", BASE_DIR))
+  writer.write_json(path, data, indent=2)
+  writer.write_text(path, html)
+  print(writer.report())   # "3 written, 41 unchanged"
+"""
+
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# The chunked hasher is shared with every other hashing call site
+from digest_cache import CHUNK_SIZE, file_sha256, sha256_chunks
+
+# mkstemp creates files 0600; published artifacts get the usual umask mode.
+# The umask can only be read by setting it, so that happens once, on the
+# first write, rather than at import time where it could race other threads
+_FILE_MODE = None
+
+
+def _file_mode() -> int:
+    """Mode for published files: 0o666 minus the process umask (read once)."""
+    global _FILE_MODE
+    if _FILE_MODE is None:
+        umask = os.umask(0o022)
+        os.umask(umask)
+        _FILE_MODE = 0o666 & ~umask
+    return _FILE_MODE
+
+
+def _matches_existing(path: Path, size: int, sha256: str, digests=None) -> bool:
+    """True if path exists with exactly this size and sha256 (looked up in digests if given)."""
+    try:
+        if path.stat().st_size != size:
+            return False
+        if digests is not None:
+            return digests.digest(path) == sha256
+        return file_sha256(path) == sha256
+    except OSError:
+        return False
+
+
+class ArtifactWriter:
+    """
+    Atomic, write-if-changed writer with written/unchanged accounting.
+
+    Every write method returns True if the file was (or, in dry-run mode,
+    would be) written and False if the existing file already had identical
+    content.
+
+    Attributes:
+        written: Paths written (or that would be written under dry-run)
+        unchanged: Paths whose existing content was already identical
+        deleted: Paths deleted by delete() (or that would be under dry-run)
+        outputs: {path: {"sha256": ..., "size_bytes": ...}} for every write
+    """
+
+    def __init__(self, dry_run: bool = False, digests=None):
+        """
+        Args:
+            dry_run: Compare only; report what would change without writing
+            digests: DigestCache for existing-file digests (None = re-hash
+                     the existing file on every write); the caller saves it
+        """
+        self.dry_run = dry_run
+        self.digests = digests
+        self.written = []
+        self.unchanged = []
+        self.deleted = []
+        self.outputs = {}
+
+    def record(self, path: Path, changed: bool) -> None:
+        """Account for a write (also used for writes done in worker processes)."""
+        (self.written if changed else self.unchanged).append(Path(path))
+
+    def report(self) -> str:
+        """One-line written/unchanged summary."""
+        verb = "would be written" if self.dry_run else "written"
+        report = f"{len(self.written)} {verb}, {len(self.unchanged)} unchanged"
+        if self.deleted:
+            report += f", {len(self.deleted)} {'would be deleted' if self.dry_run else 'deleted'}"
+        return report
+
+    def delete(self, path: Path) -> bool:
+        """
+        Delete a stale output (unless dry-run).
+
+        Returns:
+            True if the file existed (and was, or would be, deleted)
+        """
+        path = Path(path)
+        if not path.exists():
+            return False
+        if self.dry_run:
+            print(f"  [dry-run] Would delete: {path}")
+        else:
+            path.unlink()
+        self.deleted.append(path)
+        self.outputs.pop(path, None)
+        return True
+
+    def write_bytes(self, path: Path, data: bytes) -> bool:
+        """Write data to path atomically if it differs from the current file."""
+        path = Path(path)
+        sha256 = sha256_chunks([data])
+        changed = not _matches_existing(path, len(data), sha256, self.digests)
+        if changed and not self.dry_run:
+            self._replace(path, lambda f: f.write(data))
+        self._finish(path, changed, sha256, len(data))
+        return changed
+
+    def write_text(self, path: Path, text: str, encoding: str = "utf-8") -> bool:
+        """Write text to path atomically if it differs from the current file."""
+        return self.write_bytes(path, text.encode(encoding))
+
+    def write_json(self, path: Path, data, trailing_newline: bool = False, **dump_kwargs) -> bool:
+        """
+        Serialize data with json.dumps(**dump_kwargs) and write it if changed.
+
+        Args:
+            trailing_newline: Append "\\n" after the JSON document
+        """
+        text = json.dumps(data, **dump_kwargs)
+        if trailing_newline:
+            text += "\n"
+        return self.write_text(path, text)
+
+    def write_chunks(self, path: Path, chunks, encoding: str = "utf-8") -> bool:
+        """
+        Stream text chunks to path, hashing as they go; keep memory constant.
+
+        The chunks are written to a temp file next to path. If the final
+        digest matches the existing file the temp file is discarded.
+        """
+        path = Path(path)
+        size = 0
+        tmp_path = None
+
+        def encoded(f=None):
+            nonlocal size
+            for chunk in chunks:
+                data = chunk.encode(encoding)
+                size += len(data)
+                if f is not None:
+                    f.write(data)
+                yield data
+
+        try:
+            if self.dry_run:
+                sha256 = sha256_chunks(encoded())
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    sha256 = sha256_chunks(encoded(f))
+            changed = not _matches_existing(path, size, sha256, self.digests)
+            if changed and tmp_path is not None:
+                os.chmod(tmp_path, _file_mode())
+                os.replace(tmp_path, path)
+                tmp_path = None
+        finally:
+            if tmp_path is not None:
+                os.unlink(tmp_path)
+        self._finish(path, changed, sha256, size)
+        return changed
+
+    def matches(self, path: Path, chunks, encoding: str = "utf-8") -> bool:
+        """
+        True if path already holds exactly the given text chunks.
+
+        Nothing is written or recorded; the chunks are only hashed.
+        """
+        size = 0
+
+        def encoded():
+            nonlocal size
+            for chunk in chunks:
+                data = chunk.encode(encoding)
+                size += len(data)
+                yield data
+
+        sha256 = sha256_chunks(encoded())
+        return _matches_existing(Path(path), size, sha256, self.digests)
+
+    def _finish(self, path: Path, changed: bool, sha256: str, size: int) -> None:
+        if self.dry_run and changed:
+            print(f"  [dry-run] Would write: {path}")
+        elif changed and self.digests is not None:
+            self.digests.record(path, sha256)
+        self.record(path, changed)
+        self.outputs[path] = {"sha256": sha256, "size_bytes": size}
+
+    @staticmethod
+    def _replace(path: Path, write) -> None:
+        """Write via a temp file in path's directory, then os.replace it into place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.chmod(tmp_path, _file_mode())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
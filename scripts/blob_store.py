@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+TRIZEL Blob Store — Content-Addressed Storage for Publication Outputs
+
+Most daily publications (lab/publication/<claim>/<date>/) are byte-identical
+to the previous day's: the inputs did not change. The blob store keeps one
+copy of each distinct file, named by its sha256:
+
+  lab/publication/blobs/sha256/<first two hex digits>/<sha256>
+
+A publication's manifest.json already lists every file with its sha256,
+which is the blob key. With the store enabled (publication_engine.py
+--blob-store) each file listed in the manifest is interned after it is
+written: a new file becomes the blob (hardlink), and a file whose content
+is already stored is replaced by a hardlink to the existing blob. Identical
+days then share storage, and disk use grows with the amount of new data
+rather than the number of calendar days. Where hardlinks are unavailable
+(e.g. the store is on another filesystem) interning copies instead.
+
+Hardlinked files must never be modified in place. Every writer in this
+repo replaces files atomically (scripts/artifact_writer.py, os.replace),
+which gives the new content a new inode and leaves the blob untouched.
+
+Static hosts and copies that do not preserve hardlinks use the materialize
+step, which (re)creates a publication's files from the store and verifies
+them against the manifest:
+
+Usage:
+  python3 scripts/blob_store.py materialize lab/publication/claim-001/2026-02-23
+  python3 scripts/blob_store.py materialize <publication dir> --dest site/publication/
+
+Exit Codes:
+  0: All files materialized
+  1: A blob referenced by the manifest is missing or corrupt
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+from pathlib import Path
+
+from digest_cache import file_sha256
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_STORE = BASE_DIR / "lab" / "publication" / "blobs"
+
+# Per-publication files that are never blobs (timestamps, or the manifest itself)
+UNSTORED_FILES = frozenset({"manifest.json", "provenance.json", "sha256sum.txt"})
+
+
+class BlobStore:
+    """
+    sha256-addressed file store shared by all publications.
+
+    Attributes:
+        added: Blobs created by this instance
+        shared: Files that were linked to an already stored blob
+    """
+
+    def __init__(self, root: Path = DEFAULT_STORE):
+        self.root = Path(root)
+        self.added = 0
+        self.shared = 0
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.root / "sha256" / sha256[:2] / sha256
+
+    def intern(self, path: Path, sha256: str) -> bool:
+        """
+        Store path's content (whose digest is sha256) and link path to it.
+
+        Returns:
+            True if a new blob was added, False if the content was stored already
+        """
+        path = Path(path)
+        blob = self.blob_path(sha256)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, blob)
+                self.added += 1
+                return True
+            except FileExistsError:
+                pass  # stored concurrently (batch workers); link to it below
+            except OSError:
+                self._copy(path, blob)
+                self.added += 1
+                return True
+        if not os.path.samefile(path, blob):
+            self._link(blob, path)
+        self.shared += 1
+        return False
+
+    def intern_publication(self, output_dir: Path, files: dict) -> None:
+        """Intern every file of a manifest's "files" mapping under output_dir."""
+        for rel_path, info in sorted(files.items()):
+            self.intern(output_dir / rel_path, info["sha256"])
+
+    def materialize(self, files: dict, dest: Path) -> list:
+        """
+        Make dest/<rel_path> hold each manifest file, linked or copied from its blob.
+
+        Existing files with the right content are left alone.
+
+        Returns:
+            Problems found (missing or corrupt blobs); empty on success
+        """
+        problems = []
+        for rel_path, info in sorted(files.items()):
+            sha256 = info["sha256"]
+            target = Path(dest) / rel_path
+            if target.exists() and file_sha256(target) == sha256:
+                continue
+            blob = self.blob_path(sha256)
+            if not blob.exists():
+                problems.append(f"{rel_path}: blob {sha256} missing")
+                continue
+            if file_sha256(blob) != sha256:
+                problems.append(f"{rel_path}: blob {sha256} corrupt")
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._link(blob, target)
+        return problems
+
+    @staticmethod
+    def _link(blob: Path, target: Path) -> None:
+        """Atomically replace target with a hardlink to blob (a copy if linking fails)."""
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.blob")
+        try:
+            os.link(blob, tmp)
+        except OSError:
+            shutil.copyfile(blob, tmp)
+        os.replace(tmp, target)
+
+    @staticmethod
+    def _copy(path: Path, blob: Path) -> None:
+        tmp = blob.with_name(f".{blob.name}.{os.getpid()}.tmp")
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, blob)
+
+    def report(self) -> str:
+        """One-line added/shared summary."""
+        return f"{self.added} new, {self.shared} shared with earlier publications"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TRIZEL publication blob store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    mat = sub.add_parser("materialize", help="Recreate a publication's files from the blob store")
+    mat.add_argument("publication_dir", type=Path, help="lab/publication/<claim>/<date>")
+    mat.add_argument("--dest", type=Path, default=None,
+                     help="Write into this directory instead of publication_dir "
+                          "(manifest.json, provenance.json and sha256sum.txt are copied too)")
+    mat.add_argument("--store", type=Path, default=DEFAULT_STORE, help="Blob store root")
+    args = parser.parse_args()
+
+    pub_dir = args.publication_dir
+    with open(pub_dir / "manifest.json", "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    dest = args.dest if args.dest is not None else pub_dir
+
+    dest.mkdir(parents=True, exist_ok=True)
+    store = BlobStore(args.store)
+    problems = store.materialize(manifest.get("files", {}), dest)
+    if dest != pub_dir:
+        for name in sorted(UNSTORED_FILES):
+            if (pub_dir / name).exists():
+                shutil.copyfile(pub_dir / name, dest / name)
+
+    for problem in problems:
+        print(f"ERROR: {problem}", file=sys.stderr)
+    print(f"Materialized {len(manifest.get('files', {})) - len(problems)}/"
+          f"{len(manifest.get('files', {}))} files into {dest}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -35,13 +35,90 @@ Input:
 Output:
   public/observations/{date}.json — complete per-day observation files
   public/summary.json             — multi-day summary with total_valid_records
+  public/summary/index.json       — summary totals plus one pointer per month shard
+  public/summary/{YYYY-MM}.json   — summary rows for one calendar month
   public/latest.json              — latest day artifact
 
+Incremental builds:
+  A build ledger (.build/observations-ledger.json) records, per ingestion
+  manifest, the manifest sha256, the size/mtime of every referenced raw file,
+  the run-date bucket used for classification and the resulting summary row.
+  A day whose inputs are unchanged is not re-classified or re-written; its
+  cached row is reused when summary.json / latest.json are re-aggregated.
+  The run-date bucket is min(run_date, latest requested_day_utc), so a day
+  only goes stale on date rollover while it still has future observations.
+
+Classification core:
+  The state rules and the batch ClassificationEngine live in
+  scripts/observation_classifier.py and are shared with validate_pipeline.py.
+  Multi-day builds index public/observations/ once with os.scandir and
+  classify against that in-memory {relative path: (size, mtime_ns)} map
+  instead of calling exists()/stat() per observation. With --verify the
+  validator runs in the same process and reuses the index (and digest
+  cache), but classifies every day again itself, so it checks each artifact
+  against an independent derivation rather than the builder's own results.
+
+Streaming aggregation:
+  A full build streams summary.json rows to disk as each day is merged and
+  keeps only the newest day's artifact in memory, so memory use does not
+  grow with history. Output is byte-identical to json.dump(..., indent=2).
+
+Sharded summary:
+  Alongside summary.json, the summary is partitioned into per-month shards
+  and a small index holding the totals and one pointer per shard (month,
+  path, day/record counts, first/last day). A client showing recent days
+  fetches the index and one shard instead of the whole history. Shards carry
+  no generated_utc, so a rebuild rewrites only the shards whose rows changed.
+  Rows arrive in date order, so only the current month is held in memory.
+
+Write-if-changed output:
+  All artifacts go through scripts/artifact_writer.py: content is compared
+  by sha256 with the file on disk and, only if it differs, written to a temp
+  file and moved into place with os.replace. Unchanged files keep their mtime.
+  summary.json, summary/index.json and latest.json keep the generated_utc
+  they already record when nothing else in them changed, so a build with
+  no new data leaves them untouched.
+
+Slice builds:
+  --from/--to rebuild only the manifests dated within that range, and
+  --source only the days that carry observations from that source (a day
+  artifact always covers the whole day). The existing summary.json is then
+  patched: rows for the slice are replaced or inserted, rows inside a
+  --from/--to range whose manifest is gone are dropped, and summary.json,
+  the month shards and latest.json are re-emitted from the patched rows.
+  Day artifacts left without a summary row (full or slice build) are
+  deleted.
+  Shards outside the slice are unchanged and therefore not rewritten.
+
+Hash verification:
+  With --verify-hashes a record that would be "ok" is also checked against
+  the sha256 recorded at ingestion; a truncated or swapped raw file is
+  classified "unavailable". Raw files are digested in chunks on a thread
+  pool and the digests are cached in .build/digests.json by (path, size,
+  mtime_ns), so repeat runs only re-hash files that changed. Ledger entries
+  remember whether they were built with verification; switching modes
+  rebuilds the affected days.
+
+Parallel builds:
+  With --jobs N, per-day builds (manifest load, classification, artifact
+  write) are fanned out across N worker processes. Results are merged in
+  manifest order and summary rows are sorted by date, so the output bytes are
+  identical to a serial build.
+
 Usage:
-  python3 scripts/build_observations.py [--date YYYY-MM-DD] [--dry-run]
+  python3 scripts/build_observations.py [--date YYYY-MM-DD] [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+                                       [--source SOURCE_ID] [--full] [--jobs N] [--verify-hashes]
+                                       [--verify] [--dry-run]
 
 Options:
-  --date YYYY-MM-DD  Build a single date only (default: build all)
+  --date YYYY-MM-DD  Build a single date only; summary/latest are not touched
+  --from YYYY-MM-DD  Slice: first date to rebuild (inclusive)
+  --to YYYY-MM-DD    Slice: last date to rebuild (inclusive)
+  --source ID        Slice: rebuild only days with observations from source ID
+  --full             Ignore the build ledger and rebuild every day
+  --jobs N           Build days in N worker processes (default: 1, serial)
+  --verify-hashes    Classify raw files whose sha256 does not match as unavailable
+  --verify           Run validate_pipeline.verify_all in-process after the build
   --dry-run          Print what would be written without writing any files
 
 Exit Codes:
@@ -51,113 +128,265 @@ Exit Codes:
 
 import sys
 import json
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
+# State rules are shared with validate_pipeline.py; classify_observation_status,
+# compute_day_status and VALID_STATUSES remain importable from this module.
+from observation_classifier import (
+    VALID_STATUSES,
+    ClassificationEngine,
+    classify_observation_status,
+    compute_day_status,
+    index_raw_files,
+    parse_date as _parse_date,
+)
+from artifact_writer import ArtifactWriter, CHUNK_SIZE
+from digest_cache import DigestCache, sha256_chunks
+
 BASE_DIR = Path(__file__).parent.parent
 INGESTION_DIR = BASE_DIR / "data" / "ingestion"
 PUBLIC_DIR = BASE_DIR / "public"
 OBSERVATIONS_DIR = PUBLIC_DIR / "observations"
 SUMMARY_JSON = PUBLIC_DIR / "summary.json"
+SUMMARY_DIR = PUBLIC_DIR / "summary"
+SUMMARY_INDEX_JSON = SUMMARY_DIR / "index.json"
 LATEST_JSON = PUBLIC_DIR / "latest.json"
+BUILD_LEDGER = BASE_DIR / ".build" / "observations-ledger.json"
+DIGEST_CACHE = BASE_DIR / ".build" / "digests.json"
 
 PIPELINE_VERSION = "1.0.0"
+LEDGER_VERSION = 1
 
 DRY_RUN = "--dry-run" in sys.argv
+FULL_REBUILD = "--full" in sys.argv
+VERIFY = "--verify" in sys.argv
+VERIFY_HASHES = "--verify-hashes" in sys.argv
+
+# Atomic, write-if-changed output for every public/ artifact of this process
+WRITER = ArtifactWriter(dry_run=DRY_RUN)
+
+# ── I/O Helpers ────────────────────────────────────────────────
 
-# ── State Classification ───────────────────────────────────────
+def write_json(path: Path, data: dict) -> bool:
+    """
+    Write JSON to path atomically, only if its content changed (unless --dry-run).
+    Returns True if the file was (or would be) written.
+    """
+    return WRITER.write_json(path, data, trailing_newline=True, indent=2)
 
-# Priority used to determine dominant day_status from a set of observation statuses.
-# Higher index = higher priority (ok overrides all others).
-_STATE_PRIORITY = {"unavailable": 1, "not_released": 2, "scheduled": 3, "ok": 4}
 
-VALID_STATUSES = frozenset({"ok", "scheduled", "not_released", "unavailable"})
+# Header of an aggregate written by this script: generated_utc is its second member
+_GENERATED_UTC = re.compile(r'\{\s*"pipeline_version": "[^"]*",\s*"generated_utc": "([^"]*)"')
 
 
-def _parse_date(date_str: str):
-    """Parse a YYYY-MM-DD string to datetime.date; return None on failure."""
+def recorded_generated_utc(path: Path):
+    """generated_utc in the header of path, or None if it has none (or is missing)."""
     try:
-        return datetime.strptime(str(date_str)[:10], "%Y-%m-%d").date()
-    except (ValueError, TypeError):
+        with open(path, "r", encoding="utf-8") as f:
+            head = f.read(256)
+    except (OSError, UnicodeDecodeError):
         return None
+    match = _GENERATED_UTC.match(head)
+    return match.group(1) if match else None
 
 
-def classify_observation_status(obs: dict, raw_base_dir: Path, run_date) -> str:
+def stable_generated_utc(path: Path, generated_utc: str, chunks_for) -> str:
     """
-    Classify a single observation record into one of four epistemic states.
+    Timestamp to write path with: the one it already records if the content
+    would otherwise be identical (so the file is left untouched), else
+    generated_utc.
 
     Args:
-        obs: Raw observation record dict (no status field expected)
-        raw_base_dir: Base directory for resolving raw_path
-        run_date: datetime.date representing the current run date
-
-    Returns:
-        One of: 'ok', 'scheduled', 'not_released', 'unavailable'
+        chunks_for: Callable returning path's text chunks for a given timestamp
     """
-    requested_day = _parse_date(obs.get("requested_day_utc", ""))
-    retrieved_utc = obs.get("retrieved_utc", "")
-    raw_path = obs.get("raw_path", "")
+    previous = recorded_generated_utc(path)
+    if previous and previous != generated_utc and WRITER.matches(path, chunks_for(previous)):
+        return previous
+    return generated_utc
 
-    # Unparseable date indicates a data quality issue, not a schedule
-    if requested_day is None:
-        return "unavailable"
 
-    # Future date — retrieval not yet attempted
-    if requested_day > run_date:
-        return "scheduled"
+def write_aggregate_json(path: Path, data: dict) -> bool:
+    """write_json() for an aggregate, keeping its generated_utc if nothing else changed."""
+    def chunks_for(timestamp):
+        return [json.dumps({**data, "generated_utc": timestamp}, indent=2), "\n"]
+    data = {**data, "generated_utc": stable_generated_utc(path, data["generated_utc"], chunks_for)}
+    return write_json(path, data)
 
-    # Past/present date, no retrieval was recorded
-    if not retrieved_utc:
-        return "not_released"
 
-    # Retrieval was recorded — verify raw file exists and is non-empty
-    if not raw_path:
-        return "unavailable"
-    full_path = raw_base_dir / raw_path
-    if not full_path.exists() or full_path.stat().st_size == 0:
-        return "unavailable"
+class JsonArrayStream:
+    """
+    Streaming emitter for a JSON object whose last member is a large array.
+
+    Array elements are serialized as they are produced and spooled to an
+    anonymous temp file, so only one element is held in memory at a time.
+    write() then emits the header members (which may depend on totals
+    accumulated while streaming) followed by the spooled array. The bytes
+    are identical to json.dump({**header, array_key: items}, f, indent=2)
+    followed by a newline.
+    """
+
+    def __init__(self, array_key: str):
+        self.array_key = array_key
+        self.count = 0
+        self._spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def append(self, item) -> None:
+        """Serialize one array element to the spool."""
+        self._spool.write(",\n    " if self.count else "\n    ")
+        self._spool.write(json.dumps(item, indent=2).replace("\n", "\n    "))
+        self.count += 1
+
+    def close(self) -> None:
+        self._spool.close()
+
+    def _chunks(self, header: dict):
+        yield "{"
+        for key, value in header.items():
+            yield f"\n  {json.dumps(key)}: "
+            yield json.dumps(value, indent=2).replace("\n", "\n  ")
+            yield ","
+        yield f"\n  {json.dumps(self.array_key)}: ["
+        if self.count:
+            self._spool.seek(0)
+            yield from iter(lambda: self._spool.read(CHUNK_SIZE), "")
+            yield "\n  "
+        yield "]\n}\n"
+
+    def write(self, path: Path, header: dict) -> bool:
+        """
+        Write header members then the spooled array to path, atomically and
+        only if the content changed (unless --dry-run). A generated_utc
+        header member keeps the value path already records if nothing else
+        changed.
+        """
+        try:
+            if "generated_utc" in header:
+                def chunks_for(timestamp):
+                    return self._chunks({**header, "generated_utc": timestamp})
+                header = {**header, "generated_utc": stable_generated_utc(
+                    path, header["generated_utc"], chunks_for)}
+            return WRITER.write_chunks(path, self._chunks(header))
+        finally:
+            self.close()
 
-    return "ok"
 
+# ── Build Ledger ───────────────────────────────────────────────
 
-def compute_day_status(statuses: list, valid_count: int) -> str:
+def load_ledger() -> dict:
     """
-    Compute the aggregate day_status from a list of observation statuses.
+    Load the build ledger, returning an empty ledger when it is missing,
+    unreadable, or was written by a different pipeline/ledger version.
+    """
+    empty = {"ledger_version": LEDGER_VERSION, "pipeline_version": PIPELINE_VERSION, "days": {}}
+    if FULL_REBUILD or not BUILD_LEDGER.exists():
+        return empty
+    try:
+        with open(BUILD_LEDGER, "r", encoding="utf-8") as f:
+            ledger = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return empty
+    if (ledger.get("ledger_version") != LEDGER_VERSION
+            or ledger.get("pipeline_version") != PIPELINE_VERSION
+            or not isinstance(ledger.get("days"), dict)):
+        return empty
+    return ledger
+
+
+def save_ledger(ledger: dict) -> None:
+    """
+    Persist the build ledger (unless --dry-run).
 
-    Rules (per problem statement):
-      "ok"           if valid_record_count > 0
-      "scheduled"    if all observations are scheduled
-      "not_released" if no valid records, no unavailable records, date not future
-      "unavailable"  if at least one unavailable and no valid records
+    Keys are not sorted: cached rows must keep their member order so that
+    re-aggregated summary.json bytes match a full rebuild.
     """
-    if valid_count > 0:
-        return "ok"
-    if not statuses:
-        return "unavailable"
-    status_set = set(statuses)
-    if status_set == {"scheduled"}:
-        return "scheduled"
-    if "unavailable" in status_set:
-        return "unavailable"
-    return "not_released"
+    if DRY_RUN:
+        return
+    # Separate writer: the ledger is build state, not a published artifact
+    ArtifactWriter().write_json(BUILD_LEDGER, ledger, trailing_newline=True, indent=2)
 
 
-# ── I/O Helpers ────────────────────────────────────────────────
+def _file_signature(path: Path):
+    """Return [size, mtime_ns] for path, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
 
-def write_json(path: Path, data: dict) -> None:
-    """Write JSON to path (unless --dry-run)."""
-    if DRY_RUN:
-        print(f"  [dry-run] Would write: {path}")
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+
+def raw_file_signatures(raw_paths: list, engine: ClassificationEngine) -> dict:
+    """Map each raw_path to its current [size, mtime_ns] (None if missing)."""
+    signatures = {}
+    for raw_path in raw_paths:
+        raw_stat = engine.raw_file_stat(raw_path)
+        signatures[raw_path] = list(raw_stat) if raw_stat is not None else None
+    return signatures
+
+
+def run_date_bucket(latest_requested_day: str, run_date) -> str:
+    """
+    Collapse run_date to the part that can still affect classification.
+
+    Classification only compares requested_day_utc against run_date, so once
+    run_date is on or after the latest requested day the result is stable.
+    """
+    latest = _parse_date(latest_requested_day)
+    if latest is None:
+        return ""
+    return min(run_date, latest).isoformat()
+
+
+def ledger_entry_is_fresh(entry: dict, manifest_sha256: str, engine: ClassificationEngine) -> bool:
+    """Return True if a ledger entry still describes the current inputs and output."""
+    if not entry or entry.get("manifest_sha256") != manifest_sha256:
+        return False
+    if entry.get("verify_hashes", False) != engine.verify_hashes:
+        return False
+    if entry.get("run_date_bucket") != run_date_bucket(entry.get("latest_requested_day", ""),
+                                                       engine.run_date):
+        return False
+    raw_files = entry.get("raw_files", {})
+    if raw_file_signatures(list(raw_files), engine) != raw_files:
+        return False
+    output = entry.get("output", {})
+    return _file_signature(PUBLIC_DIR / output.get("path", "")) == output.get("signature")
+
+
+def make_ledger_entry(raw_manifest: dict, manifest_sha256: str, engine: ClassificationEngine,
+                      row: dict) -> dict:
+    """Build the ledger entry for a freshly written day artifact."""
+    observations = raw_manifest.get("observations", [])
+    # Only observations with a recorded retrieval consult the raw file
+    raw_paths = sorted({
+        obs["raw_path"] for obs in observations
+        if obs.get("raw_path") and obs.get("retrieved_utc")
+    })
+    requested_days = sorted(
+        str(obs.get("requested_day_utc", ""))[:10]
+        for obs in observations if _parse_date(obs.get("requested_day_utc", "")) is not None
+    )
+    latest_requested_day = requested_days[-1] if requested_days else ""
+    return {
+        "manifest_sha256": manifest_sha256,
+        "raw_files": raw_file_signatures(raw_paths, engine),
+        "latest_requested_day": latest_requested_day,
+        "run_date_bucket": run_date_bucket(latest_requested_day, engine.run_date),
+        "verify_hashes": engine.verify_hashes,
+        "output": {
+            "path": row["path"],
+            "signature": _file_signature(PUBLIC_DIR / row["path"]),
+        },
+        "row": row,
+    }
 
 
 # ── Per-Day Builder ────────────────────────────────────────────
 
-def build_day(raw_manifest: dict, raw_base_dir: Path, generated_utc: str, run_date) -> dict:
+def build_day(raw_manifest: dict, engine: ClassificationEngine, generated_utc: str) -> dict:
     """
     Build a complete per-day observation artifact from a raw ingestion manifest.
 
@@ -166,29 +395,24 @@ def build_day(raw_manifest: dict, raw_base_dir: Path, generated_utc: str, run_da
 
     Args:
         raw_manifest: Raw ingestion data for a single day
-        raw_base_dir: Directory for resolving raw file paths
+        engine: Classification engine (raw-file index, run date)
         generated_utc: ISO-8601 UTC timestamp for this build run
-        run_date: datetime.date for state classification
 
     Returns:
         Complete observation dict with all state fields populated
     """
     observations = raw_manifest.get("observations", [])
-    classified = []
-    statuses = []
-    valid_count = 0
+    result = engine.classify_day(observations)
 
-    for obs in observations:
-        # Work on a copy so we never mutate the input
+    # Work on copies so we never mutate the input
+    classified = []
+    for obs, status in zip(observations, result["statuses"]):
         classified_obs = dict(obs)
-        status = classify_observation_status(obs, raw_base_dir, run_date)
         classified_obs["status"] = status
         classified.append(classified_obs)
-        statuses.append(status)
-        if status == "ok":
-            valid_count += 1
 
-    day_status = compute_day_status(statuses, valid_count)
+    valid_count = result["valid_record_count"]
+    day_status = result["day_status"]
 
     return {
         "pipeline_version": raw_manifest.get("pipeline_version", PIPELINE_VERSION),
@@ -201,6 +425,102 @@ def build_day(raw_manifest: dict, raw_base_dir: Path, generated_utc: str, run_da
     }
 
 
+def build_manifest_file(raw_file: Path, entry, engine: ClassificationEngine, generated_utc: str,
+                        source_filter: str = None) -> dict:
+    """
+    Build (or reuse) the day artifact for one ingestion manifest.
+
+    Runs in a worker process under --jobs, so it only returns plain data and
+    leaves printing to the caller.
+
+    Args:
+        raw_file: Path to the ingestion manifest
+        entry: Existing ledger entry for this manifest (or None)
+        engine: Classification engine (raw-file index, run date)
+        generated_utc: ISO-8601 UTC timestamp for this build run
+        source_filter: If given, skip (neither build nor report) a day
+                       without observations from this source_id
+
+    Returns:
+        Dict with keys: name, skipped, rebuilt, written, row, entry, artifact, log, error
+    """
+    result = {"name": raw_file.name, "skipped": False, "rebuilt": False, "written": False,
+              "row": None, "entry": entry, "artifact": None, "log": [], "error": None}
+
+    manifest_bytes = raw_file.read_bytes()
+    manifest_sha256 = sha256_chunks([manifest_bytes])
+
+    if ledger_entry_is_fresh(entry, manifest_sha256, engine):
+        row = entry["row"]
+        if source_filter is not None and source_filter not in row["sources"]:
+            result["skipped"] = True
+            return result
+        result["row"] = row
+        result["log"].append(f"Unchanged: {raw_file.name}  day_status={row['day_status']}  "
+                             f"valid={row['valid_record_count']}  total={row['record_count']}")
+        return result
+
+    try:
+        raw_manifest = json.loads(manifest_bytes.decode("utf-8"))
+    except json.JSONDecodeError as exc:
+        result["error"] = f"JSON parse failure in {raw_file.name}: {exc}"
+        return result
+    if source_filter is not None and not any(
+            obs.get("source_id") == source_filter for obs in raw_manifest.get("observations", [])):
+        result["skipped"] = True
+        return result
+    result["log"].append(f"Building: {raw_file.name}")
+
+    artifact = build_day(raw_manifest, engine, generated_utc)
+    date = artifact["requested_day_utc"]
+    obs_path = OBSERVATIONS_DIR / f"{date}.json"
+
+    result["log"].append(f"  day_status={artifact['day_status']}  "
+                         f"valid={artifact['valid_record_count']}  "
+                         f"total={artifact['record_count']}")
+
+    written = write_json(obs_path, artifact)
+
+    # Collect summary row
+    sources = sorted({obs["source_id"] for obs in artifact["observations"]})
+    row = {
+        "date": date,
+        "record_count": artifact["record_count"],
+        "sources": sources,
+        "path": f"observations/{date}.json",
+        "valid_record_count": artifact["valid_record_count"],
+        "day_status": artifact["day_status"],
+    }
+    result.update(
+        rebuilt=True,
+        written=written,
+        row=row,
+        artifact=artifact,
+        entry=make_ledger_entry(raw_manifest, manifest_sha256, engine, row),
+    )
+    return result
+
+
+# Classification engine for --jobs workers (built once per worker process)
+_worker_engine = None
+
+
+def _init_build_worker(raw_base_dir: Path, run_date, raw_index, verify_hashes: bool) -> None:
+    global _worker_engine
+    _worker_engine = ClassificationEngine(raw_base_dir, run_date, raw_index, scan=False,
+                                          verify_hashes=verify_hashes,
+                                          digest_cache=DigestCache(DIGEST_CACHE, BASE_DIR))
+    # Output digests recorded by the writer travel back with take_new()
+    WRITER.digests = _worker_engine.digest_cache
+
+
+def _build_manifest_file_in_worker(raw_file: Path, entry, generated_utc: str, source_filter) -> dict:
+    result = build_manifest_file(raw_file, entry, _worker_engine, generated_utc, source_filter)
+    # Digests computed in this worker, for the parent to persist
+    result["digests"] = _worker_engine.digest_cache.take_new()
+    return result
+
+
 # ── Summary & Latest Builders ──────────────────────────────────
 
 def build_summary(day_results: list, generated_utc: str) -> dict:
@@ -226,6 +546,195 @@ def build_summary(day_results: list, generated_utc: str) -> dict:
     }
 
 
+def build_summary_shard(month: str, day_rows: list) -> dict:
+    """
+    Build one per-month summary shard (public/summary/{YYYY-MM}.json).
+
+    Shards deliberately carry no generated_utc: their bytes depend only on
+    their rows, so unchanged months are not rewritten.
+
+    Args:
+        month: YYYY-MM
+        day_rows: Summary rows (same shape as summary.json days) for that month
+
+    Returns:
+        Complete shard dict
+    """
+    return {
+        "pipeline_version": PIPELINE_VERSION,
+        "month": month,
+        "day_count": len(day_rows),
+        "record_count": sum(d["record_count"] for d in day_rows),
+        "valid_record_count": sum(d["valid_record_count"] for d in day_rows),
+        "days": day_rows,
+    }
+
+
+def build_summary_shard_pointer(shard: dict) -> dict:
+    """Build the index entry that points at a summary shard."""
+    days = shard["days"]
+    return {
+        "month": shard["month"],
+        "path": f"{SUMMARY_DIR.name}/{shard['month']}.json",
+        "day_count": shard["day_count"],
+        "record_count": shard["record_count"],
+        "valid_record_count": shard["valid_record_count"],
+        "first_day": days[0]["date"] if days else "",
+        "last_day": days[-1]["date"] if days else "",
+    }
+
+
+def build_summary_index(shard_pointers: list, generated_utc: str) -> dict:
+    """
+    Build public/summary/index.json from the shard pointers, oldest first.
+
+    Totals match summary.json; latest_day names the newest summarised day.
+    """
+    return {
+        "pipeline_version": PIPELINE_VERSION,
+        "generated_utc": generated_utc,
+        "total_days": sum(p["day_count"] for p in shard_pointers),
+        "total_records": sum(p["record_count"] for p in shard_pointers),
+        "total_valid_records": sum(p["valid_record_count"] for p in shard_pointers),
+        "latest_day": shard_pointers[-1]["last_day"] if shard_pointers else "",
+        "shards": shard_pointers,
+    }
+
+
+def write_summary_shard(shard: dict) -> bool:
+    """Write one month's shard (if changed)."""
+    return write_json(SUMMARY_DIR / f"{shard['month']}.json", shard)
+
+
+def prune_summary_shards(months: set) -> None:
+    """Delete shard files for months that no longer have any day (through WRITER)."""
+    if not SUMMARY_DIR.exists():
+        return
+    for shard_file in sorted(SUMMARY_DIR.glob("????-??.json")):
+        if shard_file.stem in months:
+            continue
+        if WRITER.delete(shard_file) and not DRY_RUN:
+            print(f"Deleted stale shard: {shard_file.relative_to(PUBLIC_DIR)}")
+
+
+def prune_day_artifacts(day_paths: set) -> None:
+    """Delete day artifacts that no longer have a summary row (through WRITER)."""
+    if not OBSERVATIONS_DIR.exists():
+        return
+    for day_file in sorted(OBSERVATIONS_DIR.glob("*.json")):
+        if day_file.relative_to(PUBLIC_DIR).as_posix() in day_paths:
+            continue
+        if WRITER.delete(day_file) and not DRY_RUN:
+            print(f"Deleted orphaned day artifact: {day_file.relative_to(PUBLIC_DIR)}")
+
+
+class SummaryAggregator:
+    """
+    Streams summary rows, in date order, into summary.json and the month shards.
+
+    Holds the totals, the newest row, the month shards and the day paths
+    summarised; summary.json rows are spooled by a JsonArrayStream. Shards
+    (one small document per month) are only written by write(), after every
+    row was merged, so a build that fails mid-merge leaves summary.json, the
+    shards and summary/index.json as they were.
+    """
+
+    def __init__(self):
+        self.stream = JsonArrayStream("days")
+        self.totals = {"total_days": 0, "total_records": 0, "total_valid_records": 0}
+        self.latest_row = None
+        self.day_paths = set()
+        self._month_rows = []
+        self._shards = []
+
+    def append(self, row: dict) -> None:
+        """Add the next row; its date must sort after every earlier row."""
+        self.stream.append(row)
+        self.totals["total_days"] += 1
+        self.totals["total_records"] += row["record_count"]
+        self.totals["total_valid_records"] += row["valid_record_count"]
+        if self._month_rows and self._month_rows[0]["date"][:7] != row["date"][:7]:
+            self._flush_month()
+        self._month_rows.append(row)
+        self.day_paths.add(row["path"])
+        self.latest_row = row
+
+    def _flush_month(self) -> None:
+        if self._month_rows:
+            month = self._month_rows[0]["date"][:7]
+            self._shards.append(build_summary_shard(month, self._month_rows))
+            self._month_rows = []
+
+    def close(self) -> None:
+        self.stream.close()
+
+    def write(self, generated_utc: str) -> None:
+        """Write summary.json, the last month shard and summary/index.json."""
+        # Summary — same member order as build_summary()
+        print(f"Writing: {SUMMARY_JSON.name}")
+        print(f"  total_valid_records={self.totals['total_valid_records']}")
+        self.stream.write(SUMMARY_JSON, {
+            "pipeline_version": PIPELINE_VERSION,
+            "generated_utc": generated_utc,
+            **self.totals,
+        })
+        print()
+
+        # Summary shards — flush the last month, write every shard, then the index
+        self._flush_month()
+        for shard in self._shards:
+            write_summary_shard(shard)
+        prune_summary_shards({shard["month"] for shard in self._shards})
+        shard_pointers = [build_summary_shard_pointer(shard) for shard in self._shards]
+        summary_index = build_summary_index(shard_pointers, generated_utc)
+        print(f"Writing: {SUMMARY_DIR.name}/{SUMMARY_INDEX_JSON.name}")
+        print(f"  shards={len(shard_pointers)}  latest_day={summary_index['latest_day']}")
+        write_aggregate_json(SUMMARY_INDEX_JSON, summary_index)
+        print()
+
+
+def load_summary_rows() -> list:
+    """
+    Load the rows of the existing summary.json for a slice build to patch.
+
+    Returns:
+        List of summary rows, or None if summary.json is missing or unreadable
+    """
+    try:
+        with open(SUMMARY_JSON, "r", encoding="utf-8") as f:
+            summary = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    rows = summary.get("days")
+    return rows if isinstance(rows, list) else None
+
+
+def patch_summary_rows(existing_rows: list, slice_rows: dict, date_from, date_to, source_filter) -> list:
+    """
+    Merge a slice build's rows into the existing summary rows.
+
+    Args:
+        existing_rows: Rows from the current summary.json
+        slice_rows: {date: row} for every day built (or reused) in the slice
+        date_from, date_to: Slice bounds as YYYY-MM-DD strings (or None)
+        source_filter: Slice source_id (or None)
+
+    Returns:
+        Patched rows sorted by date
+    """
+    rows = {}
+    for row in existing_rows:
+        date = row.get("date", "")
+        in_range = (date_from is None or date >= date_from) and (date_to is None or date <= date_to)
+        # Without --source every manifest in the range was visited, so a
+        # row the slice did not produce belongs to a deleted manifest
+        if in_range and source_filter is None and date not in slice_rows:
+            continue
+        rows[date] = row
+    rows.update(slice_rows)
+    return [rows[date] for date in sorted(rows)]
+
+
 def build_latest(latest_day_artifact: dict, latest_date: str, generated_utc: str) -> dict:
     """
     Build latest.json from the most recent day's artifact.
@@ -253,28 +762,57 @@ def build_latest(latest_day_artifact: dict, latest_date: str, generated_utc: str
 # ── Main Build ─────────────────────────────────────────────────
 
 def parse_args():
-    """Parse CLI arguments; return (date_filter, dry_run)."""
+    """Parse CLI arguments; return (date_filter, jobs, date_from, date_to, source_filter)."""
     date_filter = None
+    jobs = 1
+    date_from = None
+    date_to = None
+    source_filter = None
     args = sys.argv[1:]
     i = 0
     while i < len(args):
-        if args[i] == "--dry-run":
+        if args[i] in ("--dry-run", "--full", "--verify", "--verify-hashes"):
             i += 1
             continue
         if args[i] == "--date" and i + 1 < len(args):
             date_filter = args[i + 1]
             i += 2
             continue
+        if args[i] in ("--from", "--to") and i + 1 < len(args) and _parse_date(args[i + 1]) is not None:
+            if args[i] == "--from":
+                date_from = _parse_date(args[i + 1]).isoformat()
+            else:
+                date_to = _parse_date(args[i + 1]).isoformat()
+            i += 2
+            continue
+        if args[i] == "--source" and i + 1 < len(args):
+            source_filter = args[i + 1]
+            i += 2
+            continue
+        if args[i] == "--jobs" and i + 1 < len(args) and args[i + 1].isdigit() and int(args[i + 1]) > 0:
+            jobs = int(args[i + 1])
+            i += 2
+            continue
         print(f"ERROR: Unknown argument: {args[i]}", file=sys.stderr)
         print(__doc__)
         sys.exit(1)
-    return date_filter, DRY_RUN
+    if date_filter and (date_from or date_to or source_filter):
+        print("ERROR: --date cannot be combined with --from/--to/--source", file=sys.stderr)
+        sys.exit(1)
+    if date_from and date_to and date_from > date_to:
+        print(f"ERROR: --from {date_from} is after --to {date_to}", file=sys.stderr)
+        sys.exit(1)
+    return date_filter, jobs, date_from, date_to, source_filter
 
 
-def build_all(date_filter=None) -> int:
+def build_all(date_filter=None, jobs: int = 1, date_from=None, date_to=None, source_filter=None) -> int:
     """
-    Build all (or one) observation day artifacts from data/ingestion/ manifests.
-    Writes complete state-classified artifacts to public/.
+    Build all (or one, or a slice of) observation day artifacts from
+    data/ingestion/ manifests. Writes complete state-classified artifacts
+    to public/.
+
+    A slice (date_from / date_to / source_filter) patches the existing
+    summary.json rows instead of requiring a full rebuild.
 
     Returns 0 on success, 1 on fatal error.
     """
@@ -289,8 +827,20 @@ def build_all(date_filter=None) -> int:
         if not raw_files:
             print(f"ERROR: No ingestion manifest for date: {date_filter}", file=sys.stderr)
             return 1
+    slice_build = bool(date_from or date_to or source_filter)
+    if date_from or date_to:
+        raw_files = [f for f in raw_files
+                     if (date_from is None or f.stem >= date_from)
+                     and (date_to is None or f.stem <= date_to)]
+    existing_rows = None
+    if slice_build:
+        existing_rows = load_summary_rows()
+        if existing_rows is None:
+            print(f"ERROR: A slice build patches {SUMMARY_JSON.name}, which is missing or "
+                  "unreadable; run a full build first", file=sys.stderr)
+            return 1
 
-    if not raw_files:
+    if not raw_files and not slice_build:
         print("WARNING: No ingestion manifests found in", INGESTION_DIR)
         return 0
 
@@ -300,86 +850,186 @@ def build_all(date_filter=None) -> int:
     generated_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     run_date = datetime.now(timezone.utc).date()
 
+    # One sequential scan of the raw tree instead of a stat() per observation;
+    # a single-date build touches too few files for the scan to pay off
+    engine = ClassificationEngine(raw_base_dir, run_date, scan=len(raw_files) > 1,
+                                  verify_hashes=VERIFY_HASHES,
+                                  digest_cache=DigestCache(DIGEST_CACHE, BASE_DIR))
+    # Existing artifacts are compared by cached digest (size/mtime_ns)
+    WRITER.digests = engine.digest_cache
+
+    ledger = load_ledger()
+    ledger_days = ledger["days"]
+
     print("=" * 72)
     print("TRIZEL Observation Builder")
     print("=" * 72)
     if DRY_RUN:
         print("Mode: DRY-RUN (no files will be written)")
+    if FULL_REBUILD:
+        print("Mode: FULL (build ledger ignored)")
+    if VERIFY_HASHES:
+        print("Mode: VERIFY-HASHES (raw files checked against recorded sha256)")
+    if slice_build:
+        print(f"Mode: SLICE from={date_from or '-'} to={date_to or '-'} "
+              f"source={source_filter or '-'} (patching {SUMMARY_JSON.name})")
     print(f"Run date (UTC): {run_date}")
     print(f"Input:  {INGESTION_DIR}")
     print(f"Output: {PUBLIC_DIR}")
+    print(f"Ledger: {BUILD_LEDGER.relative_to(BASE_DIR)} ({len(ledger_days)} cached day(s))")
+    if jobs > 1:
+        print(f"Workers: {jobs} processes")
     print()
 
-    day_results = []
-    built_artifacts = {}
-
-    for raw_file in raw_files:
-        print(f"Building: {raw_file.name}")
-        try:
-            with open(raw_file, "r", encoding="utf-8") as f:
-                raw_manifest = json.load(f)
-        except json.JSONDecodeError as exc:
-            print(f"  ERROR: JSON parse failure: {exc}", file=sys.stderr)
-            return 1
+    rebuilt = 0
+    skipped = 0
+    # On a full build summary rows are streamed as days are merged; only the
+    # newest day's artifact is kept in memory (for latest.json). A slice
+    # build collects its rows to patch into the existing summary afterwards.
+    aggregator = SummaryAggregator() if date_filter is None and not slice_build else None
+    slice_rows = {}
+    slice_artifacts = {}
+    previous_row = None
+    latest_artifact = None
+
+    tasks = [(raw_file, ledger_days.get(raw_file.name), generated_utc, source_filter)
+             for raw_file in raw_files]
+    pool = None
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_build_worker,
+                                   initargs=(raw_base_dir, run_date, engine.raw_index, VERIFY_HASHES))
+        results = pool.map(_build_manifest_file_in_worker, *zip(*tasks),
+                           chunksize=max(1, len(tasks) // (jobs * 4)))
+    else:
+        results = (build_manifest_file(raw_file, entry, engine, utc, src)
+                   for raw_file, entry, utc, src in tasks)
 
-        artifact = build_day(raw_manifest, raw_base_dir, generated_utc, run_date)
-        date = artifact["requested_day_utc"]
-        obs_path = OBSERVATIONS_DIR / f"{date}.json"
-
-        print(f"  day_status={artifact['day_status']}  "
-              f"valid={artifact['valid_record_count']}  "
-              f"total={artifact['record_count']}")
-
-        write_json(obs_path, artifact)
-        built_artifacts[date] = artifact
-
-        # Collect summary row
-        sources = sorted({obs["source_id"] for obs in artifact["observations"]})
-        day_results.append({
-            "date": date,
-            "record_count": artifact["record_count"],
-            "sources": sources,
-            "path": f"observations/{date}.json",
-            "valid_record_count": artifact["valid_record_count"],
-            "day_status": artifact["day_status"],
-        })
+    merged = False
+    try:
+        # Merge in manifest order so logs and ledger are independent of --jobs
+        for result in results:
+            for line in result["log"]:
+                print(line)
+            if result["error"]:
+                print(f"  ERROR: {result['error']}", file=sys.stderr)
+                return 1
+            if result.get("digests"):
+                engine.digest_cache.update(result["digests"])
+            if result["skipped"]:
+                skipped += 1
+                continue
+            row = result["row"]
+            if previous_row is not None and row["date"] <= previous_row["date"]:
+                print(f"  ERROR: {result['name']} yields day {row['date']}, which does not sort "
+                      f"after {previous_row['date']}; manifest file names must match "
+                      "requested_day_utc", file=sys.stderr)
+                return 1
+            ledger_days[result["name"]] = result["entry"]
+            if aggregator is not None:
+                aggregator.append(row)
+            elif slice_build:
+                slice_rows[row["date"]] = row
+                if result["artifact"] is not None:
+                    slice_artifacts[row["date"]] = result["artifact"]
+            previous_row = row
+            latest_artifact = result["artifact"]
+            if result["rebuilt"]:
+                rebuilt += 1
+                if jobs > 1:
+                    # Written in a worker: account for the write
+                    WRITER.record(PUBLIC_DIR / row["path"], result["written"])
+        merged = True
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if aggregator is not None and not merged:
+            aggregator.close()
 
     print()
+    print(f"Rebuilt {rebuilt} of {len(raw_files) - skipped} day(s); "
+          f"{len(raw_files) - skipped - rebuilt} unchanged")
+    if skipped:
+        print(f"Skipped {skipped} day(s) without source {source_filter}")
+    print()
 
-    # Only update summary/latest when building all dates
-    if date_filter is None:
-        # Summary
-        day_results.sort(key=lambda d: d["date"])
-        summary = build_summary(day_results, generated_utc)
-        print(f"Writing: {SUMMARY_JSON.name}")
-        print(f"  total_valid_records={summary['total_valid_records']}")
-        write_json(SUMMARY_JSON, summary)
-        print()
-
-        # Latest (newest date)
-        latest_date = day_results[-1]["date"]
-        latest_artifact = built_artifacts[latest_date]
+    if slice_build:
+        # Patch the slice into the existing rows and re-emit the aggregates
+        patched_rows = patch_summary_rows(existing_rows, slice_rows, date_from, date_to, source_filter)
+        if not patched_rows:
+            print(f"ERROR: Patched {SUMMARY_JSON.name} would have no days", file=sys.stderr)
+            return 1
+        print(f"Patching: {len(slice_rows)} row(s) into {SUMMARY_JSON.name} "
+              f"({len(patched_rows)} day(s) total)")
+        aggregator = SummaryAggregator()
+        try:
+            for row in patched_rows:
+                aggregator.append(row)
+        except BaseException:
+            aggregator.close()
+            raise
+        latest_artifact = slice_artifacts.get(patched_rows[-1]["date"])
+
+    # Only update summary/latest when building all dates (or patching a slice)
+    if aggregator is not None:
+        aggregator.write(generated_utc)
+        latest_row = aggregator.latest_row
+        # A day whose manifest is gone lost its summary row; drop its
+        # artifact too, so observations/ and summary.json stay consistent
+        prune_day_artifacts(aggregator.day_paths)
+
+        # Latest (newest date) — reload from disk if that day was unchanged
+        latest_date = latest_row["date"]
+        if latest_artifact is None:
+            with open(PUBLIC_DIR / latest_row["path"], "r", encoding="utf-8") as f:
+                latest_artifact = json.load(f)
         latest = build_latest(latest_artifact, latest_date, generated_utc)
         print(f"Writing: {LATEST_JSON.name}")
         print(f"  latest_day={latest['latest_day']}  "
               f"valid_record_count={latest['valid_record_count']}  "
               f"day_status={latest['day_status']}")
-        write_json(LATEST_JSON, latest)
+        latest_stream = JsonArrayStream("observations")
+        for obs in latest.pop("observations"):
+            latest_stream.append(obs)
+        latest_stream.write(LATEST_JSON, latest)
         print()
+
+        # Forget manifests that no longer exist (a slice only saw part of them)
+        if not slice_build:
+            current = {raw_file.name for raw_file in raw_files}
+            for name in set(ledger_days) - current:
+                del ledger_days[name]
     else:
-        print("(Skipped summary.json / latest.json — single-date build)")
+        print("(Skipped summary.json / summary/ / latest.json — single-date build)")
         print()
 
+    save_ledger(ledger)
+    if not DRY_RUN:
+        engine.digest_cache.save()
+    print(f"Digests: {engine.digest_cache.report()}")
+    engine.digest_cache.close()
+
+    print(f"Artifacts: {WRITER.report()}")
+    print()
     print("=" * 72)
     print("✅ BUILD COMPLETE")
     print("=" * 72)
+
+    if VERIFY:
+        if DRY_RUN:
+            print("(Skipped verification — dry-run wrote nothing to verify)")
+            return 0
+        # Same process: the validator reuses this run's raw-file index and
+        # digests; the engine keeps no day results, so it re-derives them
+        from validate_pipeline import verify_all
+        print()
+        return verify_all(engine)
     return 0
 
 
 def main() -> int:
-    date_filter, _ = parse_args()
+    date_filter, jobs, date_from, date_to, source_filter = parse_args()
     try:
-        return build_all(date_filter)
+        return build_all(date_filter, jobs, date_from, date_to, source_filter)
     except KeyboardInterrupt:
         print("\nBuild interrupted.", file=sys.stderr)
         return 1
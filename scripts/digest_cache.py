@@ -0,0 +1,276 @@
+"""
+TRIZEL Digest Cache — Persistent sha256 Cache Keyed by File Signature
+
+The one place sha256 is computed. Callers:
+  scripts/build_observations.py     --verify-hashes raw payload checks, ledger keys
+  scripts/validate_pipeline.py      --verify-hashes raw payload checks
+  scripts/artifact_writer.py        write-if-changed comparisons
+  scripts/sbdb_validation_runner.py network payload hashes
+  lab/publication_engine.py         input checksums, manifest.json, sha256sum.txt,
+                                    figure cache keys
+  lab/generate_phase_e_pages.py     render ledger keys and page digests
+
+All of them share the chunked streaming hasher below. Digests of files on
+disk go through one on-disk cache (.build/digests.json) wherever the
+caller passes a DigestCache (ArtifactWriter(digests=...)); the writer also
+records the digest of every file it writes, so the next run's
+write-if-changed comparison is a stat. In-memory content (serialized
+output, downloaded payloads) is hashed directly with sha256_chunks().
+
+A digest is cached under the file's path together with its size and
+mtime_ns. A lookup whose size/mtime_ns still match returns the cached digest
+without reading the file; anything else is re-hashed in fixed-size chunks.
+digest_many() hashes on a thread pool that is created on first use and
+reused for later batches: hashlib releases the GIL while hashing large
+buffers, so reads and hashing of different files overlap.
+
+Cache file format (.build/digests.json):
+  {"cache_version": 1, "entries": {"<path>": [size, mtime_ns, "<sha256>"]}}
+Paths under the cache root are stored relative to it (POSIX separators).
+
+Usage:
+  cache = DigestCache(BASE_DIR / ".build" / "digests.json", BASE_DIR)
+  digests = cache.digest_many(paths)   # {path: sha256 or None if missing}
+  data, sha256 = cache.read_bytes(path)  # contents and digest, one read
+  with cache.open_hashed(path) as f:     # streaming read, digested as read
+      parse(f)
+  sha256 = f.sha256
+  cache.save()
+"""
+
+import os
+import json
+import hashlib
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+CACHE_VERSION = 1
+
+
+# ── Streaming Hasher ───────────────────────────────────────────
+
+def sha256_chunks(chunks) -> str:
+    """Return the sha256 hex digest of an iterable of bytes chunks."""
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_chunks(stream, chunk_size: int = CHUNK_SIZE):
+    """Yield fixed-size chunks from a binary file-like object until EOF."""
+    return iter(lambda: stream.read(chunk_size), b"")
+
+
+def read_hashed(stream) -> tuple:
+    """
+    Read a binary stream to the end, hashing each chunk as it arrives.
+
+    Returns:
+        (data, sha256) — the full contents and their hex digest
+    """
+    digest = hashlib.sha256()
+    parts = []
+    for chunk in read_chunks(stream):
+        digest.update(chunk)
+        parts.append(chunk)
+    return b"".join(parts), digest.hexdigest()
+
+
+class HashingReader:
+    """Binary reader that digests every byte read through it."""
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._digest = hashlib.sha256()
+        self.sha256 = None
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fp.read(size)
+        self._digest.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    """Return the sha256 hex digest of a file, read in fixed-size chunks."""
+    with open(path, "rb") as f:
+        return sha256_chunks(read_chunks(f))
+
+
+# ── Digest Cache ───────────────────────────────────────────────
+
+
+class DigestCache:
+    """
+    sha256 digests of files, cached by (path, size, mtime_ns).
+
+    Attributes:
+        hashed: Number of files read and hashed by this instance
+        reused: Number of digests served from the cache
+    """
+
+    def __init__(self, path: Path = None, root: Path = None, jobs: int = None):
+        """
+        Args:
+            path: Cache file to load from and save to (None = in-memory only)
+            root: Directory that cache keys are made relative to
+            jobs: Hashing threads for digest_many (None = executor default)
+        """
+        self.path = path
+        self.root = Path(root).resolve() if root is not None else None
+        self.jobs = jobs
+        self.hashed = 0
+        self.reused = 0
+        self._entries = {}
+        self._new = {}
+        self._pool = None
+        if path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        entries = data.get("entries") if data.get("cache_version") == CACHE_VERSION else None
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def _key(self, file_path: Path) -> str:
+        abs_path = Path(os.path.abspath(file_path))
+        if self.root is not None:
+            try:
+                return abs_path.relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+        return abs_path.as_posix()
+
+    def _cached(self, key: str, st):
+        cached = self._entries.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            self.reused += 1
+            return cached[2]
+        return None
+
+    def _store(self, key: str, st, sha256: str) -> None:
+        self.hashed += 1
+        entry = [st.st_size, st.st_mtime_ns, sha256]
+        self._entries[key] = entry
+        self._new[key] = entry
+
+    def digest(self, file_path: Path):
+        """Return the sha256 hex digest of file_path, or None if it does not exist."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        key = self._key(file_path)
+        sha256 = self._cached(key, st)
+        if sha256 is None:
+            try:
+                sha256 = file_sha256(Path(file_path))
+            except OSError:
+                return None
+            self._store(key, st, sha256)
+        return sha256
+
+    def record(self, file_path: Path, sha256: str) -> None:
+        """Cache the digest of a file whose content the caller just wrote."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+        key = self._key(file_path)
+        entry = [st.st_size, st.st_mtime_ns, sha256]
+        self._entries[key] = entry
+        self._new[key] = entry
+
+    def read_bytes(self, file_path: Path) -> tuple:
+        """
+        Read a file whose contents are needed anyway, and digest it in the
+        same pass (the cached digest is used if the file is unchanged).
+
+        Returns:
+            (data, sha256)
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(file_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            key = self._key(file_path)
+            sha256 = self._cached(key, st)
+            if sha256 is not None:
+                return f.read(), sha256
+            data, sha256 = read_hashed(f)
+        self._store(key, st, sha256)
+        return data, sha256
+
+    @contextlib.contextmanager
+    def open_hashed(self, file_path: Path):
+        """
+        Open file_path for a single streaming read that also digests it.
+
+        Yields a HashingReader; whatever the caller leaves unread is read at
+        the end of the block, and reader.sha256 is set (and cached) then.
+        """
+        with open(file_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            reader = HashingReader(f)
+            yield reader
+            for _ in read_chunks(reader):
+                pass
+        reader.sha256 = reader.hexdigest()
+        self._store(self._key(file_path), st, reader.sha256)
+
+    def digest_many(self, file_paths) -> dict:
+        """
+        Digest many files on a thread pool.
+
+        Returns:
+            Dict mapping each given path to its sha256 (None if missing)
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) < 2:
+            return {p: self.digest(p) for p in file_paths}
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.jobs)
+        return dict(zip(file_paths, self._pool.map(self.digest, file_paths)))
+
+    def take_new(self) -> dict:
+        """Return and forget the entries computed since the last call (for worker processes)."""
+        new, self._new = self._new, {}
+        return new
+
+    def update(self, entries: dict) -> None:
+        """Merge entries computed by another instance (e.g. a worker's take_new())."""
+        self._entries.update(entries)
+        self._new.update(entries)
+        self.hashed += len(entries)
+
+    def close(self) -> None:
+        """Shut down the hashing thread pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def report(self) -> str:
+        """One-line hashed/reused summary."""
+        return f"{self.hashed} hashed, {self.reused} reused from cache"
+
+    def save(self) -> None:
+        """Persist the cache (write-if-changed) if any digest was computed."""
+        if self.path is None or not self._new:
+            return
+        # Imported here: artifact_writer itself imports the hasher from this module
+        from artifact_writer import ArtifactWriter
+        ArtifactWriter().write_json(self.path, {"cache_version": CACHE_VERSION,
+                                                "entries": self._entries},
+                                    trailing_newline=True, indent=1, sort_keys=True)
+        self._new = {}
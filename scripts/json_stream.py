@@ -0,0 +1,158 @@
+"""
+TRIZEL JSON Stream — Incremental Parsing of Large JSON Objects
+
+json.load() materialises a whole document. For inputs such as
+data/publish/3i-atlas/source-snapshot.json, whose sbdb_attempts array grows
+without bound, stream_object() walks the top-level object member by member
+and hands each element of selected arrays to a callback as soon as it is
+decoded. Only one element (plus a read buffer) is held at a time; all other
+members are decoded normally and returned.
+
+Values are decoded with json.JSONDecoder.raw_decode over a sliding text
+buffer that is refilled in CHUNK_SIZE reads, so the result for every value
+is exactly what json.load() would produce.
+
+Usage:
+  with open(path, "rb") as f:
+      members = stream_object(f, {"sbdb_attempts": handle_attempt})
+"""
+
+import re
+import json
+import codecs
+
+from digest_cache import CHUNK_SIZE
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that can continue a number ("12" of "1234", "1." of "1.5e3")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*")
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    """Sliding decoded-text window over a binary stream."""
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._decode = codecs.getincrementaldecoder("utf-8-sig")().decode
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = CHUNK_SIZE) -> bool:
+        """Append up to size more bytes of input; False once nothing is left."""
+        if self.eof:
+            return False
+        data = self._fp.read(size)
+        if not data:
+            self.eof = True
+            text = self._decode(b"", final=True)
+        else:
+            text = self._decode(data)
+        # Drop consumed text so the buffer stays bounded
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += text
+        return bool(data) or bool(text)
+
+    def skip_whitespace(self) -> None:
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                return
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of input)."""
+        self.skip_whitespace()
+        return self.buf[self.pos] if self.pos < len(self.buf) else ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buf, self.pos)
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        size = CHUNK_SIZE
+        while True:
+            self.skip_whitespace()
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number at the end of the buffer may continue in the next read;
+            # raw_decode also stops early at a partial fraction or exponent
+            at_end = end == len(self.buf)
+            if (not at_end and isinstance(obj, (int, float))
+                    and _NUMBER_TAIL.match(self.buf, end).end() == len(self.buf)):
+                at_end = True
+            if at_end and self.fill(size):
+                size *= 2
+                continue
+            self.pos = end
+            return obj
+
+
+def _stream_array(reader: _Reader, callback) -> int:
+    count = 0
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return count
+    while True:
+        callback(reader.value())
+        count += 1
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect("]")
+        return count
+
+
+def stream_object(fp, arrays: dict) -> dict:
+    """
+    Parse a JSON object from a binary stream, streaming selected arrays.
+
+    Args:
+        fp: Binary file-like object positioned at the document start; it is
+            read to EOF
+        arrays: {member name: callback(element)} — each element of these
+                top-level array members is passed to the callback in order
+                instead of being collected (a non-array value is returned
+                like any other member)
+
+    Returns:
+        Dict of every top-level member that was not streamed
+
+    Raises:
+        json.JSONDecodeError: If the document is not a valid JSON object
+    """
+    reader = _Reader(fp)
+    members = {}
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            if reader.peek() != '"':
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes",
+                                           reader.buf, reader.pos)
+            key = reader.value()
+            reader.expect(":")
+            if key in arrays and reader.peek() == "[":
+                members.pop(key, None)
+                _stream_array(reader, arrays[key])
+            else:
+                members[key] = reader.value()
+            if reader.peek() == ",":
+                reader.pos += 1
+                continue
+            reader.expect("}")
+            break
+    if reader.peek():
+        raise json.JSONDecodeError("Extra data", reader.buf, reader.pos)
+    return members
@@ -0,0 +1,264 @@
+"""
+TRIZEL Observation Classifier — Shared Classification Core
+
+Single implementation of the epistemic state rules used by both the
+generation script (scripts/build_observations.py) and the enforcement layer
+(scripts/validate_pipeline.py). Neither script carries its own copy of the
+rules any more, so they cannot drift apart.
+
+Epistemic state classification rules:
+  ok           – retrieved_utc is non-empty AND raw file exists AND is non-empty
+  scheduled    – requested_day_utc is in the future (retrieval not yet attempted)
+  not_released – requested_day_utc is not in the future AND retrieved_utc is empty
+  unavailable  – retrieved_utc is present BUT raw file is missing or empty
+                 (or, with hash verification, its sha256 differs from the record)
+
+Day-level aggregation:
+  "ok"           if valid_record_count > 0
+  "scheduled"    if all observations are scheduled
+  "not_released" if no valid records and no unavailable records
+  "unavailable"  if at least one unavailable observation and no valid records
+
+ClassificationEngine works on batches of observations. It holds the raw-file
+index (one os.scandir pass over public/observations/), so a combined "build
+then verify" run in one process scans the raw tree once. Day results are not
+kept: the validator classifies every day again rather than reading back what
+the builder derived, and memory does not grow with the number of days.
+
+Hash verification (opt-in, verify_hashes=True):
+  A record that would be "ok" and carries a sha256 is also checked against
+  the sha256 of its raw file; a truncated or swapped payload is classified
+  "unavailable". The raw files a batch references are digested together on
+  a thread pool through scripts/digest_cache.py, which skips re-reading
+  files whose (size, mtime_ns) did not change since the last run.
+"""
+
+import os
+from pathlib import Path
+from datetime import datetime
+
+from digest_cache import DigestCache
+
+VALID_STATUSES = frozenset({"ok", "scheduled", "not_released", "unavailable"})
+
+
+def parse_date(date_str: str):
+    """Parse a YYYY-MM-DD string to datetime.date; return None on failure."""
+    try:
+        return datetime.strptime(str(date_str)[:10], "%Y-%m-%d").date()
+    except (ValueError, TypeError):
+        return None
+
+
+# ── Raw-File Index ─────────────────────────────────────────────
+
+def index_raw_files(raw_base_dir: Path) -> dict:
+    """
+    Index every file under raw_base_dir in one sequential os.scandir pass.
+
+    Replaces a per-observation exists()+stat() pair with a dict lookup, so
+    classifying a large archive costs one directory walk instead of
+    O(records) random stats.
+
+    Returns:
+        Dict mapping POSIX path relative to raw_base_dir -> (size, mtime_ns)
+    """
+    index = {}
+    pending = [(str(raw_base_dir), "")]
+    while pending:
+        dir_path, prefix = pending.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    rel = prefix + entry.name
+                    try:
+                        if entry.is_dir():
+                            pending.append((entry.path, rel + "/"))
+                        elif entry.is_file():
+                            st = entry.stat()
+                            index[rel] = (st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return index
+
+
+def raw_file_key(raw_path: str) -> str:
+    """Normalise raw_path to the POSIX relative form used as an index key."""
+    return os.path.normpath(raw_path).replace(os.sep, "/")
+
+
+def _is_indexed_key(key: str) -> bool:
+    return not (key.startswith("../") or key == ".." or os.path.isabs(key))
+
+
+def raw_file_stat(raw_path: str, raw_base_dir: Path, raw_index=None):
+    """
+    Return (size, mtime_ns) for raw_path, or None if it does not exist.
+
+    Consults raw_index when given; paths that normalise outside the indexed
+    tree fall back to a direct stat().
+    """
+    if raw_index is not None:
+        key = raw_file_key(raw_path)
+        if _is_indexed_key(key):
+            return raw_index.get(key)
+    try:
+        st = (raw_base_dir / raw_path).stat()
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+# ── State Rules ────────────────────────────────────────────────
+
+def classify_observation_status(obs: dict, raw_base_dir: Path, run_date, raw_index=None,
+                                raw_digests=None) -> str:
+    """
+    Classify a single observation record into one of four epistemic states.
+
+    Args:
+        obs: Observation record dict (any stored status field is ignored)
+        raw_base_dir: Base directory for resolving raw_path
+        run_date: datetime.date representing the current run date
+        raw_index: Optional index from index_raw_files(raw_base_dir)
+        raw_digests: Optional {raw_file_key(raw_path): sha256}; when given,
+                     a record with a sha256 must match its raw file's digest
+
+    Returns:
+        One of: 'ok', 'scheduled', 'not_released', 'unavailable'
+    """
+    requested_day = parse_date(obs.get("requested_day_utc", ""))
+    retrieved_utc = obs.get("retrieved_utc", "")
+    raw_path = obs.get("raw_path", "")
+
+    # Unparseable date indicates a data quality issue, not a schedule
+    if requested_day is None:
+        return "unavailable"
+
+    # Future date — retrieval not yet attempted
+    if requested_day > run_date:
+        return "scheduled"
+
+    # Past/present date, no retrieval was recorded
+    if not retrieved_utc:
+        return "not_released"
+
+    # Retrieval was recorded — verify raw file exists and is non-empty
+    if not raw_path:
+        return "unavailable"
+    raw_stat = raw_file_stat(raw_path, raw_base_dir, raw_index)
+    if raw_stat is None or raw_stat[0] == 0:
+        return "unavailable"
+
+    # Hash verification — the raw bytes must be the ones that were ingested
+    expected_sha256 = obs.get("sha256", "")
+    if raw_digests is not None and expected_sha256:
+        if raw_digests.get(raw_file_key(raw_path)) != str(expected_sha256).lower():
+            return "unavailable"
+
+    return "ok"
+
+
+def compute_day_status(statuses: list, valid_count: int) -> str:
+    """
+    Compute the aggregate day_status from a list of observation statuses.
+
+    Rules:
+      "ok"           if valid_record_count > 0
+      "scheduled"    if all observations are scheduled
+      "not_released" if no valid records, no unavailable records, date not future
+      "unavailable"  if at least one unavailable and no valid records
+    """
+    if valid_count > 0:
+        return "ok"
+    if not statuses:
+        return "unavailable"
+    status_set = set(statuses)
+    if status_set == {"scheduled"}:
+        return "scheduled"
+    if "unavailable" in status_set:
+        return "unavailable"
+    return "not_released"
+
+
+# ── Batch Engine ───────────────────────────────────────────────
+
+class ClassificationEngine:
+    """
+    Batch classifier shared by the builder and the validator.
+
+    Holds one raw-file index, the digest cache and (in hash mode) the raw
+    file digests looked up so far. Day results are returned, not cached, so
+    build_observations.py --verify can hand the validator the builder's
+    engine and every day status is still derived independently.
+    """
+
+    def __init__(self, raw_base_dir: Path, run_date, raw_index=None, scan: bool = True,
+                 verify_hashes: bool = False, digest_cache: DigestCache = None):
+        """
+        Args:
+            raw_base_dir: Base directory for resolving raw_path
+            run_date: datetime.date used for every classification
+            raw_index: Pre-built index; scanned lazily on first use if None
+            scan: If False and no raw_index is given, stat() files directly
+                  (cheaper than a full scan when only a few files are needed)
+            verify_hashes: Also check raw files against the recorded sha256
+            digest_cache: Digest cache to use (in-memory one if None)
+        """
+        self.raw_base_dir = raw_base_dir
+        self.run_date = run_date
+        self._raw_index = raw_index
+        self._scan = scan
+        self.verify_hashes = verify_hashes
+        self.digest_cache = digest_cache if digest_cache is not None else DigestCache()
+        self._raw_digests = {}
+
+    @property
+    def raw_index(self):
+        """The raw-file index, built with one os.scandir pass on first use."""
+        if self._raw_index is None and self._scan:
+            self._raw_index = index_raw_files(self.raw_base_dir)
+        return self._raw_index
+
+    def raw_file_stat(self, raw_path: str):
+        """Return (size, mtime_ns) for raw_path, or None if it does not exist."""
+        return raw_file_stat(raw_path, self.raw_base_dir, self.raw_index)
+
+    def _digests_for(self, observations: list) -> dict:
+        """Digest (on the cache's thread pool) every raw file the batch may verify."""
+        missing = sorted({
+            raw_file_key(obs["raw_path"]) for obs in observations
+            if obs.get("raw_path") and obs.get("retrieved_utc") and obs.get("sha256")
+        } - self._raw_digests.keys())
+        if missing:
+            paths = {key: self.raw_base_dir / key for key in missing}
+            digests = self.digest_cache.digest_many(paths.values())
+            for key, path in paths.items():
+                self._raw_digests[key] = digests[path]
+        return self._raw_digests
+
+    def classify_batch(self, observations: list) -> list:
+        """Classify a batch of observations; returns statuses in input order."""
+        raw_index = self.raw_index
+        raw_digests = self._digests_for(observations) if self.verify_hashes else None
+        return [
+            classify_observation_status(obs, self.raw_base_dir, self.run_date, raw_index, raw_digests)
+            for obs in observations
+        ]
+
+    def classify_day(self, observations: list) -> dict:
+        """
+        Classify one day's observations and aggregate them.
+
+        Returns:
+            Dict with keys: statuses, valid_record_count, day_status
+        """
+        statuses = self.classify_batch(observations)
+        valid_count = sum(1 for status in statuses if status == "ok")
+        return {
+            "statuses": statuses,
+            "valid_record_count": valid_count,
+            "day_status": compute_day_status(statuses, valid_count),
+        }
@@ -20,12 +20,13 @@ Exit Codes:
 import sys
 import os
 import json
-import hashlib
 import urllib.request
 import urllib.error
 from pathlib import Path
 from datetime import datetime, timezone
 
+from digest_cache import read_hashed, sha256_chunks
+
 # Configuration
 BASE_DIR = Path(__file__).parent.parent
 VERIFICATION_DIR = BASE_DIR / "lab" / "publication" / "claim-001" / "verification"
@@ -43,8 +44,8 @@ SBDB_API_BASE = "https://ssd-api.jpl.nasa.gov/sbdb.api"
 
 
 def compute_sha256(content: bytes) -> str:
-    """Compute SHA-256 hash of content."""
-    return hashlib.sha256(content).hexdigest()
+    """Compute SHA-256 hash of content (shared hasher in scripts/digest_cache.py)."""
+    return sha256_chunks([content])
 
 
 def check_network_enabled() -> bool:
@@ -156,7 +157,8 @@ def execute_sbdb_query(designation: str, selector_type: str = "des",
         
         with urllib.request.urlopen(req, timeout=30) as response:
             http_status = response.getcode()
-            body_bytes = response.read()
+            # Hashed chunk by chunk while the body is read
+            body_bytes, body_sha256 = read_hashed(response)
             body_str = body_bytes.decode('utf-8')
             
             result = {
@@ -165,7 +167,7 @@ def execute_sbdb_query(designation: str, selector_type: str = "des",
                 "http_message": "OK",
                 "body": body_str,
                 "size_bytes": len(body_bytes),
-                "hash_sha256": compute_sha256(body_bytes),
+                "hash_sha256": body_sha256,
                 "timestamp_utc": datetime.now(timezone.utc).isoformat()
             }
             
@@ -176,7 +178,7 @@ def execute_sbdb_query(designation: str, selector_type: str = "des",
             return result
     
     except urllib.error.HTTPError as e:
-        body_bytes = e.read()
+        body_bytes, body_sha256 = read_hashed(e)
         body_str = body_bytes.decode('utf-8')
         
         result = {
@@ -185,7 +187,7 @@ def execute_sbdb_query(designation: str, selector_type: str = "des",
             "http_message": e.reason,
             "body": body_str,
             "size_bytes": len(body_bytes),
-            "hash_sha256": compute_sha256(body_bytes),
+            "hash_sha256": body_sha256,
             "timestamp_utc": datetime.now(timezone.utc).isoformat()
         }
         
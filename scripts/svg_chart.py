@@ -0,0 +1,143 @@
+"""
+TRIZEL SVG Chart — Dependency-Free, Byte-Stable Bar Charts
+
+Renders the "bar_chart" plots declared in derived/visual_evidence.json
+(lab/publication_engine.py) as standalone SVG documents using only string
+formatting. The same plot definition always yields the same bytes: element
+order is fixed, coordinates are rounded to two decimals and no timestamps,
+random ids or locale-dependent formatting are emitted, so figure checksums
+in manifest.json stay stable across runs.
+
+Colours are literal values from assets/css/tokens.css (an SVG loaded via
+<img> cannot see the page's CSS custom properties).
+
+Usage:
+  svg = render_bar_chart({"id": "...", "title": "...",
+                          "dimensions": {"width": 800, "height": 400},
+                          "series": [{"label": "Failed", "value": 4}]})
+"""
+
+import math
+from html import escape
+
+# Bumped whenever the rendered bytes change, so cached figures are re-rendered
+RENDERER_VERSION = 1
+
+_FONT = "system-ui, -apple-system, 'Segoe UI', sans-serif"
+_TEXT = "#0f172a"
+_TEXT_MUTED = "#475569"
+_AXIS = "#64748b"
+_GRID = "#e2e8f0"
+_BAR = "#084a8f"
+_BACKGROUND = "#ffffff"
+
+_MARGIN = {"top": 48, "right": 24, "bottom": 64, "left": 64}
+
+
+def _num(value: float) -> str:
+    """Format a coordinate with at most two decimals, without trailing zeros."""
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def _label(value) -> str:
+    """Format a bar value: integers without a decimal point."""
+    if isinstance(value, float) and not value.is_integer():
+        return _num(value)
+    return str(int(value))
+
+
+def nice_step(max_value: float, ticks: int = 5) -> float:
+    """Axis step of 1, 2 or 5 x 10^k giving about `ticks` intervals up to max_value."""
+    if max_value <= 0:
+        return 1
+    raw = max_value / ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            step = factor * magnitude
+            break
+    # Counts are integers; never step below 1 for integer data
+    return max(step, 1) if float(max_value).is_integer() else step
+
+
+def render_bar_chart(plot: dict) -> str:
+    """
+    Render a bar_chart plot definition as an SVG document.
+
+    Args:
+        plot: Plot definition with title, dimensions {width, height} and
+              series [{"label", "value"}] (non-negative numbers), plus the
+              optional id, description and accessibility.alt_text
+
+    Returns:
+        SVG document text (ends with a newline)
+
+    Raises:
+        ValueError: If the series is missing or has a negative value
+    """
+    series = plot.get("series")
+    if not series:
+        raise ValueError(f"Plot {plot.get('id', '')!r} has no series to render")
+    values = [entry["value"] for entry in series]
+    if any(value < 0 for value in values):
+        raise ValueError(f"Plot {plot.get('id', '')!r} has a negative bar value")
+
+    width = plot.get("dimensions", {}).get("width", 800)
+    height = plot.get("dimensions", {}).get("height", 400)
+    left, right = _MARGIN["left"], width - _MARGIN["right"]
+    top, bottom = _MARGIN["top"], height - _MARGIN["bottom"]
+    plot_height = bottom - top
+
+    step = nice_step(max(values))
+    axis_max = max(step * math.ceil(max(values) / step), step)
+
+    def y(value):
+        return bottom - plot_height * value / axis_max
+
+    plot_id = escape(str(plot.get("id", "chart")), quote=True)
+    title = escape(str(plot.get("title", "")))
+    desc = escape(str(plot.get("accessibility", {}).get("alt_text") or plot.get("description", "")))
+
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" role="img" '
+        f'aria-labelledby="{plot_id}-title {plot_id}-desc">',
+        f'  <title id="{plot_id}-title">{title}</title>',
+        f'  <desc id="{plot_id}-desc">{desc}</desc>',
+        f'  <rect width="{width}" height="{height}" fill="{_BACKGROUND}"/>',
+        f'  <g font-family="{escape(_FONT, quote=True)}" font-size="12" fill="{_TEXT_MUTED}">',
+        f'    <text x="{_num(width / 2)}" y="28" text-anchor="middle" font-size="16" '
+        f'font-weight="600" fill="{_TEXT}">{title}</text>',
+    ]
+
+    # Horizontal grid lines and y-axis tick labels
+    tick_count = int(round(axis_max / step))
+    for i in range(tick_count + 1):
+        tick = step * i
+        ty = _num(y(tick))
+        lines.append(f'    <line x1="{left}" y1="{ty}" x2="{right}" y2="{ty}" stroke="{_GRID}"/>')
+        lines.append(f'    <text x="{left - 8}" y="{ty}" text-anchor="end" '
+                     f'dominant-baseline="middle">{_label(tick)}</text>')
+
+    # Bars, value labels and category labels
+    slot = (right - left) / len(series)
+    bar_width = slot * 0.6
+    for i, entry in enumerate(series):
+        x = left + slot * i + (slot - bar_width) / 2
+        center = _num(left + slot * i + slot / 2)
+        bar_top = y(entry["value"])
+        label = escape(str(entry["label"]))
+        lines.append(f'    <rect x="{_num(x)}" y="{_num(bar_top)}" width="{_num(bar_width)}" '
+                     f'height="{_num(bottom - bar_top)}" fill="{_BAR}">'
+                     f'<title>{label}: {_label(entry["value"])}</title></rect>')
+        lines.append(f'    <text x="{center}" y="{_num(bar_top - 6)}" text-anchor="middle" '
+                     f'fill="{_TEXT}">{_label(entry["value"])}</text>')
+        lines.append(f'    <text x="{center}" y="{bottom + 20}" text-anchor="middle">{label}</text>')
+
+    # Axes last, so they are drawn over the grid and bar edges
+    lines.append(f'    <line x1="{left}" y1="{top}" x2="{left}" y2="{bottom}" stroke="{_AXIS}"/>')
+    lines.append(f'    <line x1="{left}" y1="{bottom}" x2="{right}" y2="{bottom}" stroke="{_AXIS}"/>')
+    lines.append("  </g>")
+    lines.append("</svg>")
+    return "\n".join(lines) + "\n"
@@ -26,14 +26,33 @@ Expected per-day artifact fields:
 Expected per-summary fields:
   total_valid_records - sum of valid_record_count across all days
 
-State classification rules (must match build_observations.py):
+Cross-artifact consistency (checked in O(days), no file is read twice):
+  summary.json days  - one row per per-day file, with matching record_count,
+                       valid_record_count, day_status, sources and path
+  summary.json totals - total_days / total_records / total_valid_records equal
+                       the sums over the per-day files
+  latest.json        - latest_day is the newest per-day file and its counts
+                       and day_status match that file
+  summary/index.json - totals and shard pointers agree with the month shards;
+                       shard rows are checked like summary.json rows, and
+                       every per-day file appears in exactly one shard
+
+State classification rules (shared with build_observations.py through
+scripts/observation_classifier.py):
   ok           - retrieved_utc non-empty AND raw file exists AND non-empty
   scheduled    - requested_day_utc is in the future
   not_released - requested_day_utc not in future AND retrieved_utc empty
   unavailable  - retrieved_utc present BUT raw file missing or empty
 
+Hash verification (--verify-hashes):
+  Expected statuses also require each raw file to match the sha256 recorded
+  for it, exactly as build_observations.py --verify-hashes classifies them;
+  run both with the same mode. Digests are looked up in the cache the
+  builder keeps in .build/digests.json and computed on a thread pool for
+  files that changed; the validator never writes the cache.
+
 Usage:
-  python3 scripts/validate_pipeline.py
+  python3 scripts/validate_pipeline.py [--verify-hashes]
 
 Exit Codes:
   0: All artifacts pass verification
@@ -45,63 +64,34 @@ import json
 from pathlib import Path
 from datetime import datetime, timezone
 
+# Same rules as the generator — one shared implementation, never a copy
+from observation_classifier import VALID_STATUSES, ClassificationEngine, compute_day_status
+from digest_cache import DigestCache
+
 BASE_DIR = Path(__file__).parent.parent
 PUBLIC_DIR = BASE_DIR / "public"
 OBSERVATIONS_DIR = PUBLIC_DIR / "observations"
 SUMMARY_JSON = PUBLIC_DIR / "summary.json"
+SUMMARY_DIR = PUBLIC_DIR / "summary"
+SUMMARY_INDEX_JSON = SUMMARY_DIR / "index.json"
 LATEST_JSON = PUBLIC_DIR / "latest.json"
+DIGEST_CACHE = BASE_DIR / ".build" / "digests.json"
 
-VALID_STATUSES = frozenset({"ok", "scheduled", "not_released", "unavailable"})
 
-
-def _parse_date(date_str: str):
-    """Parse a YYYY-MM-DD string to datetime.date; return None on failure."""
-    try:
-        return datetime.strptime(str(date_str)[:10], "%Y-%m-%d").date()
-    except (ValueError, TypeError):
-        return None
-
-
-def _expected_status(obs: dict, raw_base_dir: Path, run_date) -> str:
-    """Compute what the status SHOULD be for an observation."""
-    requested_day = _parse_date(obs.get("requested_day_utc", ""))
-    retrieved_utc = obs.get("retrieved_utc", "")
-    raw_path = obs.get("raw_path", "")
-
-    # Unparseable date indicates a data quality issue, not a schedule
-    if requested_day is None:
-        return "unavailable"
-
-    if requested_day > run_date:
-        return "scheduled"
-    if not retrieved_utc:
-        return "not_released"
-    if not raw_path:
-        return "unavailable"
-    full_path = raw_base_dir / raw_path
-    if not full_path.exists() or full_path.stat().st_size == 0:
-        return "unavailable"
-    return "ok"
-
-
-def _expected_day_status(statuses: list, valid_count: int) -> str:
-    """Compute what day_status SHOULD be."""
-    if valid_count > 0:
-        return "ok"
-    if not statuses:
-        return "unavailable"
-    status_set = set(statuses)
-    if status_set == {"scheduled"}:
-        return "scheduled"
-    if "unavailable" in status_set:
-        return "unavailable"
-    return "not_released"
-
-
-def verify_observation_file(obs_file: Path, raw_base_dir: Path, run_date) -> list:
+def verify_observation_file(obs_file: Path, engine: ClassificationEngine) -> tuple:
     """
     Verify a single observation artifact.
-    Returns a list of error strings (empty list = pass).
+    Expected statuses are derived again by the shared ClassificationEngine
+    (in-process after a build it reuses the raw-file index, not the
+    builder's results).
+
+    The file is read and parsed exactly once; the fields callers need for
+    reporting are returned alongside the errors.
+
+    Returns:
+        (errors, summary) — errors is a list of strings (empty list = pass);
+        summary holds date, record_count, valid_record_count, day_status and
+        sources as stored in the file, or None if it could not be parsed.
     """
     errors = []
 
@@ -109,20 +99,29 @@ def verify_observation_file(obs_file: Path, raw_base_dir: Path, run_date) -> lis
         with open(obs_file, "r", encoding="utf-8") as f:
             data = json.load(f)
     except json.JSONDecodeError as exc:
-        return [f"JSON parse failure: {exc}"]
+        return [f"JSON parse failure: {exc}"], None
+
+    summary = {
+        "date": data.get("requested_day_utc", ""),
+        "record_count": data.get("record_count", 0),
+        "valid_record_count": data.get("valid_record_count"),
+        "day_status": data.get("day_status"),
+        "sources": sorted({obs.get("source_id", "") for obs in data.get("observations", [])}),
+    }
 
     for field in ("valid_record_count", "day_status"):
         if field not in data:
             errors.append(f"Missing required field: '{field}'")
 
     if errors:
-        return errors
+        return errors, summary
 
     observations = data.get("observations", [])
+    expected_statuses = engine.classify_day(observations)["statuses"]
     computed_statuses = []
     computed_valid = 0
 
-    for i, obs in enumerate(observations):
+    for i, (obs, expected) in enumerate(zip(observations, expected_statuses)):
         source = obs.get("source_id", f"obs[{i}]")
 
         if "status" not in obs:
@@ -134,7 +133,6 @@ def verify_observation_file(obs_file: Path, raw_base_dir: Path, run_date) -> lis
             errors.append(f"{source}: Invalid status value: '{stored_status}'")
             continue
 
-        expected = _expected_status(obs, raw_base_dir, run_date)
         if stored_status != expected:
             errors.append(
                 f"{source}: Status mismatch -- stored='{stored_status}' expected='{expected}'. "
@@ -152,7 +150,7 @@ def verify_observation_file(obs_file: Path, raw_base_dir: Path, run_date) -> lis
             "Re-run: python3 scripts/build_observations.py"
         )
 
-    expected_day_st = _expected_day_status(computed_statuses, computed_valid)
+    expected_day_st = compute_day_status(computed_statuses, computed_valid)
     stored_day_st = data.get("day_status", "")
     if stored_day_st != expected_day_st:
         errors.append(
@@ -160,12 +158,149 @@ def verify_observation_file(obs_file: Path, raw_base_dir: Path, run_date) -> lis
             "Re-run: python3 scripts/build_observations.py"
         )
 
+    return errors, summary
+
+
+# Summary-row fields that must agree with the per-day artifact they point at
+_ROW_FIELDS = ("record_count", "valid_record_count", "day_status", "sources", "path")
+
+
+def cross_check_summary(summary: dict, days_by_date: dict) -> list:
+    """
+    Check summary.json rows and totals against the per-day index.
+
+    Args:
+        summary: Parsed summary.json
+        days_by_date: {date: per-day summary} from the per-day verification pass
+
+    Returns:
+        List of error strings (empty list = consistent)
+    """
+    errors = []
+    rows = summary.get("days", [])
+    seen = set()
+
+    for row in rows:
+        date = row.get("date")
+        if date in seen:
+            errors.append(f"Duplicate summary row for day {date}")
+            continue
+        seen.add(date)
+        day = days_by_date.get(date)
+        if day is None:
+            errors.append(f"Summary row for day {date} has no observation file")
+            continue
+        for field in _ROW_FIELDS:
+            if field in row and row[field] != day[field]:
+                errors.append(
+                    f"Stale summary row for day {date}: {field} "
+                    f"stored={row[field]!r} observation file={day[field]!r}"
+                )
+
+    for date in sorted(set(days_by_date) - seen):
+        errors.append(f"Observation file for day {date} is missing from summary.json")
+
+    expected_totals = {
+        "total_days": len(days_by_date),
+        "total_records": sum(d["record_count"] for d in days_by_date.values()),
+        "total_valid_records": sum(d["valid_record_count"] or 0 for d in days_by_date.values()),
+    }
+    for field, expected in expected_totals.items():
+        if field in summary and summary[field] != expected:
+            errors.append(f"{field} mismatch -- stored={summary[field]} computed={expected}")
+
     return errors
 
 
-def verify_all() -> int:
+# Shard-pointer fields that must agree with the shard file they point at
+_POINTER_FIELDS = ("day_count", "record_count", "valid_record_count")
+
+
+def cross_check_summary_shards(index: dict, shards: dict, days_by_date: dict) -> list:
+    """
+    Check summary/index.json and its month shards against the per-day index.
+
+    Args:
+        index: Parsed summary/index.json
+        shards: {month: parsed shard, or None if missing/unreadable}
+        days_by_date: {date: per-day summary} from the per-day verification pass
+
+    Returns:
+        List of error strings (empty list = consistent)
+    """
+    errors = []
+    rows = []
+    for pointer in index.get("shards", []):
+        month = pointer.get("month")
+        shard = shards.get(month)
+        if shard is None:
+            errors.append(f"Summary shard {pointer.get('path')!r} is missing or unreadable")
+            continue
+        shard_rows = shard.get("days", [])
+        computed = {
+            "day_count": len(shard_rows),
+            "record_count": sum(r.get("record_count", 0) for r in shard_rows),
+            "valid_record_count": sum(r.get("valid_record_count") or 0 for r in shard_rows),
+        }
+        for field in _POINTER_FIELDS:
+            if shard.get(field) != computed[field]:
+                errors.append(f"Shard {month}: {field} stored={shard.get(field)!r} "
+                              f"computed={computed[field]!r}")
+            if pointer.get(field) != computed[field]:
+                errors.append(f"Index pointer for shard {month}: {field} "
+                              f"stored={pointer.get(field)!r} computed={computed[field]!r}")
+        for row in shard_rows:
+            if str(row.get("date", ""))[:7] != month:
+                errors.append(f"Shard {month} holds a row for day {row.get('date')}")
+        rows.extend(shard_rows)
+
+    # Rows across all shards must describe the per-day files exactly once,
+    # and the index totals must match — the same rules as summary.json
+    combined = {field: index[field] for field in
+                ("total_days", "total_records", "total_valid_records") if field in index}
+    combined["days"] = rows
+    errors.extend(cross_check_summary(combined, days_by_date))
+    return errors
+
+
+def cross_check_latest(latest: dict, days_by_date: dict) -> list:
+    """
+    Check latest.json against the newest per-day artifact in the index.
+
+    Returns:
+        List of error strings (empty list = consistent)
+    """
+    if not days_by_date:
+        return []
+    errors = []
+    latest_date = max(days_by_date)
+    if latest.get("latest_day") != latest_date:
+        errors.append(
+            f"latest_day mismatch -- stored={latest.get('latest_day')!r} newest day={latest_date!r}"
+        )
+        return errors
+    day = days_by_date[latest_date]
+    if latest.get("redirect") != day["path"]:
+        errors.append(f"redirect mismatch -- stored={latest.get('redirect')!r} expected={day['path']!r}")
+    for field in ("record_count", "valid_record_count", "day_status"):
+        if field in latest and latest[field] != day[field]:
+            errors.append(
+                f"{field} mismatch -- stored={latest[field]!r} observation file={day[field]!r}"
+            )
+    return errors
+
+
+def verify_all(engine: ClassificationEngine = None, verify_hashes: bool = False) -> int:
     """
     Verify all observation artifacts, summary.json, and latest.json.
+
+    Args:
+        engine: Classification engine to use (e.g. the one a build just
+                used, sharing its raw-file index); a fresh one is created
+                if None
+        verify_hashes: For a fresh engine, also verify raw-file sha256s
+                       (a reused engine keeps the mode it was built with)
+
     Returns 0 on success, 1 on any failure.
     """
     if not PUBLIC_DIR.exists():
@@ -175,14 +310,19 @@ def verify_all() -> int:
         print(f"ERROR: observations/ directory not found at {OBSERVATIONS_DIR}", file=sys.stderr)
         return 1
 
-    raw_base_dir = OBSERVATIONS_DIR
-    run_date = datetime.now(timezone.utc).date()
+    if engine is None:
+        engine = ClassificationEngine(OBSERVATIONS_DIR, datetime.now(timezone.utc).date(),
+                                      verify_hashes=verify_hashes,
+                                      digest_cache=DigestCache(DIGEST_CACHE, BASE_DIR))
+    run_date = engine.run_date
 
     print("=" * 72)
     print("TRIZEL Ingestion Pipeline Validator (Enforcement Layer)")
     print("=" * 72)
     print(f"Run date (UTC): {run_date}")
     print(f"Role: READ-ONLY verification -- never writes files")
+    if engine.verify_hashes:
+        print("Mode: VERIFY-HASHES (raw files checked against recorded sha256)")
     print()
 
     obs_files = sorted(OBSERVATIONS_DIR.glob("*.json"))
@@ -191,21 +331,23 @@ def verify_all() -> int:
         return 0
 
     total_errors = 0
+    # Per-day index built from the single parse of each file; the summary and
+    # latest cross-checks below are answered from it without re-reading
+    days_by_date = {}
 
     for obs_file in obs_files:
-        errors = verify_observation_file(obs_file, raw_base_dir, run_date)
+        errors, day = verify_observation_file(obs_file, engine)
+        if day is not None:
+            day["path"] = f"{OBSERVATIONS_DIR.name}/{obs_file.name}"
+            days_by_date[day["date"]] = day
         if errors:
             print(f"FAIL: {obs_file.name}")
             for err in errors:
                 print(f"  x {err}")
             total_errors += len(errors)
         else:
-            with open(obs_file) as f:
-                d = json.load(f)
-            valid = d.get("valid_record_count", 0)
-            total = d.get("record_count", 0)
-            day_st = d.get("day_status", "?")
-            print(f"  OK: {obs_file.name}  day_status={day_st}  valid={valid}/{total}")
+            print(f"  OK: {obs_file.name}  day_status={day['day_status']}  "
+                  f"valid={day['valid_record_count']}/{day['record_count']}")
 
     print()
 
@@ -229,10 +371,45 @@ def verify_all() -> int:
                     print(f"  FAIL: Missing '{field}' for day {day.get('date')}")
                     total_errors += 1
 
+        for err in cross_check_summary(summary, days_by_date):
+            print(f"  FAIL: {err}")
+            total_errors += 1
+
         if total_errors == 0:
             print(f"  OK: total_valid_records={summary.get('total_valid_records', '?')}")
         print()
 
+    if SUMMARY_INDEX_JSON.exists():
+        print(f"Verifying: {SUMMARY_DIR.name}/{SUMMARY_INDEX_JSON.name}")
+        try:
+            with open(SUMMARY_INDEX_JSON, "r", encoding="utf-8") as f:
+                summary_index = json.load(f)
+        except json.JSONDecodeError as exc:
+            print(f"  FAIL: JSON parse failure: {exc}", file=sys.stderr)
+            return 1
+
+        shards = {}
+        for pointer in summary_index.get("shards", []):
+            try:
+                with open(PUBLIC_DIR / pointer.get("path", ""), "r", encoding="utf-8") as f:
+                    shards[pointer.get("month")] = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                shards[pointer.get("month")] = None
+
+        shard_errors = cross_check_summary_shards(summary_index, shards, days_by_date)
+        indexed = {f"{month}.json" for month in shards}
+        for shard_file in sorted(SUMMARY_DIR.glob("????-??.json")):
+            if shard_file.name not in indexed:
+                shard_errors.append(f"Shard {shard_file.name} is not listed in {SUMMARY_INDEX_JSON.name}")
+        for err in shard_errors:
+            print(f"  FAIL: {err}")
+        total_errors += len(shard_errors)
+
+        if not shard_errors:
+            print(f"  OK: shards={len(shards)}  "
+                  f"total_valid_records={summary_index.get('total_valid_records', '?')}")
+        print()
+
     if LATEST_JSON.exists():
         print(f"Verifying: {LATEST_JSON.name}")
         try:
@@ -247,11 +424,19 @@ def verify_all() -> int:
                 print(f"  FAIL: Missing '{field}' in latest.json")
                 total_errors += 1
 
+        for err in cross_check_latest(latest, days_by_date):
+            print(f"  FAIL: {err}")
+            total_errors += 1
+
         if total_errors == 0:
             print(f"  OK: day_status={latest.get('day_status', '?')}  "
                   f"valid_record_count={latest.get('valid_record_count', '?')}")
         print()
 
+    if engine.verify_hashes:
+        print(f"Raw digests: {engine.digest_cache.report()}")
+        print()
+
     print("=" * 72)
     if total_errors > 0:
         print(f"VERIFICATION FAILED -- {total_errors} error(s) found")
@@ -265,14 +450,17 @@ def verify_all() -> int:
 
 
 def main() -> int:
-    if len(sys.argv) > 1:
-        print(f"ERROR: Unexpected arguments: {sys.argv[1:]}", file=sys.stderr)
-        print("       validate_pipeline.py takes no arguments (always read-only)")
+    args = sys.argv[1:]
+    verify_hashes = "--verify-hashes" in args
+    unexpected = [arg for arg in args if arg != "--verify-hashes"]
+    if unexpected:
+        print(f"ERROR: Unexpected arguments: {unexpected}", file=sys.stderr)
+        print("       validate_pipeline.py only takes --verify-hashes (always read-only)")
         print(__doc__)
         return 1
 
     try:
-        return verify_all()
+        return verify_all(verify_hashes=verify_hashes)
     except KeyboardInterrupt:
         print("\nVerification interrupted.", file=sys.stderr)
         return 1
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for the generator tests.
+
+Generator tests work on a scratch copy of the repository (without .git and
+.build/), so the generators run exactly as in CI — `python3 scripts/x.py`
+from the repository root — without touching the working tree. Unit tests
+import the modules from scripts/ and lab/ directly.
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Unit tests import the modules the same way the scripts do
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+sys.path.insert(0, str(REPO_ROOT / "lab"))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Scratch copy of the repository."""
+    root = tmp_path / "repo"
+    shutil.copytree(REPO_ROOT, root, symlinks=True,
+                    ignore=shutil.ignore_patterns(".git", ".build", "node_modules", "__pycache__",
+                                                  ".pytest_cache"))
+    return root
+
+
+def run_script(root: Path, *args, expect: int = 0) -> str:
+    """Run a repository script (or `-c` code) in root; return its stdout."""
+    result = subprocess.run([sys.executable, *map(str, args)], cwd=root,
+                            capture_output=True, text=True)
+    assert result.returncode == expect, result.stdout + result.stderr
+    return result.stdout
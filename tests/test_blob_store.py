@@ -0,0 +1,99 @@
+"""Tests for scripts/blob_store.py."""
+
+import hashlib
+import json
+import os
+
+import pytest
+
+import blob_store
+from blob_store import BlobStore
+from conftest import run_script
+
+
+def publication(tmp_path, name, files):
+    """Write files ({rel_path: bytes}) under tmp_path/name; return (dir, manifest files)."""
+    output_dir = tmp_path / name
+    manifest_files = {}
+    for rel_path, data in files.items():
+        path = output_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        manifest_files[rel_path] = {"sha256": hashlib.sha256(data).hexdigest(), "size_bytes": len(data)}
+    return output_dir, manifest_files
+
+
+@pytest.fixture
+def no_hardlinks(monkeypatch):
+    """Make every os.link fail, as across filesystems."""
+    def link(src, dst):
+        raise OSError("hardlinks not supported")
+    monkeypatch.setattr(blob_store.os, "link", link)
+
+
+def test_identical_files_share_one_blob(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    day1, files1 = publication(tmp_path, "2026-03-01", {"tables/a.json": b"[1]", "derived/s.json": b"{}"})
+    day2, files2 = publication(tmp_path, "2026-03-02", {"tables/a.json": b"[1]", "derived/s.json": b"{2}"})
+
+    store.intern_publication(day1, files1)
+    store.intern_publication(day2, files2)
+    assert (store.added, store.shared) == (3, 1)
+    blob = store.blob_path(files1["tables/a.json"]["sha256"])
+    assert os.path.samefile(day1 / "tables/a.json", blob)
+    assert os.path.samefile(day2 / "tables/a.json", blob)
+    assert os.stat(blob).st_nlink == 3
+
+
+def test_intern_copies_without_hardlinks(tmp_path, no_hardlinks):
+    store = BlobStore(tmp_path / "blobs")
+    day1, files = publication(tmp_path, "2026-03-01", {"tables/a.json": b"[1]"})
+    store.intern_publication(day1, files)
+
+    blob = store.blob_path(files["tables/a.json"]["sha256"])
+    assert blob.read_bytes() == b"[1]"
+    assert not os.path.samefile(day1 / "tables/a.json", blob)
+
+
+@pytest.mark.parametrize("hardlinks", [True, False])
+def test_materialize_recreates_files(tmp_path, request, hardlinks):
+    store = BlobStore(tmp_path / "blobs")
+    day1, files = publication(tmp_path, "2026-03-01", {"tables/a.json": b"[1]", "figures/f.svg": b"<svg/>"})
+    store.intern_publication(day1, files)
+    if not hardlinks:
+        request.getfixturevalue("no_hardlinks")
+
+    dest = tmp_path / "site"
+    assert store.materialize(files, dest) == []
+    for rel_path in files:
+        assert (dest / rel_path).read_bytes() == (day1 / rel_path).read_bytes()
+        linked = os.path.samefile(dest / rel_path, store.blob_path(files[rel_path]["sha256"]))
+        assert linked == hardlinks
+
+
+def test_materialize_reports_missing_and_corrupt_blobs(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    day1, files = publication(tmp_path, "2026-03-01", {"a.json": b"[1]", "b.json": b"[2]"})
+    store.intern_publication(day1, files)
+    store.blob_path(files["a.json"]["sha256"]).unlink()
+    corrupt = store.blob_path(files["b.json"]["sha256"])
+    os.unlink(day1 / "b.json")  # shares the blob's inode
+    corrupt.write_bytes(b"[3]")
+
+    problems = store.materialize(files, tmp_path / "site")
+    assert problems == [f"a.json: blob {files['a.json']['sha256']} missing",
+                        f"b.json: blob {files['b.json']['sha256']} corrupt"]
+
+
+def test_blob_store_publication_materializes_from_cli(repo):
+    run_script(repo, "lab/publication_engine.py", "--blob-store")
+    [output_dir] = sorted(p.parent for p in (repo / "lab" / "publication" / "claim-001").glob("*/manifest.json")
+                          if p.parent.name[0].isdigit())[-1:]
+    manifest = json.loads((output_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["blob_store"]["path"] == "lab/publication/blobs"
+
+    out = run_script(repo, "scripts/blob_store.py", "materialize", output_dir, "--dest", repo / "site")
+    assert f"Materialized {len(manifest['files'])}/{len(manifest['files'])}" in out
+    for rel_path, info in manifest["files"].items():
+        assert hashlib.sha256((repo / "site" / rel_path).read_bytes()).hexdigest() == info["sha256"]
+    assert (repo / "site" / "manifest.json").read_bytes() == (output_dir / "manifest.json").read_bytes()
@@ -0,0 +1,216 @@
+"""Tests for scripts/build_observations.py."""
+
+import hashlib
+import json
+import re
+import shutil
+
+from conftest import run_script
+
+
+def test_build_ledger_skips_unchanged_days(repo):
+    run_script(repo, "scripts/build_observations.py")
+    out = run_script(repo, "scripts/build_observations.py")
+    assert "Rebuilt 0 of 7 day(s); 7 unchanged" in out
+
+    # Same content, different bytes: the manifest sha256 no longer matches
+    manifest_path = repo / "data" / "ingestion" / "2026-03-18.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest_path.write_text(json.dumps(manifest, indent=4), encoding="utf-8")
+    out = run_script(repo, "scripts/build_observations.py")
+    assert "Rebuilt 1 of 7 day(s); 6 unchanged" in out
+
+    out = run_script(repo, "scripts/build_observations.py", "--full")
+    assert "Rebuilt 7 of 7 day(s)" in out
+
+
+def test_build_ledger_rebuilds_edited_day_artifact(repo):
+    run_script(repo, "scripts/build_observations.py")
+    day_path = repo / "public" / "observations" / "2026-03-16.json"
+    built = json.loads(day_path.read_text(encoding="utf-8"))
+    day_path.write_text("{}", encoding="utf-8")
+
+    out = run_script(repo, "scripts/build_observations.py")
+    assert "Rebuilt 1 of 7 day(s); 6 unchanged" in out
+    rebuilt = json.loads(day_path.read_text(encoding="utf-8"))
+    assert {**rebuilt, "generated_utc": None} == {**built, "generated_utc": None}
+
+
+def test_deleted_manifest_drops_its_day_artifact(repo):
+    run_script(repo, "scripts/build_observations.py")
+    day_path = repo / "public" / "observations" / "2026-03-15.json"
+    (repo / "data" / "ingestion" / "2026-03-15.json").unlink()
+
+    out = run_script(repo, "scripts/build_observations.py", "--dry-run")
+    assert "Would delete" in out
+    assert day_path.exists()
+
+    run_script(repo, "scripts/build_observations.py")
+    assert not day_path.exists()
+    run_script(repo, "scripts/validate_pipeline.py")
+
+
+def test_slice_build_drops_day_artifact_of_deleted_manifest(repo):
+    run_script(repo, "scripts/build_observations.py")
+    day_path = repo / "public" / "observations" / "2026-03-17.json"
+    (repo / "data" / "ingestion" / "2026-03-17.json").unlink()
+
+    run_script(repo, "scripts/build_observations.py", "--from", "2026-03-16", "--to", "2026-03-18")
+    assert not day_path.exists()
+    run_script(repo, "scripts/validate_pipeline.py")
+
+
+def test_stale_summary_shard_is_pruned(repo):
+    run_script(repo, "scripts/build_observations.py")
+    stale_path = repo / "public" / "summary" / "2025-12.json"
+    stale_path.write_text("{}", encoding="utf-8")
+
+    out = run_script(repo, "scripts/build_observations.py", "--dry-run")
+    assert stale_path.exists()
+    assert "Would delete" in out
+
+    run_script(repo, "scripts/build_observations.py")
+    assert not stale_path.exists()
+    run_script(repo, "scripts/validate_pipeline.py")
+
+
+def test_build_with_verify_passes(repo):
+    out = run_script(repo, "scripts/build_observations.py", "--verify")
+    assert "VERIFICATION PASSED" in out
+
+
+def retrieve(repo, day, source_id, payload=b"payload"):
+    """Mark day's source_id observation as retrieved and write its raw file."""
+    manifest_path = repo / "data" / "ingestion" / f"{day}.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    [obs] = [o for o in manifest["observations"] if o["source_id"] == source_id]
+    obs["retrieved_utc"] = f"{day}T06:00:00Z"
+    obs["sha256"] = hashlib.sha256(payload).hexdigest()
+    raw_file = repo / "public" / "observations" / obs["raw_path"]
+    raw_file.parent.mkdir(parents=True, exist_ok=True)
+    raw_file.write_bytes(payload)
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return raw_file
+
+
+def summary_rows(repo):
+    summary = json.loads((repo / "public" / "summary.json").read_text(encoding="utf-8"))
+    return {row["date"]: row for row in summary["days"]}
+
+
+def test_slice_build_patches_only_rows_in_range(repo):
+    run_script(repo, "scripts/build_observations.py")
+    before = summary_rows(repo)
+
+    retrieve(repo, "2026-03-17", "MPC")
+    retrieve(repo, "2026-03-20", "MPC")
+    (repo / "data" / "ingestion" / "2026-03-16.json").unlink()
+    run_script(repo, "scripts/build_observations.py", "--from", "2026-03-16", "--to", "2026-03-18")
+    after = summary_rows(repo)
+
+    # Inside the range: replaced, or dropped with its manifest
+    assert after["2026-03-17"]["valid_record_count"] == 1
+    assert after["2026-03-17"]["day_status"] == "ok"
+    assert "2026-03-16" not in after
+    # Outside the range: untouched, although 2026-03-20 changed upstream
+    for day in ("2026-03-15", "2026-03-19", "2026-03-20", "2026-03-21"):
+        assert after[day] == before[day]
+    run_script(repo, "scripts/validate_pipeline.py")
+
+    run_script(repo, "scripts/build_observations.py")
+    assert summary_rows(repo)["2026-03-20"]["valid_record_count"] == 1
+    run_script(repo, "scripts/validate_pipeline.py")
+
+
+def test_source_slice_rebuilds_only_days_with_that_source(repo):
+    run_script(repo, "scripts/build_observations.py")
+    manifest_path = repo / "data" / "ingestion" / "2026-03-19.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["observations"] = [o for o in manifest["observations"] if o["source_id"] != "MPC"]
+    manifest["record_count"] = len(manifest["observations"])
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    out = run_script(repo, "scripts/build_observations.py", "--source", "MPC")
+    assert "Skipped 1 day(s) without source MPC" in out
+    # The day without MPC keeps its row (and is not dropped)
+    assert summary_rows(repo)["2026-03-19"]["record_count"] == 6
+
+
+def day_statuses(repo, day):
+    artifact = json.loads((repo / "public" / "observations" / f"{day}.json").read_text(encoding="utf-8"))
+    return {obs["source_id"]: obs["status"] for obs in artifact["observations"]}
+
+
+def test_verify_hashes_flags_swapped_and_truncated_raw_files(repo):
+    swapped = retrieve(repo, "2026-03-17", "MPC", b"payload-a")
+    truncated = retrieve(repo, "2026-03-17", "NASA_PDS", b"payload-b")
+    retrieve(repo, "2026-03-17", "ESA_NEOCC", b"payload-c")
+    swapped.write_bytes(b"payload-x")
+    truncated.write_bytes(b"payload")
+
+    run_script(repo, "scripts/build_observations.py")
+    statuses = day_statuses(repo, "2026-03-17")
+    assert statuses["MPC"] == statuses["NASA_PDS"] == statuses["ESA_NEOCC"] == "ok"
+
+    out = run_script(repo, "scripts/build_observations.py", "--verify-hashes")
+    assert "Digests: 3 hashed" in out
+    statuses = day_statuses(repo, "2026-03-17")
+    assert statuses["MPC"] == statuses["NASA_PDS"] == "unavailable"
+    assert statuses["ESA_NEOCC"] == "ok"
+    run_script(repo, "scripts/validate_pipeline.py", "--verify-hashes")
+
+    # Unchanged raw files are served from the digest cache
+    out = run_script(repo, "scripts/build_observations.py", "--verify-hashes", "--full")
+    assert "Digests: 0 hashed" in out
+    out = run_script(repo, "scripts/validate_pipeline.py", "--verify-hashes")
+    assert "VERIFICATION PASSED" in out
+
+
+def public_outputs(root):
+    """{path: bytes} of every generated public/ JSON file, generated_utc blanked."""
+    outputs = {}
+    for path in sorted((root / "public").rglob("*.json")):
+        data = re.sub(rb'"generated_utc": "[^"]*"', b'"generated_utc": ""', path.read_bytes())
+        outputs[path.relative_to(root).as_posix()] = data
+    return outputs
+
+
+def test_parallel_build_matches_serial_build(repo, tmp_path):
+    retrieve(repo, "2026-03-16", "MPC")
+    retrieve(repo, "2026-03-19", "NASA_PDS")
+    serial = tmp_path / "serial"
+    shutil.copytree(repo, serial, symlinks=True)
+
+    run_script(serial, "scripts/build_observations.py")
+    out = run_script(repo, "scripts/build_observations.py", "--jobs", "3")
+    assert "Workers: 3 processes" in out
+    assert public_outputs(repo) == public_outputs(serial)
+
+    # Reused ledger rows merge in the same order as rebuilt ones
+    retrieve(repo, "2026-03-20", "MPC")
+    retrieve(serial, "2026-03-20", "MPC")
+    run_script(serial, "scripts/build_observations.py")
+    run_script(repo, "scripts/build_observations.py", "--jobs", "3")
+    assert public_outputs(repo) == public_outputs(serial)
+
+
+def test_unchanged_build_keeps_aggregates_and_their_generated_utc(repo):
+    run_script(repo, "scripts/build_observations.py")
+    aggregates = [repo / "public" / name for name in ("summary.json", "latest.json", "summary/index.json")]
+    before = {path: (path.read_bytes(), path.stat().st_mtime_ns) for path in aggregates}
+
+    out = run_script(repo, "scripts/build_observations.py")
+    assert "Artifacts: 0 written" in out
+    assert {path: (path.read_bytes(), path.stat().st_mtime_ns) for path in aggregates} == before
+    run_script(repo, "scripts/build_observations.py", "--full")
+    assert {path: path.read_bytes() for path in aggregates} == {path: data for path, (data, _) in before.items()}
+
+    # A real change gets this run's timestamp
+    (repo / "public" / "summary.json").write_text(
+        re.sub(r'"generated_utc": "[^"]*"', '"generated_utc": "2000-01-01T00:00:00Z"',
+               (repo / "public" / "summary.json").read_text(encoding="utf-8")), encoding="utf-8")
+    retrieve(repo, "2026-03-21", "MPC")
+    run_script(repo, "scripts/build_observations.py")
+    for path in aggregates:
+        assert b"2000-01-01" not in path.read_bytes()
+        assert path.read_bytes() != before[path][0]
@@ -0,0 +1,137 @@
+"""Tests for lab/generate_phase_e_pages.py."""
+
+import json
+import re
+import shutil
+
+from conftest import run_script
+
+LANGUAGES = ("en", "fr", "de", "ar", "ru", "zh")
+LEDGER = ".build/phase-e-render-ledger.json"
+
+
+def publication_dates(root, claim_id="claim-001"):
+    return sorted(p.parent.name for p in (root / "lab" / "publication" / claim_id).glob("*/manifest.json")
+                  if re.fullmatch(r"\d{4}-\d{2}-\d{2}", p.parent.name))
+
+
+def page_dirs(root):
+    return [root / "phase-e"] + [root / lang / "phase-e" for lang in LANGUAGES]
+
+
+def test_one_page_per_publication_date_in_every_language(repo):
+    run_script(repo, "lab/generate_phase_e_pages.py")
+    dates = publication_dates(repo)
+    assert len(dates) > 1
+
+    for pages in page_dirs(repo):
+        for date in dates:
+            page = (pages / f"claim-001-{date}.html").read_text(encoding="utf-8")
+            assert f"lab/publication/claim-001/{date}" in page
+        assert (pages / "claim-001.html").exists()
+    assert '<html lang="ar" dir="rtl"' in (repo / "ar" / "phase-e" / f"claim-001-{dates[0]}.html").read_text(
+        encoding="utf-8")
+
+
+def test_dated_pages_are_not_overwritten_by_later_dates(repo):
+    run_script(repo, "lab/generate_phase_e_pages.py")
+    first, last = publication_dates(repo)[0], publication_dates(repo)[-1]
+    first_page = (repo / "phase-e" / f"claim-001-{first}.html").read_text(encoding="utf-8")
+    assert f"lab/publication/claim-001/{first}" in first_page
+    assert f"lab/publication/claim-001/{last}" not in first_page
+
+
+def test_landing_page_shows_latest_and_links_every_date(repo):
+    run_script(repo, "lab/generate_phase_e_pages.py")
+    dates = publication_dates(repo)
+    landing = (repo / "phase-e" / "claim-001.html").read_text(encoding="utf-8")
+
+    assert f"This page shows the latest publication ({dates[-1]})" in landing
+    assert f"{len(dates)} publication(s) total" in landing
+    linked = re.findall(r'href="claim-001-(\d{4}-\d{2}-\d{2})\.html"', landing)
+    assert sorted(set(linked)) == dates
+
+    index = (repo / "phase-e" / "index.html").read_text(encoding="utf-8")
+    assert sorted(set(re.findall(r'href="claim-001-(\d{4}-\d{2}-\d{2})\.html"', index))) == dates
+
+
+def page_counts(out):
+    """(rendered, reused) from the generator's "Pages:" report line."""
+    match = re.search(r"Pages: (\d+) rendered, (\d+) reused from render ledger", out)
+    assert match, out
+    return int(match.group(1)), int(match.group(2))
+
+
+def test_unchanged_pages_are_reused(repo):
+    rendered, reused = page_counts(run_script(repo, "lab/generate_phase_e_pages.py"))
+    assert rendered > 0 and reused == 0
+
+    assert page_counts(run_script(repo, "lab/generate_phase_e_pages.py")) == (0, rendered)
+    assert page_counts(run_script(repo, "lab/generate_phase_e_pages.py", "--full")) == (rendered, 0)
+
+
+def test_ledger_invalidated_by_publication_change(repo):
+    total, _ = page_counts(run_script(repo, "lab/generate_phase_e_pages.py"))
+
+    publication = sorted((repo / "lab" / "publication" / "claim-001").glob("*/provenance.json"))[0]
+    provenance = json.loads(publication.read_text(encoding="utf-8"))
+    provenance["execution"]["timestamp_utc"] = "2000-01-01T00:00:00.000000Z"
+    publication.write_text(json.dumps(provenance, indent=2, sort_keys=True), encoding="utf-8")
+
+    rendered, reused = page_counts(run_script(repo, "lab/generate_phase_e_pages.py"))
+    assert 0 < rendered < total
+    assert rendered + reused == total
+
+
+def test_ledger_invalidated_by_edited_output(repo):
+    run_script(repo, "lab/generate_phase_e_pages.py")
+    page = repo / "phase-e" / "index.html"
+    page.write_text(page.read_text(encoding="utf-8") + "<!-- edited -->", encoding="utf-8")
+
+    rendered, _ = page_counts(run_script(repo, "lab/generate_phase_e_pages.py"))
+    assert rendered == 1
+    assert "<!-- edited -->" not in page.read_text(encoding="utf-8")
+
+
+def test_ledger_invalidated_by_generator_change(repo):
+    total, _ = page_counts(run_script(repo, "lab/generate_phase_e_pages.py"))
+    with open(repo / "lab" / "generate_phase_e_pages.py", "a", encoding="utf-8") as f:
+        f.write("\n# generator change\n")
+
+    assert page_counts(run_script(repo, "lab/generate_phase_e_pages.py")) == (total, 0)
+
+
+def test_pages_of_removed_publication_are_pruned(repo):
+    run_script(repo, "lab/generate_phase_e_pages.py")
+    removed = publication_dates(repo)[0]
+    page_name = f"claim-001-{removed}.html"
+    assert all((pages / page_name).exists() for pages in page_dirs(repo))
+    hand_written = repo / "phase-e" / "notes.html"
+    hand_written.write_text("<p>not generated</p>", encoding="utf-8")
+
+    shutil.rmtree(repo / "lab" / "publication" / "claim-001" / removed)
+    out = run_script(repo, "lab/generate_phase_e_pages.py")
+    assert f"Deleted page of removed publication: phase-e/{page_name}" in out
+    assert not any((pages / page_name).exists() for pages in page_dirs(repo))
+    assert hand_written.exists()
+    ledger = json.loads((repo / LEDGER).read_text(encoding="utf-8"))
+    assert not [key for key in ledger["pages"] if key.endswith(page_name)]
+
+    # --full ignores the recorded inputs, not the recorded pages
+    removed = publication_dates(repo)[0]
+    shutil.rmtree(repo / "lab" / "publication" / "claim-001" / removed)
+    run_script(repo, "lab/generate_phase_e_pages.py", "--full")
+    assert not (repo / "phase-e" / f"claim-001-{removed}.html").exists()
+
+
+def test_parallel_rendering_matches_serial(repo, tmp_path):
+    serial = tmp_path / "serial"
+    shutil.copytree(repo, serial, symlinks=True)
+    run_script(serial, "lab/generate_phase_e_pages.py")
+    out = run_script(repo, "lab/generate_phase_e_pages.py", "--jobs", "2")
+    assert "worker processes" in out
+
+    assert (repo / LEDGER).read_bytes() == (serial / LEDGER).read_bytes()
+    for pages, serial_pages in zip(page_dirs(repo), page_dirs(serial)):
+        for page in sorted(serial_pages.glob("*.html")):
+            assert (pages / page.name).read_bytes() == page.read_bytes(), page.name
@@ -0,0 +1,89 @@
+"""Tests for scripts/json_stream.py."""
+
+import io
+import json
+
+import pytest
+
+from json_stream import stream_object
+
+DOCUMENT = {
+    "project": "3I/ATLAS \"interstellar\" ] } [ {",
+    "sbdb_attempts": [
+        {"designation": "3I/ATLAS", "ok": False, "http_status": 400, "score": -1.25e-3},
+        {"designation": "C/2025 N1 — été \U0001f30c", "message": "a\\\"b]},[{", "tags": []},
+        [1, [2, [3]], {"x": {}}],
+        12345678901234567890,
+        None,
+    ],
+    "platforms_registry": {"categories": {"space": ["JWST", "HST"]}},
+    "trailing_number": 1234.5,
+}
+
+
+class Trickle(io.BytesIO):
+    """Returns at most `size` bytes per read, whatever the caller asks for."""
+
+    def __init__(self, data, size):
+        super().__init__(data)
+        self.size = size
+
+    def read(self, n=-1):
+        return super().read(self.size)
+
+
+def stream(data, arrays=("sbdb_attempts",), read_size=None):
+    streamed = {name: [] for name in arrays}
+    fp = io.BytesIO(data) if read_size is None else Trickle(data, read_size)
+    members = stream_object(fp, {name: streamed[name].append for name in arrays})
+    return members, streamed
+
+
+@pytest.mark.parametrize("read_size", [None, 1, 2, 3, 7, 64])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_matches_json_load_at_every_chunk_boundary(read_size, indent):
+    data = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode("utf-8")
+    members, streamed = stream(data, read_size=read_size)
+
+    expected = dict(DOCUMENT)
+    assert streamed["sbdb_attempts"] == expected.pop("sbdb_attempts")
+    assert members == expected
+
+
+def test_utf8_bom_and_escaped_text():
+    data = b"\xef\xbb\xbf" + json.dumps(DOCUMENT).encode("utf-8")
+    members, streamed = stream(data, read_size=1)
+    assert members["project"] == DOCUMENT["project"]
+    assert streamed["sbdb_attempts"][1]["message"] == "a\\\"b]},[{"
+
+
+@pytest.mark.parametrize("text", ['{"sbdb_attempts": []}', '{"sbdb_attempts":[ ]}', "{}", " { } "])
+def test_empty_arrays_and_objects(text):
+    members, streamed = stream(text.encode("utf-8"), read_size=1)
+    assert members == {}
+    assert streamed["sbdb_attempts"] == []
+
+
+def test_non_array_member_is_returned_not_streamed():
+    members, streamed = stream(b'{"sbdb_attempts": null, "other": [1, 2]}')
+    assert members == {"sbdb_attempts": None, "other": [1, 2]}
+    assert streamed["sbdb_attempts"] == []
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "[]",
+    '{"a": 1',
+    '{"a" 1}',
+    "{a: 1}",
+    '{"a": 1,}',
+    '{"sbdb_attempts": [1, 2}',
+    '{"sbdb_attempts": [1 2]}',
+    '{"sbdb_attempts": [1,]}',
+    '{"a": "unterminated}',
+    '{"a": 1} {"b": 2}',
+])
+@pytest.mark.parametrize("read_size", [None, 1])
+def test_malformed_input_raises(text, read_size):
+    with pytest.raises(json.JSONDecodeError):
+        stream(text.encode("utf-8"), read_size=read_size)
@@ -0,0 +1,66 @@
+"""Tests for scripts/observation_classifier.py."""
+
+import hashlib
+from datetime import date
+
+from digest_cache import DigestCache
+from observation_classifier import ClassificationEngine
+
+RUN_DATE = date(2026, 3, 20)
+
+
+def observation(day, retrieved="", raw_path="", sha256=""):
+    return {"requested_day_utc": day, "retrieved_utc": retrieved, "raw_path": raw_path, "sha256": sha256}
+
+
+def test_classify_day_statuses_and_aggregates(tmp_path):
+    (tmp_path / "2026-03-19").mkdir()
+    (tmp_path / "2026-03-19" / "MPC.html").write_text("payload", encoding="utf-8")
+    (tmp_path / "2026-03-19" / "EMPTY.html").write_text("", encoding="utf-8")
+    engine = ClassificationEngine(tmp_path, RUN_DATE)
+
+    result = engine.classify_day([
+        observation("2026-03-19", "2026-03-19T06:00:00Z", "2026-03-19/MPC.html"),
+        observation("2026-03-19", "2026-03-19T06:00:00Z", "2026-03-19/EMPTY.html"),
+        observation("2026-03-19", "2026-03-19T06:00:00Z", "2026-03-19/MISSING.html"),
+        observation("2026-03-19"),
+        observation("2026-03-25"),
+    ])
+    assert result == {
+        "statuses": ["ok", "unavailable", "unavailable", "not_released", "scheduled"],
+        "valid_record_count": 1,
+        "day_status": "ok",
+    }
+
+
+def test_classify_day_is_derived_again_on_every_call(tmp_path):
+    engine = ClassificationEngine(tmp_path, RUN_DATE, scan=False)
+    observations = [observation("2026-03-19", "2026-03-19T06:00:00Z", "2026-03-19/MPC.html")]
+    assert engine.classify_day(observations)["day_status"] == "unavailable"
+
+    (tmp_path / "2026-03-19").mkdir()
+    (tmp_path / "2026-03-19" / "MPC.html").write_text("payload", encoding="utf-8")
+    assert engine.classify_day(observations)["day_status"] == "ok"
+
+
+def test_hash_mode_rejects_same_size_swap_and_reuses_digests(tmp_path):
+    raw_dir = tmp_path / "2026-03-19"
+    raw_dir.mkdir()
+    (raw_dir / "MPC.html").write_bytes(b"payload-x")
+    observations = [observation("2026-03-19", "2026-03-19T06:00:00Z", "2026-03-19/MPC.html",
+                                hashlib.sha256(b"payload-a").hexdigest())]
+
+    assert ClassificationEngine(tmp_path, RUN_DATE).classify_day(observations)["day_status"] == "ok"
+
+    cache = DigestCache(tmp_path / "digests.json", tmp_path)
+    engine = ClassificationEngine(tmp_path, RUN_DATE, verify_hashes=True, digest_cache=cache)
+    assert engine.classify_day(observations)["statuses"] == ["unavailable"]
+    cache.save()
+    cache.close()
+    assert (cache.hashed, cache.reused) == (1, 0)
+
+    reloaded = DigestCache(tmp_path / "digests.json", tmp_path)
+    engine = ClassificationEngine(tmp_path, RUN_DATE, verify_hashes=True, digest_cache=reloaded)
+    assert engine.classify_day(observations)["statuses"] == ["unavailable"]
+    reloaded.close()
+    assert (reloaded.hashed, reloaded.reused) == (0, 1)
@@ -0,0 +1,49 @@
+"""Tests for lab/page_template.py."""
+
+import pytest
+
+from conftest import REPO_ROOT
+from page_template import PageTemplate
+
+TEMPLATE_DIR = REPO_ROOT / "lab" / "templates"
+
+
+def test_slots_are_filled_in_document_order():
+    template = PageTemplate("<html {{ attrs }}><p>{{body}}</p><i>{{  attrs  }}</i></html>")
+    assert template.slots == ["attrs", "body", "attrs"]
+    assert template.render(attrs='lang="fr"', body="x") == '<html lang="fr"><p>x</p><i>lang="fr"</i></html>'
+
+
+def test_values_are_inserted_verbatim_and_not_expanded():
+    template = PageTemplate("<td>{{ cell }}</td>")
+    # Callers escape their values; the template never re-parses them
+    assert template.render(cell="{{ cell }} &amp; <b>") == "<td>{{ cell }} &amp; <b></td>"
+
+
+def test_non_slot_braces_are_static_text():
+    text = "a { color: red } {{ 1x }} {{not-a-slot}} {{ ok }}"
+    template = PageTemplate(text)
+    assert template.slots == ["ok"]
+    assert template.render(ok="!") == "a { color: red } {{ 1x }} {{not-a-slot}} !"
+
+
+def test_missing_slot_value_is_an_error():
+    template = PageTemplate("{{ a }}{{ b }}", name="page.html")
+    with pytest.raises(KeyError, match=r"page.html.*\['b'\]"):
+        template.render(a="1")
+    # Extra values are ignored
+    assert template.render(a="1", b="2", c="3") == "12"
+
+
+def test_digest_tracks_the_template_source():
+    assert PageTemplate("{{ a }}").sha256 == PageTemplate("{{ a }}").sha256
+    assert PageTemplate("{{ a }}").sha256 != PageTemplate("{{ a }} ").sha256
+
+
+def test_phase_e_index_template_slots():
+    template = PageTemplate.load(TEMPLATE_DIR / "phase-e-index.html")
+    assert template.name == "phase-e-index.html"
+    assert sorted(set(template.slots)) == ["compiler_output_rows", "html_attrs"]
+    html = template.render(html_attrs='lang="ar" dir="rtl"', compiler_output_rows="<tr></tr>")
+    assert '<html lang="ar" dir="rtl">' in html
+    assert "{{" not in html
@@ -0,0 +1,164 @@
+"""Tests for lab/publication_engine.py."""
+
+import hashlib
+import json
+import re
+import shutil
+
+import pytest
+
+from conftest import run_script
+
+
+# Run the engine CLI with the given multiprocessing start method
+START_METHOD_RUNNER = """
+import multiprocessing, runpy, sys
+multiprocessing.set_start_method(sys.argv.pop(1), force=True)
+sys.argv = ["lab/publication_engine.py"] + sys.argv[1:]
+runpy.run_path("lab/publication_engine.py", run_name="__main__")
+"""
+
+
+def publication_dirs(root, claim_id):
+    """Dated publication directories of claim_id, oldest first."""
+    return sorted(d for d in (root / "lab" / "publication" / claim_id).iterdir()
+                  if re.fullmatch(r"\d{4}-\d{2}-\d{2}", d.name) and (d / "manifest.json").exists())
+
+
+def latest_publication(root, claim_id):
+    return publication_dirs(root, claim_id)[-1]
+
+
+def assert_checksums_match(output_dir):
+    """sha256sum.txt lists every file in output_dir, with matching digests."""
+    listed = {}
+    for line in (output_dir / "sha256sum.txt").read_text(encoding="utf-8").splitlines():
+        sha256, rel_path = line.split("  ", 1)
+        listed[rel_path] = sha256
+    on_disk = {p.relative_to(output_dir).as_posix() for p in output_dir.rglob("*")
+               if p.is_file() and p.name != "sha256sum.txt"}
+    assert set(listed) == on_disk
+    for rel_path, sha256 in listed.items():
+        assert hashlib.sha256((output_dir / rel_path).read_bytes()).hexdigest() == sha256
+
+
+def test_manifest_and_checksums_cover_every_output(repo):
+    run_script(repo, "lab/publication_engine.py")
+    output_dir = latest_publication(repo, "claim-001")
+    assert_checksums_match(output_dir)
+
+    manifest = json.loads((output_dir / "manifest.json").read_text(encoding="utf-8"))
+    for name, info in manifest["files"].items():
+        data = (output_dir / name).read_bytes()
+        assert info == {"sha256": hashlib.sha256(data).hexdigest(), "size_bytes": len(data)}
+    assert not {"manifest.json", "provenance.json", "sha256sum.txt"} & set(manifest["files"])
+
+
+def test_stale_outputs_are_removed_from_publication(repo):
+    run_script(repo, "lab/publication_engine.py", "--table-format", "columnar")
+    output_dir = latest_publication(repo, "claim-001")
+    assert list((output_dir / "tables").glob("*.columns.json"))
+
+    run_script(repo, "lab/publication_engine.py")
+    assert not list((output_dir / "tables").glob("*.columns.json"))
+    assert_checksums_match(output_dir)
+    manifest = json.loads((output_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert not [name for name in manifest["files"] if name.endswith(".columns.json")]
+
+
+def test_reference_images_are_kept_and_listed(repo):
+    run_script(repo, "lab/publication_engine.py")
+    output_dir = latest_publication(repo, "claim-001")
+    image = output_dir / "reference-images" / "atlas.png"
+    image.write_bytes(b"\x89PNG reference image")
+
+    run_script(repo, "lab/publication_engine.py")
+    assert image.read_bytes() == b"\x89PNG reference image"
+    assert_checksums_match(output_dir)
+    manifest = json.loads((output_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert "reference-images/atlas.png" in manifest["files"]
+
+
+def test_figures_are_identical_with_and_without_figure_cache(repo):
+    run_script(repo, "lab/publication_engine.py")
+    figures_dir = latest_publication(repo, "claim-001") / "figures"
+    rendered = {p.name: p.read_bytes() for p in figures_dir.glob("*.svg")}
+    assert rendered
+
+    out = run_script(repo, "lab/publication_engine.py")
+    assert f"0 rendered, {len(rendered)} reused" in out
+    shutil.rmtree(repo / ".build" / "figures")
+    run_script(repo, "lab/publication_engine.py")
+    assert {p.name: p.read_bytes() for p in figures_dir.glob("*.svg")} == rendered
+
+
+@pytest.mark.parametrize("start_method", ["spawn", "forkserver"])
+def test_batch_workers_stream_shared_spools_under_any_start_method(repo, start_method):
+    out = run_script(repo, "-c", START_METHOD_RUNNER, start_method,
+                     "--claim-id", "claim-001", "--claim-id", "claim-002",
+                     "--jobs", "2", "--table-format", "columnar", "--table-format", "ndjson")
+    assert "BATCH PUBLICATION COMPLETE" in out
+    assert "Compiled: 2/2" in out
+
+    first = latest_publication(repo, "claim-001")
+    second = latest_publication(repo, "claim-002")
+    for output_dir in (first, second):
+        assert_checksums_match(output_dir)
+    # Tables streamed from the shared spools are identical for every claim
+    for table in sorted((first / "tables").iterdir()):
+        assert table.read_bytes() == (second / "tables" / table.name).read_bytes()
+
+
+def test_parallel_batch_matches_serial_batch(repo, tmp_path):
+    serial = tmp_path / "serial"
+    shutil.copytree(repo, serial, symlinks=True)
+    run_script(serial, "lab/publication_engine.py", "--claim-id", "claim-001", "--claim-id", "claim-002")
+    out = run_script(repo, "lab/publication_engine.py", "--claim-id", "claim-001", "--claim-id", "claim-002",
+                     "--jobs", "2")
+    assert "Workers: 2" in out
+    assert out.index("[OK] claim-001") < out.index("[OK] claim-002")
+
+    for claim_id in ("claim-001", "claim-002"):
+        parallel_dir = latest_publication(repo, claim_id)
+        serial_dir = latest_publication(serial, claim_id)
+        assert parallel_dir.name == serial_dir.name
+        for path in sorted(serial_dir.rglob("*")):
+            if path.is_file() and path.name not in ("provenance.json", "sha256sum.txt"):
+                assert (parallel_dir / path.relative_to(serial_dir)).read_bytes() == path.read_bytes()
+
+
+def test_skip_unchanged_records_no_change(repo):
+    run_script(repo, "lab/publication_engine.py", "--skip-unchanged")
+    out = run_script(repo, "lab/publication_engine.py", "--skip-unchanged")
+    assert "PUBLICATION UNCHANGED" in out
+
+    index = json.loads((repo / "lab" / "publication" / "claim-001" / "input-index.json").read_text(encoding="utf-8"))
+    [entry] = index["inputs"].values()
+    assert entry["date"] == latest_publication(repo, "claim-001").name
+
+
+def test_skip_index_is_seeded_from_provenance(repo):
+    run_script(repo, "lab/publication_engine.py")
+    index_path = repo / "lab" / "publication" / "claim-001" / "input-index.json"
+    assert not index_path.exists()
+
+    out = run_script(repo, "lab/publication_engine.py", "--skip-unchanged")
+    assert "PUBLICATION UNCHANGED" in out
+    assert index_path.exists()
+
+
+def test_skip_index_invalidated_by_output_options_and_code(repo):
+    run_script(repo, "lab/publication_engine.py", "--skip-unchanged")
+
+    out = run_script(repo, "lab/publication_engine.py", "--skip-unchanged", "--table-format", "ndjson")
+    assert "PUBLICATION COMPLETE" in out
+
+    with open(repo / "scripts" / "svg_chart.py", "a", encoding="utf-8") as f:
+        f.write("\n# renderer change\n")
+    out = run_script(repo, "lab/publication_engine.py", "--skip-unchanged", "--table-format", "ndjson")
+    assert "PUBLICATION COMPLETE" in out
+
+    out = run_script(repo, "lab/publication_engine.py", "--skip-unchanged", "--table-format", "ndjson")
+    assert "PUBLICATION UNCHANGED" in out
+
+
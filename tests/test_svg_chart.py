@@ -0,0 +1,51 @@
+"""Tests for scripts/svg_chart.py."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from svg_chart import nice_step, render_bar_chart
+
+PLOT = {
+    "id": "sbdb_attempts_status",
+    "title": "SBDB attempts <by status>",
+    "dimensions": {"width": 640, "height": 320},
+    "accessibility": {"alt_text": "Bar chart of attempts & outcomes"},
+    "series": [{"label": "Successful", "value": 0}, {"label": "Failed", "value": 4},
+               {"label": "Retried \"once\"", "value": 2.5}],
+}
+
+
+def test_same_plot_renders_same_bytes():
+    svg = render_bar_chart(PLOT)
+    assert render_bar_chart(PLOT) == svg
+    # Key order of the definition does not matter
+    reordered = {key: PLOT[key] for key in reversed(list(PLOT))}
+    assert render_bar_chart(reordered) == svg
+    assert svg.endswith("</svg>\n")
+
+
+def test_rendered_svg_is_well_formed_and_escaped():
+    root = ET.fromstring(render_bar_chart(PLOT))
+    ns = {"svg": "http://www.w3.org/2000/svg"}
+    assert root.find("svg:title", ns).text == "SBDB attempts <by status>"
+    assert root.find("svg:desc", ns).text == "Bar chart of attempts & outcomes"
+    bars = root.findall(".//svg:rect[svg:title]", ns)
+    assert [bar.find("svg:title", ns).text for bar in bars] == [
+        "Successful: 0", "Failed: 4", "Retried \"once\": 2.5"]
+
+
+def test_changed_value_changes_output():
+    changed = {**PLOT, "series": [{"label": "Successful", "value": 1}] + PLOT["series"][1:]}
+    assert render_bar_chart(changed) != render_bar_chart(PLOT)
+
+
+@pytest.mark.parametrize("series", [[], [{"label": "Failed", "value": -1}]])
+def test_invalid_series_is_rejected(series):
+    with pytest.raises(ValueError):
+        render_bar_chart({**PLOT, "series": series})
+
+
+@pytest.mark.parametrize("max_value, step", [(0, 1), (4, 1), (12, 5), (100, 20), (0.5, 0.1)])
+def test_nice_step(max_value, step):
+    assert nice_step(max_value) == pytest.approx(step)
@@ -0,0 +1,86 @@
+"""Tests for the table formats written by lab/publication_engine.py (TableSpool)."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from conftest import run_script
+from publication_engine import COLUMNAR_FORMAT, SPOOL_BATCH_ROWS, TableSpool
+
+FORMATS = ("columnar", "ndjson")
+
+
+def make_rows(count):
+    return [{
+        "designation": f"C/2025 N{i} — ATLAS",
+        "ok": i % 3 == 0,
+        "http_status": None if i % 5 else 400,
+        "score": i if i % 2 else i / 4,
+        "detail": {"attempt": i, "tags": ["a", "b"]},
+    } for i in range(count)]
+
+
+def read_table(spool, fmt):
+    return "".join(spool.chunks(fmt))
+
+
+def columns_to_rows(document):
+    names = [column["name"] for column in document["columns"]]
+    values = [column["values"] for column in document["columns"]]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+@pytest.mark.parametrize("count", [1, SPOOL_BATCH_ROWS + 7])
+@pytest.mark.parametrize("file_backed", [False, True])
+def test_every_format_round_trips_to_the_rows(tmp_path, count, file_backed):
+    rows = make_rows(count)
+    spool = TableSpool("attempts", FORMATS, str(tmp_path) if file_backed else None)
+    for row in rows:
+        spool.append(row)
+    spool.finish()
+
+    assert read_table(spool, "json") == json.dumps(rows, indent=2)
+    assert [json.loads(line) for line in read_table(spool, "ndjson").splitlines()] == rows
+
+    document = json.loads(read_table(spool, "columnar"))
+    assert document["format"] == COLUMNAR_FORMAT
+    assert document["row_count"] == count
+    assert columns_to_rows(document) == rows
+
+    csv_rows = list(csv.DictReader(io.StringIO(read_table(spool, "csv"))))
+    assert [row["designation"] for row in csv_rows] == [row["designation"] for row in rows]
+
+
+def test_columnar_types_and_nullability():
+    spool = TableSpool.from_rows("attempts", make_rows(10), FORMATS)
+    columns = {c["name"]: c for c in json.loads(read_table(spool, "columnar"))["columns"]}
+    assert (columns["designation"]["type"], columns["designation"]["nullable"]) == ("string", False)
+    assert (columns["ok"]["type"], columns["ok"]["nullable"]) == ("bool", False)
+    assert (columns["http_status"]["type"], columns["http_status"]["nullable"]) == ("int", True)
+    assert columns["score"]["type"] == "float"
+    assert columns["detail"]["type"] == "json"
+
+
+def test_empty_table():
+    spool = TableSpool.from_rows("attempts", [], FORMATS)
+    assert read_table(spool, "json") == "[]"
+    assert read_table(spool, "ndjson") == ""
+    assert json.loads(read_table(spool, "columnar")) == {
+        "format": COLUMNAR_FORMAT, "row_count": 0, "columns": []}
+
+
+def test_published_tables_round_trip_against_json(repo):
+    run_script(repo, "lab/publication_engine.py", "--table-format", "columnar", "--table-format", "ndjson")
+    [tables_dir] = sorted((repo / "lab" / "publication" / "claim-001").glob("*/tables"))[-1:]
+    for json_table in sorted(tables_dir.glob("*.json")):
+        if json_table.name.endswith(".columns.json"):
+            continue
+        rows = json.loads(json_table.read_text(encoding="utf-8"))
+        name = json_table.name[:-len(".json")]
+        ndjson = (tables_dir / f"{name}.ndjson").read_text(encoding="utf-8")
+        assert [json.loads(line) for line in ndjson.splitlines()] == rows
+        document = json.loads((tables_dir / f"{name}.columns.json").read_text(encoding="utf-8"))
+        assert document["row_count"] == len(rows)
+        assert columns_to_rows(document) == rows
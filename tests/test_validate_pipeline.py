@@ -0,0 +1,54 @@
+"""Tests for scripts/validate_pipeline.py."""
+
+import json
+
+from conftest import run_script
+
+
+def test_build_then_validate_passes(repo):
+    run_script(repo, "scripts/build_observations.py")
+    out = run_script(repo, "scripts/validate_pipeline.py")
+    assert "VERIFICATION PASSED" in out
+
+
+def test_summary_row_mismatch_is_reported(repo):
+    run_script(repo, "scripts/build_observations.py")
+    summary_path = repo / "public" / "summary.json"
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    summary["days"][2]["valid_record_count"] += 1
+    summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+
+    out = run_script(repo, "scripts/validate_pipeline.py", expect=1)
+    assert "VERIFICATION PASSED" not in out
+    assert "2026-03-17" in out
+
+
+def test_orphaned_day_artifact_is_reported(repo):
+    run_script(repo, "scripts/build_observations.py")
+    summary_path = repo / "public" / "summary.json"
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    del summary["days"][0]
+    summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+
+    out = run_script(repo, "scripts/validate_pipeline.py", expect=1)
+    assert "2026-03-15 is missing from summary.json" in out
+
+
+def test_summary_shard_mismatch_is_reported(repo):
+    run_script(repo, "scripts/build_observations.py")
+    shard_path = repo / "public" / "summary" / "2026-03.json"
+    shard = json.loads(shard_path.read_text(encoding="utf-8"))
+    shard["days"][0]["record_count"] += 1
+    shard_path.write_text(json.dumps(shard, indent=2), encoding="utf-8")
+
+    out = run_script(repo, "scripts/validate_pipeline.py", expect=1)
+    assert "VERIFICATION PASSED" not in out
+    assert "2026-03" in out
+
+
+def test_missing_summary_shard_is_reported(repo):
+    run_script(repo, "scripts/build_observations.py")
+    (repo / "public" / "summary" / "2026-03.json").unlink()
+
+    out = run_script(repo, "scripts/validate_pipeline.py", expect=1)
+    assert "VERIFICATION PASSED" not in out